@@ -0,0 +1,54 @@
+import os
+import json
+import argparse
+from dotenv import load_dotenv
+
+# before the project imports: utils/locators.py reads SELECTOR_MODE/BRAND when they load
+load_dotenv(override=True)
+
+from pages.login_page import Login
+from pages.category_sweep import CategorySweep, CATEGORIES
+from utils.helpers import find_free_port
+from utils.sharding import add_shard_arguments, shard_filter_from_args
+from utils.idle_profiler import start_idle_profile
+
+BASE_URL = os.getenv("BASE_URL")
+USERNAME = os.getenv("USERNAME")
+PASSWORD = os.getenv("PASSWORD")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Slot, Fishing, Card Game and Instant Win sweeps in parallel")
+    parser.add_argument("--categories", nargs="+", default=CATEGORIES, choices=CATEGORIES)
+    parser.add_argument("--results", default=os.getenv("SWEEP_RESULTS"),
+                        help="write per-category results as JSON to this path (env SWEEP_RESULTS)")
+    add_shard_arguments(parser)
+    args = parser.parse_args()
+    start_idle_profile()   # IDLE_PROFILE=1 → idle time per wait call site at exit
+
+    # Step 1: Start browser and login once
+    cdp_port = find_free_port()
+    login_page = Login(BASE_URL)
+    login_page.Start_Browser(cdp_port=cdp_port)
+    login_page.launch_url()
+    print(f"USERNAME from env: {USERNAME!r}")
+    login_page.login(USERNAME, PASSWORD)
+    login_page.Close_Popupbtnscal()
+
+    # Step 2: Clone the logged-in state into one context per category
+    sweep = CategorySweep(
+        f"http://127.0.0.1:{cdp_port}",
+        login_page.context.storage_state(),
+        BASE_URL,
+        USERNAME,
+        PASSWORD,
+        game_filter=shard_filter_from_args(args),
+    )
+    results = sweep.run(args.categories)
+
+    if args.results:
+        with open(args.results, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"💾 Results saved: {args.results}")
+
+    # Step 3: Close browser
+    login_page.close_Browser()
@@ -0,0 +1,44 @@
+import os
+import json
+import asyncio
+import argparse
+from dotenv import load_dotenv
+
+# before the project imports: utils/locators.py reads SELECTOR_MODE/BRAND when they load
+load_dotenv(override=True)
+
+from pages.async_game_page import AsyncGameClick
+from utils.logger import Logger
+from utils.concurrency import AIMDController
+from utils.idle_profiler import start_idle_profile
+
+BASE_URL = os.getenv("BASE_URL")
+USERNAME = os.getenv("USERNAME")
+PASSWORD = os.getenv("PASSWORD")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Async slot sweep with bounded concurrent game launches")
+    parser.add_argument("--concurrency", type=int, default=int(os.getenv("ASYNC_CONCURRENCY", "4")),
+                        help="max games in flight at once (env ASYNC_CONCURRENCY, default 4)")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="start low and let toast/timeout rates move concurrency up to --concurrency")
+    parser.add_argument("--metrics", default=os.getenv("SWEEP_METRICS"),
+                        help="write concurrency metrics JSON here when --adaptive (env SWEEP_METRICS)")
+    parser.add_argument("--providers", nargs="+", help="only sweep these providers")
+    parser.add_argument("--results", default=os.getenv("SWEEP_RESULTS"),
+                        help="write per-game results as JSON to this path (env SWEEP_RESULTS)")
+    args = parser.parse_args()
+    start_idle_profile()   # IDLE_PROFILE=1 → idle time per wait call site at exit
+
+    print(f"USERNAME from env: {USERNAME!r}")
+    controller = AIMDController(initial=1, maximum=args.concurrency, metrics_path=args.metrics) if args.adaptive else None
+    engine = AsyncGameClick(BASE_URL, USERNAME, PASSWORD, concurrency=args.concurrency, controller=controller)
+    results = asyncio.run(engine.run(args.providers))
+    Logger.log_summary(results, "Async sweep summary")
+    if controller:
+        print(f"📊 Concurrency metrics: {controller.snapshot()}")
+
+    if args.results:
+        with open(args.results, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"💾 Results saved: {args.results}")
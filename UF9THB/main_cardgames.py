@@ -1,19 +1,26 @@
 import os
+import argparse
 from dotenv import load_dotenv
+
+# before the project imports: utils/locators.py reads SELECTOR_MODE/BRAND when they load
+load_dotenv(override=True)
+
 from pages.login_page import Login
 from pages.home_page import HomePage
-from pages.Slot_Providers import SlotProvider
-from pages.Fishing_Provider import FishProvider
 from pages.CardGames_Providers import CardgamesProvider
-from pages.game_page import Game_Click
-
-load_dotenv(override=True)
+from utils.sharding import add_shard_arguments, shard_filter_from_args
+from utils.idle_profiler import start_idle_profile
 
 BASE_URL = os.getenv("BASE_URL")
 USERNAME = os.getenv("USERNAME")
 PASSWORD = os.getenv("PASSWORD")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Card game provider sweep")
+    add_shard_arguments(parser)
+    args = parser.parse_args()
+    start_idle_profile()   # IDLE_PROFILE=1 → idle time per wait call site at exit
+
     # Step 1: Login Page actions
     login_page = Login(BASE_URL)
     login_page.Start_Browser()
@@ -25,13 +32,17 @@ if __name__ == "__main__":
     # Step 2: Home Page actions
     home_page = HomePage()
     home_page.page = login_page.page  # reuse same page
-    home_page.click_Fish()
+    home_page.click_Card()
     home_page.home_slot()
     
     # Step4:- Gameclick close testing
-    CardGames_Providers = CardgamesProvider()
+    CardGames_Providers = CardgamesProvider(BASE_URL)
     CardGames_Providers.page = login_page.page  # reuse same page
+    CardGames_Providers.context = login_page.context
+    CardGames_Providers.username = USERNAME
+    CardGames_Providers.password = PASSWORD
+    CardGames_Providers.game_filter = shard_filter_from_args(args)
     CardGames_Providers.List_Provisers()
     
     # Step 3: Close browser
-    login_page.close_Browser()
\ No newline at end of file
+    login_page.close_Browser()
@@ -0,0 +1,95 @@
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import subprocess
+from dotenv import load_dotenv
+
+# before the project imports: utils/locators.py reads SELECTOR_MODE/BRAND when they load
+load_dotenv(override=True)
+
+from utils.coordinator import LeaseTable, make_server
+from utils.rate_limit import launch_bucket
+from utils.logger import Logger
+
+BASE_URL = os.getenv("BASE_URL")
+USERNAME = os.getenv("USERNAME")
+PASSWORD = os.getenv("PASSWORD")
+
+
+def build_catalog(path):
+    """Log in once, flatten every slot provider into work items and save them."""
+    from pages.parallel_sweep import open_session
+    from pages.Slot_Providers import SlotProvider
+
+    session, game_page = open_session(BASE_URL, USERNAME, PASSWORD)
+    try:
+        slot_providers = SlotProvider(session.page, session.context, baseUrl=BASE_URL,
+                                      username=USERNAME, password=PASSWORD)
+        items = [item._asdict() for item in slot_providers.flatten_catalog()]
+    finally:
+        session.close_Browser()
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(items, f, ensure_ascii=False, indent=2)
+    print(f"💾 Catalog saved: {path} ({len(items)} games)")
+    return items
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hand out game leases to sweep workers on any machine")
+    parser.add_argument("--catalog", default="catalog.json", help="work items as JSON; built from the lobby if missing")
+    parser.add_argument("--rebuild", action="store_true", help="rebuild the catalog even if the file exists")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.getenv("COORDINATOR_PORT", "8765")))
+    parser.add_argument("--lease-seconds", type=int, default=180)
+    parser.add_argument("--local-workers", type=int, default=0,
+                        help="also start this many main_worker.py processes on this machine")
+    parser.add_argument("--results", default=os.getenv("SWEEP_RESULTS"))
+    args = parser.parse_args()
+
+    if args.rebuild or not os.path.exists(args.catalog):
+        items = build_catalog(args.catalog)
+    else:
+        with open(args.catalog, encoding="utf-8") as f:
+            items = json.load(f)
+
+    table = LeaseTable(items, lease_seconds=args.lease_seconds)
+    # LAUNCH_RATE is held here, so it is shared by every worker of the brand
+    server = make_server(table, args.host, args.port, launch_bucket=launch_bucket(BASE_URL))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"📡 Coordinator on http://{args.host}:{args.port} with {len(items)} games")
+
+    local_workers = [
+        subprocess.Popen([sys.executable, "main_worker.py",
+                          "--coordinator", f"http://127.0.0.1:{args.port}",
+                          "--name", f"local-{n}"])
+        for n in range(1, args.local_workers + 1)
+    ]
+
+    try:
+        while not table.finished():
+            time.sleep(30)
+            print(f"📊 {table.status()}")
+            if local_workers and all(p.poll() is not None for p in local_workers) and not table.finished():
+                print("⚠ All local workers exited; waiting for remote workers")
+                local_workers = []
+    except KeyboardInterrupt:
+        print("⚠ Stopped by user, saving partial results")
+    finally:
+        # keep serving until local workers have picked up their "done" reply
+        for proc in local_workers:
+            try:
+                proc.wait(timeout=60)
+            except subprocess.TimeoutExpired:
+                proc.terminate()
+        server.shutdown()
+
+    results = table.all_results()
+    Logger.log_summary(results, "Coordinator summary")
+    if args.results:
+        with open(args.results, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"💾 Results saved: {args.results}")
@@ -0,0 +1,95 @@
+import os
+import json
+import argparse
+from dotenv import load_dotenv
+
+# before the project imports: utils/locators.py reads SELECTOR_MODE/BRAND when they load
+load_dotenv(override=True)
+
+from pages.login_page import Login
+from pages.home_page import HomePage
+from pages.parallel_sweep import ParallelSweep
+from utils.lobby import PLAY_BTN, read_lobby
+from utils.waits import wait_for_launch_outcome, FINAL_SIGNALS, LaunchOutcome, GAME_IFRAME
+from utils.game_ready import wait_for_game_ready
+from utils.exit_strategies import GameExit, STRATEGIES
+from utils.launch_timeouts import percentile
+
+BASE_URL = os.getenv("BASE_URL")
+USERNAME = os.getenv("USERNAME")
+PASSWORD = os.getenv("PASSWORD")
+
+
+def restore_lobby(page, lobby_url, provider_name):
+    """Put the lobby back after a strategy left it broken, so the next sample starts clean."""
+    if GameExit(page, lobby_url).exit(("ui_close", "go_back")).intact:
+        return
+    page.goto(lobby_url, wait_until="domcontentloaded", timeout=60000)
+    home_page = HomePage()
+    home_page.page = page
+    home_page.click_Slot()
+    ParallelSweep.open_provider(page, provider_name)
+
+
+def summarize(samples):
+    print("===== Exit strategy benchmark =====")
+    for strategy in dict.fromkeys(s["strategy"] for s in samples):
+        rows = [s for s in samples if s["strategy"] == strategy]
+        latencies = [s["latency_ms"] for s in rows]
+        intact = sum(s["intact"] for s in rows)
+        reloaded = sum(s["reloaded"] for s in rows)
+        print(f"{strategy}: n={len(rows)} median={percentile(latencies, 50)} ms p95={percentile(latencies, 95)} ms "
+              f"lobby intact {intact}/{len(rows)}, full reload {reloaded}/{len(rows)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare game exit strategies on real games")
+    parser.add_argument("--provider", help="provider to take games from (default: the first one)")
+    parser.add_argument("--games", type=int, default=3, help="games launched per strategy (default 3)")
+    parser.add_argument("--strategies", nargs="+", default=list(STRATEGIES), choices=STRATEGIES)
+    parser.add_argument("--results", help="write every sample as JSON to this path")
+    args = parser.parse_args()
+
+    login_page = Login(BASE_URL)
+    login_page.Start_Browser()
+    login_page.launch_url()
+    login_page.login(USERNAME, PASSWORD)
+    login_page.Close_Popupbtnscal()
+
+    home_page = HomePage()
+    home_page.page = login_page.page
+    home_page.click_Slot()
+    home_page.home_slot()
+
+    page = login_page.page
+    provider_name = args.provider or read_lobby(page).providers[1]
+    ParallelSweep.open_provider(page, provider_name)
+
+    samples = []
+    try:
+        for strategy in args.strategies:
+            for index in range(args.games):
+                lobby_url = page.url
+                page.locator(PLAY_BTN).nth(index).click(timeout=15000)
+                launch = wait_for_launch_outcome(page, 60000, signals=FINAL_SIGNALS)
+                if launch.outcome is not LaunchOutcome.CLOSE_BUTTON:
+                    print(f"⚠ Game {index + 1} did not open ({launch.outcome.value}), skipped")
+                    restore_lobby(page, lobby_url, provider_name)
+                    continue
+                wait_for_game_ready(page, GAME_IFRAME, max_wait_s=10)
+
+                result = GameExit(page, lobby_url).run(strategy)
+                print(f"⏱ {strategy}: {result.latency_ms} ms, lobby {'intact' if result.intact else 'BROKEN'}"
+                      f"{', reloaded' if result.reloaded else ''}")
+                samples.append({"strategy": strategy, "game": index + 1, "latency_ms": result.latency_ms,
+                                "intact": result.intact, "reloaded": result.reloaded})
+                if not result.intact:
+                    restore_lobby(page, lobby_url, provider_name)
+    finally:
+        if samples:
+            summarize(samples)
+        if args.results:
+            with open(args.results, "w", encoding="utf-8") as f:
+                json.dump(samples, f, indent=2)
+            print(f"💾 Results saved: {args.results}")
+        login_page.close_Browser()
@@ -1,18 +1,26 @@
 import os
+import argparse
 from dotenv import load_dotenv
+
+# before the project imports: utils/locators.py reads SELECTOR_MODE/BRAND when they load
+load_dotenv(override=True)
+
 from pages.login_page import Login
 from pages.home_page import HomePage
-from pages.Slot_Providers import SlotProvider
 from pages.Fishing_Provider import FishProvider
-from pages.game_page import Game_Click
-
-load_dotenv(override=True)
+from utils.sharding import add_shard_arguments, shard_filter_from_args
+from utils.idle_profiler import start_idle_profile
 
 BASE_URL = os.getenv("BASE_URL")
 USERNAME = os.getenv("USERNAME")
 PASSWORD = os.getenv("PASSWORD")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fishing provider sweep")
+    add_shard_arguments(parser)
+    args = parser.parse_args()
+    start_idle_profile()   # IDLE_PROFILE=1 → idle time per wait call site at exit
+
     # Step 1: Login Page actions
     login_page = Login(BASE_URL)
     login_page.Start_Browser()
@@ -28,9 +36,13 @@ if __name__ == "__main__":
     home_page.home_slot()
     
     # Step4:- Gameclick close testing
-    Fishing_Provider = FishProvider()
+    Fishing_Provider = FishProvider(BASE_URL)
     Fishing_Provider.page = login_page.page  # reuse same page
+    Fishing_Provider.context = login_page.context
+    Fishing_Provider.username = USERNAME
+    Fishing_Provider.password = PASSWORD
+    Fishing_Provider.game_filter = shard_filter_from_args(args)
     Fishing_Provider.List_Provisers()
     
     # Step 3: Close browser
-    login_page.close_Browser()
\ No newline at end of file
+    login_page.close_Browser()
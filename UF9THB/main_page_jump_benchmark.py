@@ -0,0 +1,176 @@
+import json
+import time
+import argparse
+from dotenv import load_dotenv
+
+# before the project imports: utils/locators.py reads SELECTOR_MODE/BRAND when they load
+load_dotenv(override=True)
+
+from utils.page_jump import PaginationModel, PageNavigator, next_action, max_actions
+from utils.lobby import PAGE_BTN
+
+OLD_SLEEP_S = 3.0   # fixed sleep after every pagination click in the old walk
+
+
+class MockPagination:
+    """
+    Lobby paginator in plain Python: first and last page always shown, a window
+    of `window` numbers centred on the active page, prev/next buttons and,
+    optionally, a page input or ?page= URL state.
+    """
+    def __init__(self, total=50, window=5, jump_input=False, url_param=None):
+        self.total = total
+        self.window = window
+        self.jump_input = jump_input
+        self.url_param = url_param
+        self.active = 1
+
+    def visible(self):
+        half = self.window // 2
+        start = max(1, min(self.active - half, self.total - self.window + 1))
+        numbers = set(range(start, min(self.total, start + self.window - 1) + 1)) | {1, self.total}
+        return sorted(numbers)
+
+    def model(self):
+        pages = self.visible()
+        return PaginationModel(pages, {n: i for i, n in enumerate(pages)}, self.active, self.total, len(pages),
+                               self.active > 1, self.active < self.total, self.jump_input, self.url_param, None)
+
+    def apply(self, action):
+        kind, number = action
+        if kind == "click" and number not in self.visible():
+            raise ValueError(f"page {number} is not visible")
+        self.active = max(1, min(self.total, number))
+
+
+def old_walk(mock, target):
+    """The old loop: click target if visible, else the second-to-last number to shift the window."""
+    clicks = 0
+    while target not in mock.visible():
+        mock.apply(("click", mock.visible()[-2]))
+        clicks += 1
+        if clicks > mock.total:
+            return None
+    mock.apply(("click", target))
+    return clicks + 1
+
+
+def new_jump(mock, target):
+    model = mock.model()
+    for actions in range(max_actions(model) + 1):
+        if mock.active == target:
+            return actions
+        mock.apply(next_action(mock.model(), target))
+    return None
+
+
+def model_benchmark(total, window, settle_s):
+    variants = {
+        "buttons only": {},
+        "page input": {"jump_input": True},
+        "url ?page=": {"url_param": "page"},
+    }
+    rows = []
+    old = [old_walk(MockPagination(total, window), t) for t in range(2, total + 1)]
+    print(f"===== Page jump, mock lobby with {total} pages (window {window}) =====")
+    print(f"old walk: worst {max(old)} clicks, mean {sum(old) / len(old):.1f}, "
+          f"worst {max(old) * OLD_SLEEP_S:.0f} s at {OLD_SLEEP_S:.0f} s/click")
+    rows.append({"method": "old walk", "worst": max(old), "mean": sum(old) / len(old)})
+    for name, options in variants.items():
+        mock = MockPagination(total, window, **options)
+        bound = max_actions(mock.model())
+        new = [new_jump(MockPagination(total, window, **options), t) for t in range(2, total + 1)]
+        if None in new:
+            print(f"❌ {name}: some targets not reached within {bound} actions")
+        new = [n for n in new if n is not None]
+        print(f"{name}: worst {max(new)} actions (bound {bound}), mean {sum(new) / len(new):.1f}, "
+              f"worst {max(new) * settle_s:.1f} s at {settle_s} s/settle")
+        rows.append({"method": name, "worst": max(new), "mean": sum(new) / len(new), "bound": bound})
+    return rows
+
+
+# Same paginator in a page, so PageNavigator runs against real DOM and settle waits
+_MOCK_HTML = """
+<html><body>
+<div class="p-holder admin-pagination"></div>
+<div id="grid"></div>
+<script>
+const TOTAL = %(total)d, WINDOW = %(window)d;
+let active = 1;
+function render() {
+    const half = Math.floor(WINDOW / 2);
+    const start = Math.max(1, Math.min(active - half, TOTAL - WINDOW + 1));
+    const numbers = new Set([1, TOTAL]);
+    for (let n = start; n <= Math.min(TOTAL, start + WINDOW - 1); n++) numbers.add(n);
+    const holder = document.querySelector('.p-holder');
+    holder.innerHTML = '';
+    const add = (label, cls, to) => {
+        const b = document.createElement('button');
+        b.textContent = label;
+        b.className = cls;
+        b.onclick = () => setTimeout(() => { active = to; render(); }, 50);
+        holder.appendChild(b);
+    };
+    add('<', 'p-prev' + (active === 1 ? ' disabled' : ''), Math.max(1, active - 1));
+    [...numbers].sort((a, b) => a - b).forEach(n => add(String(n), n === active ? 'active' : '', n));
+    add('>', 'p-next' + (active === TOTAL ? ' disabled' : ''), Math.min(TOTAL, active + 1));
+    document.getElementById('grid').innerHTML = [1, 2, 3].map(i =>
+        `<div class="game_btn_content"><div class="game_btn_content_text">Game ${active}-${i}</div></div>`).join('');
+}
+render();
+</script>
+</body></html>
+"""
+
+
+def browser_benchmark(total, window, targets):
+    from playwright.sync_api import sync_playwright
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        page = browser.new_page()
+        rows = []
+        for target in targets:
+            page.set_content(_MOCK_HTML % {"total": total, "window": window})
+            started = time.perf_counter()
+            old_clicks = 0
+            while True:
+                labels = [t.strip() for t in page.locator(PAGE_BTN).all_text_contents()]
+                if str(target) in labels:
+                    page.locator(PAGE_BTN).nth(labels.index(str(target))).click()
+                    old_clicks += 1
+                    break
+                page.locator(PAGE_BTN).nth(len(labels) - 2).click()
+                old_clicks += 1
+                page.wait_for_timeout(OLD_SLEEP_S * 1000)
+            old_s = time.perf_counter() - started + OLD_SLEEP_S
+
+            page.set_content(_MOCK_HTML % {"total": total, "window": window})
+            navigator = PageNavigator(page)
+            started = time.perf_counter()
+            landed = navigator.jump(target)
+            new_s = time.perf_counter() - started
+            print(f"page {target}: old {old_clicks} clicks {old_s:.1f} s | new {navigator.actions} actions "
+                  f"{new_s:.2f} s{'' if landed else ' ❌ not reached'}")
+            rows.append({"target": target, "old_clicks": old_clicks, "old_s": round(old_s, 2),
+                         "new_actions": navigator.actions, "new_s": round(new_s, 2), "landed": landed})
+        browser.close()
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Old sliding pagination walk vs bounded page jump")
+    parser.add_argument("--pages", type=int, default=50, help="pages in the mock lobby (default 50)")
+    parser.add_argument("--window", type=int, default=5, help="page numbers shown around the active one (default 5)")
+    parser.add_argument("--settle", type=float, default=0.4, help="modelled seconds per settled action (default 0.4)")
+    parser.add_argument("--browser", action="store_true", help="also time both walks in Chromium on a mock lobby page")
+    parser.add_argument("--targets", type=int, nargs="+", default=[10, 25, 50], help="pages to reach in --browser mode")
+    parser.add_argument("--results", help="write the numbers as JSON to this path")
+    args = parser.parse_args()
+
+    results = {"model": model_benchmark(args.pages, args.window, args.settle)}
+    if args.browser:
+        results["browser"] = browser_benchmark(args.pages, args.window, args.targets)
+    if args.results:
+        with open(args.results, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results saved: {args.results}")
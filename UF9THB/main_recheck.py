@@ -0,0 +1,81 @@
+import os
+import json
+import argparse
+from dotenv import load_dotenv
+
+# before the project imports: utils/locators.py reads SELECTOR_MODE/BRAND when they load
+load_dotenv(override=True)
+
+from pages.login_page import Login
+from pages.home_page import HomePage
+from pages.recovery_helper import RecoveryHelper
+from utils.game_catalog import GameCatalog
+from utils.launch_urls import launch_urls
+from utils.logger import Logger
+
+BASE_URL = os.getenv("BASE_URL")
+USERNAME = os.getenv("USERNAME")
+PASSWORD = os.getenv("PASSWORD")
+
+
+def games_to_recheck(args):
+    """(provider, page, game) from --game PROVIDER::GAME and/or the non-passed rows of --from-results."""
+    games = []
+    for spec in args.game or []:
+        provider_name, _, game_name = spec.partition("::")
+        games.append((provider_name, 1, game_name))
+    if args.from_results:
+        with open(args.from_results, encoding="utf-8") as f:
+            games.extend((r["provider"], r.get("page") or 1, r["game"])
+                         for r in json.load(f) if r.get("status") in args.statuses)
+    return list(dict.fromkeys(games))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-test selected games, from their launch URLs where possible")
+    parser.add_argument("--game", action="append", help="PROVIDER::GAME to re-test (repeatable)")
+    parser.add_argument("--from-results", help="results JSON of an earlier sweep; its failed games are re-tested")
+    parser.add_argument("--statuses", nargs="+", default=["failed", "timeout", "error"],
+                        help="which result statuses to re-test (default: failed timeout error)")
+    parser.add_argument("--category", default="Slot", help="lobby menu of the games (default Slot)")
+    parser.add_argument("--game-catalog", default=os.getenv("GAME_CATALOG"),
+                        help="catalog JSON to find each game's lobby page on fallback (env GAME_CATALOG)")
+    parser.add_argument("--results", help="write the re-check results as JSON to this path")
+    args = parser.parse_args()
+
+    games = games_to_recheck(args)
+    if not games:
+        parser.error("nothing to re-test: pass --game or --from-results")
+    if launch_urls() is None:
+        print("⚠ LAUNCH_URLS is not set: every game goes through the lobby")
+
+    login_page = Login(BASE_URL)
+    login_page.Start_Browser()
+    login_page.launch_url()
+    login_page.login(USERNAME, PASSWORD)
+    login_page.Close_Popupbtnscal()
+
+    home_page = HomePage()
+    home_page.page = login_page.page
+    home_page.click_category(args.category)
+
+    recovery = RecoveryHelper(login_page.page, login_page.context, BASE_URL, USERNAME, PASSWORD, args.category)
+    if args.game_catalog and os.path.exists(args.game_catalog):
+        recovery.catalog = GameCatalog.load(login_page.page, args.game_catalog)
+
+    results = []
+    for provider_name, page_num, game_name in games:
+        print(f"🔍 Re-checking {game_name} ({provider_name})")
+        try:
+            status = recovery.recheck(provider_name, game_name, page_num) or "error"
+        except Exception as e:
+            print(f"❌ Error on {game_name}: {e}")
+            status = "error"
+        results.append({"provider": provider_name, "page": page_num, "game": game_name, "status": status})
+
+    Logger.log_summary(results, "Re-check summary")
+    if args.results:
+        with open(args.results, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"💾 Results saved: {args.results}")
+    login_page.close_Browser()
@@ -0,0 +1,122 @@
+import os
+import json
+import time
+import argparse
+from dotenv import load_dotenv
+
+# before the project imports: utils/locators.py reads SELECTOR_MODE/BRAND when they load
+load_dotenv(override=True)
+
+from utils.locators import SELECTORS, BRAND_OVERRIDES, QUERY_JS, lookup, brand
+
+BASE_URL = os.getenv("BASE_URL")
+USERNAME = os.getenv("USERNAME")
+PASSWORD = os.getenv("PASSWORD")
+
+# Resolves one selector `runs` times inside the page and reports the mean in microseconds
+_TIME_JS = """
+({sel, runs}) => {
+    const qa = """ + QUERY_JS + """;
+    let count = 0;
+    const started = performance.now();
+    for (let i = 0; i < runs; i++) count = qa(sel).length;
+    return {count, us: (performance.now() - started) * 1000 / runs};
+}
+"""
+
+
+def synthetic_lobby(providers=40, games=30, pages=50):
+    """A lobby shaped like the real one, for when no saved DOM is at hand."""
+    provider_bar = "".join(f"<button>Provider {i}</button>" for i in range(providers))
+    cards = "".join(
+        f"<div class='game_btn'><div class='game_btn_content'><div class='game_btn_content_text'>Game {i}</div>"
+        f"<button>Play Now</button><button>Demo</button></div></div>" for i in range(games))
+    numbers = "".join(f"<button class='{'active' if n == 1 else ''}'>{n}</button>" for n in (1, 2, 3, 4, 5, pages))
+    return (
+        "<html><body><nav><a> Home</a><a> Slot</a><a> Fishing</a><a> Card Game</a><a> Instant Win</a></nav>"
+        "<div class='flex items-center gap-2 mr-2 flex-row-reverse'><button>Login</button></div>"
+        f"<div class='mt-5 flex items-center slot_btn_container w-full overflow-auto light-scrollbar-h pb-[10px]'>{provider_bar}</div>"
+        f"<main>{cards}</main>"
+        f"<div class='p-holder admin-pagination'><button class='p-prev'>&lt;</button>{numbers}<button class='p-next'>&gt;</button></div>"
+        "</body></html>"
+    )
+
+
+def capture_lobby(path):
+    """Log in, open the Slot lobby on its first provider and save the DOM to path."""
+    from pages.login_page import Login
+    from pages.home_page import HomePage
+    from utils.lobby import read_lobby, click_provider
+
+    login_page = Login(BASE_URL)
+    login_page.Start_Browser()
+    login_page.launch_url()
+    login_page.login(USERNAME, PASSWORD)
+    login_page.Close_Popupbtnscal()
+    home_page = HomePage()
+    home_page.page = login_page.page
+    home_page.click_Slot()
+    click_provider(login_page.page, read_lobby(login_page.page).providers[1])
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(login_page.page.content())
+    print(f"💾 Lobby DOM saved: {path}")
+    login_page.close_Browser()
+
+
+def benchmark(html, brand_name, runs):
+    """XPath vs CSS resolve time for every registry entry, in-page and through page.locator()."""
+    from playwright.sync_api import sync_playwright
+
+    names = sorted(set(SELECTORS) | set(BRAND_OVERRIDES.get(brand_name, {})))
+    rows = []
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        page = browser.new_page()
+        page.set_content(html, wait_until="domcontentloaded")
+        print(f"===== Selector resolve time, brand {brand_name}, {runs} runs each =====")
+        for name in names:
+            pair = lookup(name, brand_name)
+            row = {"name": name}
+            for mode in ("xpath", "css"):
+                sel = getattr(pair, mode)
+                in_page = page.evaluate(_TIME_JS, {"sel": sel, "runs": runs})
+                started = time.perf_counter()
+                for _ in range(max(1, runs // 20)):
+                    page.locator(sel).count()
+                locator_us = (time.perf_counter() - started) * 1e6 / max(1, runs // 20)
+                row[mode] = {"count": in_page["count"], "in_page_us": round(in_page["us"], 2),
+                             "locator_us": round(locator_us, 1)}
+            x, c = row["xpath"], row["css"]
+            speedup = x["in_page_us"] / c["in_page_us"] if c["in_page_us"] else float("inf")
+            mismatch = "" if x["count"] == c["count"] else f"  ⚠ matches differ ({x['count']} vs {c['count']})"
+            print(f"{name:18} xpath {x['in_page_us']:8.2f} µs | css {c['in_page_us']:8.2f} µs | "
+                  f"x{speedup:5.1f} | locator {x['locator_us']:7.0f} / {c['locator_us']:7.0f} µs | "
+                  f"{x['count']} match(es){mismatch}")
+            rows.append(row)
+        browser.close()
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="XPath vs CSS resolve time for the selector registry")
+    parser.add_argument("--dom", help="saved lobby HTML (default: a synthetic lobby)")
+    parser.add_argument("--capture", metavar="PATH", help="log in, save the live lobby DOM to PATH and exit")
+    parser.add_argument("--brand", default=brand(), choices=sorted(BRAND_OVERRIDES),
+                        help="whose overrides to apply (default: this tree)")
+    parser.add_argument("--runs", type=int, default=2000, help="resolves per selector (default 2000)")
+    parser.add_argument("--results", help="write the numbers as JSON to this path")
+    args = parser.parse_args()
+
+    if args.capture:
+        capture_lobby(args.capture)
+    else:
+        if args.dom:
+            with open(args.dom, encoding="utf-8") as f:
+                html = f.read()
+        else:
+            html = synthetic_lobby()
+        results = benchmark(html, args.brand, args.runs)
+        if args.results:
+            with open(args.results, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+            print(f"💾 Results saved: {args.results}")
@@ -1,19 +1,52 @@
 import os
+import json
+import argparse
 from dotenv import load_dotenv
+
+# before the project imports: utils/locators.py reads SELECTOR_MODE/BRAND when they load
+load_dotenv(override=True)
+
 from pages.login_page import Login
 from pages.home_page import HomePage
 from pages.Slot_Providers import SlotProvider
-
-load_dotenv(override=True)
+from utils.game_catalog import GameCatalog
+from utils.helpers import find_free_port
+from utils.sharding import add_shard_arguments, shard_filter_from_args
+from utils.concurrency import AIMDController
+from utils.idle_profiler import start_idle_profile
 
 BASE_URL = os.getenv("BASE_URL")
 USERNAME = os.getenv("USERNAME")
 PASSWORD = os.getenv("PASSWORD")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Slot provider sweep")
+    parser.add_argument("--workers", default=os.getenv("SWEEP_WORKERS", "1"),
+                        help="parallel logged-in contexts, or 'auto' to size from one measured game "
+                             "(env SWEEP_WORKERS, default 1 = serial)")
+    parser.add_argument("--max-workers", type=int, default=8, help="upper bound for --workers auto")
+    parser.add_argument("--tabs", type=int, default=int(os.getenv("SWEEP_TABS", "1")),
+                        help="games launched side by side in tabs of one context (env SWEEP_TABS, default 1)")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="let toast/timeout rates raise or cut how many workers launch at once")
+    parser.add_argument("--metrics", default=os.getenv("SWEEP_METRICS"),
+                        help="write concurrency metrics JSON here when --adaptive (env SWEEP_METRICS)")
+    parser.add_argument("--results", default=os.getenv("SWEEP_RESULTS"),
+                        help="write per-game results as JSON to this path (env SWEEP_RESULTS)")
+    parser.add_argument("--game-catalog", default=os.getenv("GAME_CATALOG"),
+                        help="provider → games JSON captured from the lobby API; reused if it exists, "
+                             "built on the first run otherwise (env GAME_CATALOG)")
+    add_shard_arguments(parser)
+    args = parser.parse_args()
+    start_idle_profile()   # IDLE_PROFILE=1 → idle time per wait call site at exit
+
+    auto_workers = args.workers == "auto"
+    workers = 1 if auto_workers else int(args.workers)
+
     # Step 1: Start browser and login
+    cdp_port = find_free_port() if auto_workers or workers > 1 else None
     login_page = Login(BASE_URL)
-    login_page.Start_Browser()
+    login_page.Start_Browser(cdp_port=cdp_port)
     login_page.launch_url()
     print(f"USERNAME from env: {USERNAME!r}")
     login_page.login(USERNAME, PASSWORD)
@@ -26,16 +59,42 @@ if __name__ == "__main__":
     home_page.home_slot()
 
     # Step 3: Provider + Game testing
+    catalog = None
+    if args.game_catalog:
+        if os.path.exists(args.game_catalog):
+            catalog = GameCatalog.load(login_page.page, args.game_catalog)
+        else:
+            catalog = GameCatalog(login_page.page, args.game_catalog)
     slot_providers = SlotProvider(
         login_page.page,
         login_page.context,
         baseUrl=BASE_URL,
         username=USERNAME,
         password=PASSWORD,
+        workers=workers,
+        cdp_endpoint=f"http://127.0.0.1:{cdp_port}" if cdp_port else None,
+        tabs=args.tabs,
+        game_filter=shard_filter_from_args(args),
+        catalog=catalog,
     )
 
+    if auto_workers:
+        try:
+            workers = login_page.Calibrate_Workers(slot_providers.launch_sample_game,
+                                                   slot_providers.exit_sample_game,
+                                                   max_workers=args.max_workers) or 1
+        except Exception as e:
+            print(f"⚠ Calibration failed ({e}), running serial")
+        slot_providers.workers = workers
+    if args.adaptive:
+        slot_providers.controller = AIMDController(initial=1, maximum=workers, metrics_path=args.metrics)
+
     # Run provider → games flow
-    slot_providers.List_Provisers()
+    results = slot_providers.List_Provisers()
+    if args.results:
+        with open(args.results, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"💾 Results saved: {args.results}")
 
     # Step 4: Close browser
     login_page.close_Browser()
@@ -0,0 +1,62 @@
+import os
+import time
+import socket
+import argparse
+from dotenv import load_dotenv
+
+# before the project imports: utils/locators.py reads SELECTOR_MODE/BRAND when they load
+load_dotenv(override=True)
+
+from pages.parallel_sweep import open_session, move_to_item
+from utils.coordinator import CoordinatorClient, LeaseHeartbeat
+from utils.rate_limit import RemoteBucket, use_bucket
+from utils.work_queue import WorkItem
+from utils.idle_profiler import start_idle_profile
+
+BASE_URL = os.getenv("BASE_URL")
+USERNAME = os.getenv("USERNAME")
+PASSWORD = os.getenv("PASSWORD")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep worker that takes game leases from main_coordinator.py")
+    parser.add_argument("--coordinator", default=os.getenv("COORDINATOR_URL", "http://127.0.0.1:8765"))
+    parser.add_argument("--name", default=f"{socket.gethostname()}-{os.getpid()}")
+    args = parser.parse_args()
+    start_idle_profile()   # IDLE_PROFILE=1 → idle time per wait call site at exit
+
+    client = CoordinatorClient(args.coordinator, args.name)
+    use_bucket(BASE_URL, RemoteBucket(client))   # launch rate comes from the coordinator's LAUNCH_RATE
+    session, game_page = open_session(BASE_URL, USERNAME, PASSWORD)
+    position = None
+    print(f"👷 Worker {args.name} → {args.coordinator}")
+
+    try:
+        while True:
+            lease = client.lease()
+            if lease.get("done"):
+                print("✅ Catalog finished, worker exiting")
+                break
+            if lease.get("wait"):
+                time.sleep(5)
+                continue
+
+            item = WorkItem(**lease["item"])
+            # provider/page/index let the coordinator place a result that arrives after the lease expired
+            result = {"worker": args.name, "provider": item.provider, "page": item.page, "index": item.index}
+            with LeaseHeartbeat(client, lease["lease_id"], lease["lease_seconds"] / 3):
+                try:
+                    position = move_to_item(game_page, position, item)
+                    if position is None:
+                        result["status"] = "error"
+                    else:
+                        done = len(game_page.results)
+                        result["status"] = game_page.play_game(item.provider, item.page, item.index) or "skipped"
+                        for entry in game_page.results[done:]:
+                            result.update(status=entry["status"], retry=entry.get("retry"))   # retry outcome included
+                except Exception as e:
+                    print(f"❌ Error on {item.name}: {e}")
+                    result["status"] = "error"
+                    position = None
+            client.report(lease["lease_id"], result)
+    finally:
+        session.close_Browser()
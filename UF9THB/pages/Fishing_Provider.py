@@ -1,21 +1,22 @@
-import time
 from tests.base_page import BaseClass
 from pages.game_page import Game_Click
+from pages.recovery_helper import RecoveryHelper
+from utils.lobby import PROVIDER_BTN, read_lobby, click_provider
 
 class FishProvider(BaseClass):
+    username = None
+    password = None
+    game_filter = None   # optional ShardFilter, see utils/sharding.py
+
     def List_Provisers(self):
-        time.sleep(1)
-        Provider_btns = self.page.query_selector_all("//div[@class='mt-5 flex items-center slot_btn_container w-full overflow-auto light-scrollbar-h pb-[10px]']//button")
-        total_providers = len(Provider_btns)
-        for indexp in range(1, total_providers):
-            Provider_btns = self.page.query_selector_all("//div[@class='mt-5 flex items-center slot_btn_container w-full overflow-auto light-scrollbar-h pb-[10px]']//button")
-            Provider_btn = Provider_btns[indexp]
-            provider_name = Provider_btn.text_content().strip()
-            Provider_btn.scroll_into_view_if_needed()
-            Provider_btn.click()
+        self.page.locator(PROVIDER_BTN).first.wait_for(state="visible", timeout=12000)
+        for provider_name in read_lobby(self.page).providers[1:]:   # skipping 'All'
+            if not click_provider(self.page, provider_name):
+                continue
             print(f"Provider: {provider_name}")
-            time.sleep(1)
-            
-            game_page = Game_Click()
-            game_page.page = self.page
-            game_page.GamesbtnClick()
\ No newline at end of file
+
+            recovery = RecoveryHelper(self.page, self.context, self.baseUrl, self.username, self.password,
+                                      category="Fishing")
+            game_page = Game_Click(self.page, self.context, self.baseUrl, self.username, self.password, recovery)
+            game_page.game_filter = self.game_filter
+            game_page.GamesbtnClick(provider_name)
\ No newline at end of file
@@ -1,10 +1,11 @@
 from tests.base_page import BaseClass
+from utils.lobby import PAGE_BTN
 import time
 
 class pagination_loop():
     def click_page_number(page, target_page):
         """Clicks a page number button by its visible text."""
-        Total_Pages = page.query_selector_all("//div[@class='p-holder admin-pagination']/button[not(contains(@class,'p-next')) and not(contains(@class,'p-prev'))]")
+        Total_Pages = page.query_selector_all(PAGE_BTN)
         for page_btn in Total_Pages:
             if page_btn.text_content().strip() == str(target_page):
                 page_btn.scroll_into_view_if_needed()
@@ -13,7 +14,7 @@ class pagination_loop():
         return False 
      
     def pagination_click(self, page):
-        Total_Pages = page.query_selector_all("//div[@class='p-holder admin-pagination']/button[not(contains(@class,'p-next')) and not(contains(@class,'p-prev'))]")
+        Total_Pages = page.query_selector_all(PAGE_BTN)
         time.sleep(5)
         last_page_num = int(Total_Pages[-1].text_content())
         print(f"Last page num is: {last_page_num}")
@@ -31,7 +32,7 @@ class pagination_loop():
                 current_page_num = next_page
                 
             else:
-                Total_Pages = page.query_selector_all("//div[@class='p-holder admin-pagination']/button[not(contains(@class,'p-next')) and not(contains(@class,'p-prev'))]")
+                Total_Pages = page.query_selector_all(PAGE_BTN)
                 anchor_page = int(Total_Pages[2].text_content())
                 self.click_page_number(page, anchor_page)
                 time.sleep(3)
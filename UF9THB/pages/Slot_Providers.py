@@ -2,36 +2,103 @@ import time
 from tests.base_page import BaseClass
 from pages.game_page import Game_Click
 from pages.recovery_helper import RecoveryHelper   # ✅ import
+from pages.parallel_sweep import ParallelSweep
+from pages.tab_launcher import TabLauncher
+from utils.work_queue import WorkItem
+from utils.waits import wait_for_launch_outcome, FINAL_SIGNALS
+from utils.lobby import PLAY_BTN, read_lobby, click_provider
 
 class SlotProvider:
-    def __init__(self, page, context, baseUrl=None, username=None, password=None):
+    def __init__(self, page, context, baseUrl=None, username=None, password=None,
+                 workers=1, cdp_endpoint=None, tabs=1, game_filter=None, controller=None,
+                 category="Slot", catalog=None):
         self.page = page
         self.context = context
         self.baseUrl = baseUrl
         self.username = username
         self.password = password
-        self.recovery = RecoveryHelper(page, context, baseUrl, username, password)   # ✅ recovery helper
+        self.workers = workers              # >1 → providers are spread over parallel contexts
+        self.cdp_endpoint = cdp_endpoint    # browser started with Start_Browser(cdp_port=...)
+        self.tabs = tabs                    # >1 → games of a provider launch in parallel tabs
+        self.game_filter = game_filter      # e.g. ShardFilter: only games of this shard
+        self.controller = controller        # AIMDController for adaptive launch concurrency
+        self.category = category            # lobby menu this provider bar belongs to
+        self.recovery = RecoveryHelper(page, context, baseUrl, username, password, category)   # ✅ recovery helper
+        self.catalog = catalog              # GameCatalog: games per provider from the lobby API
+        self.recovery.catalog = catalog
+        self.results = []
+
+    def provider_names(self):
+        """Names of every provider button, skipping 0 if that's 'All'."""
+        return read_lobby(self.page).providers[1:]
+
+    def launch_sample_game(self):
+        """Open the first game of the first provider (used to calibrate worker count)."""
+        ParallelSweep.open_provider(self.page, self.provider_names()[0])
+        self.page.locator(PLAY_BTN).first.click(timeout=15000)
+        wait_for_launch_outcome(self.page, 60000, signals=FINAL_SIGNALS)
+
+    def exit_sample_game(self):
+        game_page = Game_Click(self.page, self.context, self.baseUrl, self.username,
+                               self.password, recovery=self.recovery)
+        game_page.handle_game_exit("calibration game", hold_seconds=0)
+
+    def build_catalog(self):
+        """Capture the providers the GameCatalog does not have yet by opening each once (no pagination)."""
+        if self.catalog is not None:
+            missing = self.catalog.missing(self.provider_names())
+            if missing:
+                self.catalog.capture(missing)
+
+    def flatten_catalog(self):
+        """
+        One WorkItem per game. Taken from the GameCatalog when there is one and
+        its page count still matches the lobby; providers it could not read, or
+        whose page count changed (or all of them, without one), are walked page by page.
+        """
+        self.build_catalog()
+        game_page = Game_Click(self.page, self.context, self.baseUrl, self.username,
+                               self.password, recovery=self.recovery)
+        items = []
+        for provider_name in self.provider_names():
+            if not ParallelSweep.open_provider(self.page, provider_name):
+                continue
+            lobby = read_lobby(self.page)
+            last_page_num = lobby.pages[-1] if lobby.pages else 1
+            if self.catalog and self.catalog.check_pages(provider_name, last_page_num):
+                items.extend(WorkItem(g.provider, g.page, g.index, g.name) for g in self.catalog.games(provider_name)
+                             if not self.game_filter or self.game_filter(g.provider, g.name))
+                continue
+            for page_num in range(1, last_page_num + 1):
+                if page_num > 1:
+                    game_page.click_page_number(page_num)
+                    lobby = read_lobby(self.page)
+                items.extend(WorkItem(provider_name, page_num, index, name)
+                             for index, name in enumerate(lobby.games)
+                             if not self.game_filter or self.game_filter(provider_name, name))
+            print(f"📚 {provider_name}: {last_page_num} pages, {len(items)} games catalogued so far")
+        return items
 
     def List_Provisers(self):
         """Loop through all providers and run their games."""
-        provider_xpath = (
-            "//div[@class='mt-5 flex items-center slot_btn_container "
-            "w-full overflow-auto light-scrollbar-h pb-[10px]']//button"
-        )
-        total_providers = len(self.page.query_selector_all(provider_xpath))
-
-        for indexp in range(1, total_providers):  # skipping 0 if that's 'All'
-            # refresh provider buttons every loop (to avoid stale handles)
-            Provider_btns = self.page.query_selector_all(provider_xpath)
-            Provider_btn = Provider_btns[indexp]
-
-            provider_name = Provider_btn.text_content().strip()
+        if self.workers > 1 and self.cdp_endpoint:
+            sweep = ParallelSweep(self.cdp_endpoint, self.baseUrl, self.username, self.password,
+                                  self.workers, tabs=self.tabs, game_filter=self.game_filter,
+                                  controller=self.controller, category=self.category, catalog=self.catalog)
+            if self.tabs > 1:
+                self.results = sweep.run(self.provider_names())
+            else:
+                self.results = sweep.run_items(self.flatten_catalog())
+            return self.results
+
+        self.build_catalog()
+        for provider_name in self.provider_names():  # skipping 'All'
             print(f"🎰 Provider: {provider_name}")
 
-            # make sure visible & in view before click
-            Provider_btn.scroll_into_view_if_needed()
-            self.page.wait_for_timeout(300)  # tiny wait
-            Provider_btn.click()
+            # index from a fresh snapshot every loop (the bar re-renders after each provider)
+            if not click_provider(self.page, provider_name):
+                print(f"⚠ Provider {provider_name} no longer listed, skipping")
+                continue
 
             # Create game page handler with shared context + recovery
             game_page = Game_Click(self.page, self.context)   # ✅ constructor only takes page + context
@@ -39,6 +106,14 @@ class SlotProvider:
             game_page.baseUrl = self.baseUrl
             game_page.username = self.username
             game_page.password = self.password
+            game_page.game_filter = self.game_filter
+            game_page.catalog = self.catalog
 
             # Run games for this provider
-            game_page.GamesbtnClick(provider_name)
+            if self.tabs > 1:
+                TabLauncher(game_page, tabs=self.tabs).run_provider(provider_name)
+            else:
+                game_page.GamesbtnClick(provider_name)
+            self.results.extend(game_page.results)
+
+        return self.results
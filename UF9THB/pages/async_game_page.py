@@ -0,0 +1,233 @@
+import time
+import asyncio
+from playwright.async_api import async_playwright, TimeoutError
+from utils.rate_limit import throttle_launch_async
+from utils.launch_timeouts import budget_ms, record_latency
+from utils.popups import install_popup_handlers_async, MISSION_CLOSE
+from utils.lobby import PROVIDER_BTN, PAGE_BTN, PLAY_BTN, read_lobby_async
+from utils.waits import CLOSE_BTN, TOAST, BACK_BTN, GAME_IFRAME, wait_for_any_visible_async
+from utils.page_jump import AsyncPageNavigator
+from utils.game_ready import wait_for_game_ready_async
+from utils.locators import selector
+from pages.login_page import LOGIN_GONE, AUTH_MARKERS, LOGIN_ERRORS, SESSION_COOKIE_HINTS
+
+# pages/async_game_page.py
+
+
+class AsyncGameClick:
+    """
+    Async login → provider → paginate → launch → exit flow.
+    The lobby page only reads the catalog. Every game is launched in its own
+    tab of the same logged-in context, and an asyncio.Semaphore caps how many
+    games are in flight at once. Pass an AIMDController to let toast/timeout
+    feedback move that cap instead.
+    """
+    def __init__(self, baseUrl, username, password, concurrency=4, hold_seconds=10, headless=False,
+                 controller=None):
+        self.baseUrl = baseUrl
+        self.username = username
+        self.password = password
+        self.concurrency = concurrency
+        self.hold_seconds = hold_seconds
+        self.headless = headless
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.controller = controller
+        self.results = []
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.page = None
+
+    async def start_browser(self):
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(headless=self.headless, args=["--start-maximized"])
+        self.context = await self.browser.new_context(no_viewport=True)
+        self.page = await self.context.new_page()
+        print("browser started (async)")
+
+    async def close_browser(self):
+        await self.browser.close()
+        await self.playwright.stop()
+        print("Browser closed")
+
+    async def login(self, max_attempts=2):
+        for attempt in range(1, max_attempts + 1):
+            try:
+                await self.page.goto(self.baseUrl, wait_until="networkidle")
+                await self.page.locator(selector("login_open")).click(timeout=12000)
+                await self.page.locator(selector("login_username")).fill(self.username, timeout=12000)
+                await self.page.locator(selector("login_password")).fill(self.password, timeout=12000)
+                cookies_before = {c["name"] for c in await self.context.cookies()}
+                await self.page.locator(selector("login_submit")).click(timeout=12000)
+                outcome = await self.wait_for_login_outcome(cookies_before)
+                if outcome in LOGIN_ERRORS:
+                    message = await self.page.locator(LOGIN_ERRORS[outcome]).first.text_content() or ""
+                    print(f"❌ Login rejected: {message.strip()}")
+                    return False
+                if outcome is None:
+                    raise TimeoutError("no authenticated marker within 15000 ms")
+                print(f"🔑 Logged in ({outcome})")
+                await self.close_popup(self.page)
+                return True
+            except TimeoutError as e:
+                print(f"⚠ Login attempt {attempt} failed: {e}")
+        print("❌ Login failed after retries")
+        return False
+
+    async def wait_for_login_outcome(self, cookies_before, timeout_ms=15000):
+        """Async counterpart of Login.wait_for_login_outcome (pages/login_page.py)."""
+        markers = {**AUTH_MARKERS, **LOGIN_ERRORS}
+        deadline = time.time() + timeout_ms / 1000
+        while time.time() < deadline:
+            slice_ms = min(500, max(1, (deadline - time.time()) * 1000))
+            outcome = await wait_for_any_visible_async(self.page, markers, slice_ms, gone=LOGIN_GONE)
+            if outcome:
+                return outcome
+            new_cookies = {c["name"] for c in await self.context.cookies()} - cookies_before
+            if any(hint in name.lower() for name in new_cookies for hint in SESSION_COOKIE_HINTS):
+                return "cookie"
+        return None
+
+    @staticmethod
+    async def close_popup(page):
+        """Auto-dismiss the mission dialog and promo modals from now on (see utils/popups.py)."""
+        if await install_popup_handlers_async(page):
+            return
+        try:
+            await page.locator(MISSION_CLOSE).click(timeout=3000)
+        except Exception:
+            pass
+
+    async def open_lobby(self, page, provider_name, page_num=1):
+        """Slot category → provider → page number, on any tab of the context."""
+        await page.locator(selector("menu_slot")).click(timeout=12000)
+        await page.locator(PROVIDER_BTN).first.wait_for(state="visible", timeout=12000)
+        lobby = await read_lobby_async(page)
+        if provider_name not in lobby.providers:
+            raise RuntimeError(f"provider {provider_name} not found")
+        btn = page.locator(PROVIDER_BTN).nth(lobby.providers.index(provider_name))
+        await btn.scroll_into_view_if_needed()
+        await btn.click()
+        await page.locator(PLAY_BTN).first.wait_for(state="visible", timeout=15000)
+        if page_num > 1:
+            await self.click_page_number(page, page_num)
+
+    async def click_page_number(self, page, target_page):
+        """Bounded page jump, as Game_Click.click_page_number (utils/page_jump.py)."""
+        navigator = AsyncPageNavigator(page)
+        for attempt in range(3):
+            try:
+                if await navigator.jump(target_page):
+                    return True
+                print(f"⚠ Attempt {attempt+1}: page {target_page} not reached after {navigator.actions} action(s)")
+            except Exception as e:
+                print(f"⚠ Attempt {attempt+1} failed: {e}")
+                await asyncio.sleep(2)
+        print(f"❌ Could not click page {target_page}")
+        return False
+
+    async def read_catalog(self, provider_name):
+        """Every (page, index, name) of one provider, read from the lobby tab."""
+        await self.open_lobby(self.page, provider_name)
+        lobby = await read_lobby_async(self.page)
+        last_page_num = lobby.pages[-1] if lobby.pages else 1
+
+        games = []
+        for page_num in range(1, last_page_num + 1):
+            if page_num > 1:
+                await self.click_page_number(self.page, page_num)
+                lobby = await read_lobby_async(self.page)
+            games.extend((page_num, index, name) for index, name in enumerate(lobby.games))
+        print(f"🎰 Provider: {provider_name} → {len(games)} games on {last_page_num} pages")
+        return games
+
+    def launch_slot(self):
+        return self.controller.async_slot() if self.controller else self.semaphore
+
+    async def launch_game(self, provider_name, page_num, index, game_name):
+        async with self.launch_slot():
+            tab = await self.context.new_page()
+            try:
+                await tab.goto(self.baseUrl, wait_until="domcontentloaded", timeout=60000)
+                await self.close_popup(tab)
+                await self.open_lobby(tab, provider_name, page_num)
+
+                play_btn = tab.locator(PLAY_BTN).nth(index)
+                await play_btn.scroll_into_view_if_needed()
+                await throttle_launch_async(self.baseUrl)
+                await play_btn.click(timeout=15000)
+
+                status = await self.handle_game_exit(tab, game_name, provider_name)
+            except Exception as e:
+                print(f"❌ Error on {game_name}: {e}")
+                status = "error"
+            finally:
+                await tab.close()
+
+        if self.controller:
+            self.controller.record(status)
+        self.results.append({"provider": provider_name, "page": page_num, "game": game_name, "status": status})
+        return status
+
+    async def handle_game_exit(self, tab, game_name, provider_name=None):
+        """Async counterpart of Game_Click.handle_game_exit; returns a status string."""
+        close_btn = tab.locator(CLOSE_BTN)
+        toast = tab.locator(TOAST)
+        budget = budget_ms(self.baseUrl, "launch", provider_name, game_name)
+        started = time.time()
+        try:
+            await close_btn.or_(toast).first.wait_for(state="visible", timeout=budget)
+        except TimeoutError:
+            record_latency(self.baseUrl, "launch", provider_name, game_name, budget)
+            print(f"⚠ Timeout for {game_name}")
+            return "timeout"
+        latency_ms = (time.time() - started) * 1000
+
+        if await toast.is_visible():
+            print(f"❌ Toast error for {game_name}")
+            return "failed"
+        record_latency(self.baseUrl, "launch", provider_name, game_name, latency_ms)   # opened games only
+
+        try:
+            await tab.locator(GAME_IFRAME).wait_for(
+                state="attached", timeout=budget_ms(self.baseUrl, "iframe", provider_name, game_name))
+        except TimeoutError:
+            print(f"⚠ Game iframe not detected for {game_name}, continuing anyway.")
+        ready, elapsed, signals = await wait_for_game_ready_async(tab, GAME_IFRAME, max_wait_s=self.hold_seconds)
+        if ready:
+            print(f"🎮 {game_name} ready after {elapsed:.1f}s")
+        else:
+            missing = [k for k in ("loaded", "quiet", "canvas", "painted") if not signals.get(k)]
+            print(f"⏳ {game_name} not ready after {elapsed:.0f}s (missing: {', '.join(missing) or 'iframe'}), closing")
+        try:
+            await close_btn.click(timeout=5000)
+        except Exception:
+            pass
+        print(f"✅ Closed {game_name}")
+        return "passed"
+
+    async def run(self, provider_names=None):
+        await self.start_browser()
+        try:
+            if not await self.login():
+                return self.results
+            await self.page.locator(selector("menu_slot")).click(timeout=12000)
+            if provider_names is None:
+                await self.page.locator(PROVIDER_BTN).first.wait_for(state="visible", timeout=12000)
+                provider_names = (await read_lobby_async(self.page)).providers[1:]   # skip 'All'
+
+            tasks = []
+            for provider_name in provider_names:
+                try:
+                    games = await self.read_catalog(provider_name)
+                except Exception as e:
+                    print(f"❌ Could not read {provider_name}: {e}")
+                    continue
+                tasks.extend(
+                    asyncio.create_task(self.launch_game(provider_name, page_num, index, name))
+                    for page_num, index, name in games
+                )
+            await asyncio.gather(*tasks)
+        finally:
+            await self.close_browser()
+        return self.results
@@ -0,0 +1,63 @@
+import threading
+from pages.parallel_sweep import open_session
+from pages.Slot_Providers import SlotProvider
+from utils.logger import Logger
+
+CATEGORIES = ["Slot", "Fishing", "Card Game", "Instant Win"]
+
+
+class CategorySweep:
+    """
+    Sweep several lobby categories at the same time from one login.
+    Steps:
+    1. The caller logs in once and passes context.storage_state().
+    2. Every category gets its own context cloned from that state (no new login),
+       attached to the same browser over CDP and driven by its own thread.
+    3. Each category runs the normal SlotProvider flow; results are tagged
+       with their category and reported per category.
+    """
+    def __init__(self, cdp_endpoint, storage_state, baseUrl, username, password, game_filter=None):
+        self.cdp_endpoint = cdp_endpoint
+        self.storage_state = storage_state
+        self.baseUrl = baseUrl
+        self.username = username
+        self.password = password
+        self.game_filter = game_filter
+        self.results = {}
+        self._lock = threading.Lock()
+
+    def run(self, categories=CATEGORIES):
+        threads = [
+            threading.Thread(target=self._sweep_category, args=(category,), name=f"category-{category}")
+            for category in categories
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for category in categories:
+            Logger.log_summary(self.results.get(category, []), f"{category} summary")
+        return self.results
+
+    def _sweep_category(self, category):
+        session = None
+        results = []
+        try:
+            session, _ = open_session(self.baseUrl, self.username, self.password, self.cdp_endpoint,
+                                      category=category, storage_state=self.storage_state)
+            providers = SlotProvider(session.page, session.context, baseUrl=self.baseUrl,
+                                     username=self.username, password=self.password,
+                                     game_filter=self.game_filter, category=category)
+            print(f"📂 Sweeping {category}")
+            results = providers.List_Provisers()
+        except Exception as e:
+            print(f"❌ {category} sweep stopped: {e}")
+        finally:
+            with self._lock:
+                self.results[category] = [dict(r, category=category) for r in results]
+            if session is not None:
+                try:
+                    session.close_Browser()
+                except Exception:
+                    pass
@@ -4,6 +4,16 @@ import datetime
 from tests.base_page import BaseClass
 from playwright.sync_api import Page, BrowserContext
 from pages.recovery_helper import RecoveryHelper
+from utils.rate_limit import throttle_launch
+from utils.waits import wait_for_launch_outcome, LaunchOutcome, LaunchResult, FINAL_SIGNALS
+from utils.waits import CLOSE_BTN, TOAST, BACK_BTN, GAME_IFRAME
+from utils.game_ready import wait_for_game_ready
+from utils.render_probe import BLANK, LOADING
+from utils.exit_strategies import GameExit
+from utils.lobby import PLAY_BTN, GAME_NAME, read_lobby
+from utils.page_jump import PageNavigator, PAGINATION
+from utils.launch_timeouts import budget_ms, record_latency
+from utils.launch_urls import capture_launch_url
 
 class Game_Click(BaseClass):
     def __init__(self, page: Page, context: BrowserContext,
@@ -16,6 +26,12 @@ class Game_Click(BaseClass):
         self.password = password
         self.recovery = recovery if recovery else RecoveryHelper(page, context, baseUrl, username, password)
         self.retried_games = set()
+        self.failure_count = 0
+        self.game_filter = None   # optional callable(provider_name, game_name) → bool, e.g. a ShardFilter
+        self.last_launch = None   # LaunchResult of the most recent "Play Now" click
+        self.lobby_url = None     # page URL just before that click, where exits return to
+        self.catalog = self.recovery.catalog   # GameCatalog from the lobby API, None → read the DOM
+        self.results = []   # one entry per launched game: provider, page, game, status
 
     def get_screenshot_path(self, prefix, provider_name, page_num, game_name):
         dt = datetime.datetime.now().strftime("%d-%m-%y_%H-%M-%S")
@@ -23,42 +39,94 @@ class Game_Click(BaseClass):
         os.makedirs("screenshots", exist_ok=True)
         return f"screenshots/{prefix}_{provider_name}_page{page_num}_{game_safe}_{dt}.png"
 
-    def handle_game_exit(self, game_name: str):
+    def record_result(self, provider_name, page_num, game_name, status, duration_s=None):
+        self.results.append({
+            "provider": provider_name,
+            "page": page_num,
+            "game": game_name,
+            "status": status,
+            "duration_s": duration_s,
+        })
+
+    def recover(self, provider_name, page_num, indexg, game_name, hard_reset=False):
+        """
+        reset_and_recover, then fold the retry into the game's result: the
+        entry gets a "retry" status and one that passed on retry is reported
+        as "passed_on_retry". play_game still returns the first-launch status,
+        which is what the concurrency controller reacts to.
+        """
+        self.recovery.reset_and_recover(provider_name, page_num, indexg, game_name, hard_reset)
+        retry = self.recovery.last_retry
+        entry = self.results[-1] if self.results else None
+        if retry is None or entry is None or entry["game"] != game_name:
+            return
+        entry["retry"] = retry
+        if retry == "passed":
+            entry["status"] = "passed_on_retry"
+
+    def go_back(self, game_name, provider_name=None):
+        """page.go_back() with the provider's learned exit budget; records how long it took."""
+        budget = budget_ms(self.baseUrl, "exit", provider_name, game_name)
+        started = time.time()
+        try:
+            self.page.go_back(timeout=budget)
+        except Exception:
+            record_latency(self.baseUrl, "exit", provider_name, game_name, budget)
+            raise
+        record_latency(self.baseUrl, "exit", provider_name, game_name, (time.time() - started) * 1000)
+
+    def handle_game_exit(self, game_name: str, hold_seconds=10, provider_name=None):
         """
         Shared safe method for closing games / handling toast popups.
         - Waits for iframe/game to actually load before closing.
-        - Falls back to go_back() if stale element.
+        - Closes as soon as pixel samples show the game rendered (utils/render_probe.py);
+          hold_seconds is only the upper bound.
+        - A game still blank or on its loading screen at the end counts as failed.
+        - Exits through utils/exit_strategies.py: the close button, then SPA back,
+          then go_back(); a lobby still not intact counts as failed so recovery runs.
+        - Iframe and go_back() budgets are learned per provider (utils/launch_timeouts.py).
         """
-        close_btn_selector = "//button/*[@class='w-5 h-5 game_header_close_btn']"
-        toast_selector = "//div[@class='toast-message text-sm' and contains(text(),'Something went wrong')]"
-        back_btn_selector = "//button[text()='Back To Home']"
-        iframe_selector = "//iframe[contains(@class,'game_iframe')]"   # adjust if you have a stable locator
-        common_image_xpath = "//img"  # or a known loading element inside iframe
+        close_btn_selector = CLOSE_BTN
+        toast_selector = TOAST
+        back_btn_selector = BACK_BTN
+        iframe_selector = GAME_IFRAME
 
         try:
             # ✅ Case 1: Close button visible
             if self.page.is_visible(close_btn_selector):
                 print(f"⏳ Close button detected for {game_name}, waiting for game iframe...")
+                iframe_budget = budget_ms(self.baseUrl, "iframe", provider_name, game_name)
+                iframe_started = time.time()
                 try:
-                    # Wait for iframe or game image (so we know it really loaded)
-                    self.page.wait_for_selector(iframe_selector, timeout=15000)
-                    self.page.wait_for_selector(common_image_xpath, timeout=15000)
-                    print("Success: {game_name}")
+                    self.page.wait_for_selector(iframe_selector, state="attached", timeout=iframe_budget)
+                    record_latency(self.baseUrl, "iframe", provider_name, game_name, (time.time() - iframe_started) * 1000)
                 except Exception:
+                    record_latency(self.baseUrl, "iframe", provider_name, game_name, iframe_budget)
                     print(f"⚠ Game iframe not detected for {game_name}, continuing anyway.")
 
-                print(f"⏳ Waiting 10s before closing {game_name}...")
-                time.sleep(10)
+                rendered = True
+                if hold_seconds > 0:
+                    ready, elapsed, signals = wait_for_game_ready(self.page, iframe_selector, max_wait_s=hold_seconds)
+                    if ready:
+                        print(f"🎮 {game_name} ready after {elapsed:.1f}s ({signals.get('render') or 'load signals'})")
+                    else:
+                        missing = [k for k in ("loaded", "quiet", "canvas", "painted") if not signals.get(k)]
+                        print(f"⏳ {game_name} not ready after {elapsed:.0f}s (missing: {', '.join(missing) or 'iframe'}), closing")
+                    # a black or spinner screen behind a visible close button is not a pass
+                    if signals.get("render") in (BLANK, LOADING):
+                        print(f"❌ {game_name} never rendered (screen still {signals['render']})")
+                        rendered = False
 
-                try:
-                    self.page.click(close_btn_selector, timeout=5000)
-                    print(f"✅ Closed {game_name}")
-                    return True
-                except Exception:
-                    print(f"⚠ Close btn failed (stale) → using page.go_back()")
-                    self.page.go_back(timeout=20000)
-                    print(f"✅ Closed {game_name}")
-                    return True
+                # close button first, SPA back and go_back() only if the lobby is not restored
+                game_exit = GameExit(self.page, self.lobby_url, close_btn_selector, iframe_selector,
+                                     go_back=lambda: self.go_back(game_name, provider_name))
+                exited = game_exit.exit()
+                if not exited.intact:
+                    # a lobby left in a bad state breaks every later game on this page: recover
+                    print(f"❌ Could not get back to an intact lobby from {game_name} (tried {', '.join(exited.tried)})")
+                    return False
+                print(f"✅ Closed {game_name} via {exited.strategy} in {exited.latency_ms} ms")
+                return rendered
 
             # ✅ Case 2: Toast error visible
             elif self.page.is_visible(toast_selector):
@@ -72,159 +140,188 @@ class Game_Click(BaseClass):
                         return False
                     else:
                         print(f"⚠ Back button not visible, fallback go_back()")
-                        self.page.go_back(timeout=20000)
+                        self.go_back(game_name, provider_name)
                         print("Failed: {game_name}")
                         return False
                 except Exception:
                     print(f"⚠ Back btn failed (stale) → using page.go_back()")
-                    self.page.go_back(timeout=20000)
+                    self.go_back(game_name, provider_name)
                     return False
 
             # ✅ Case 3: Neither close nor toast found
             else:
                 print(f"⚠ No close/back/toast found → fallback page.go_back() for {game_name}")
-                self.page.go_back(timeout=20000)
+                self.go_back(game_name, provider_name)
                 return True
 
         except Exception as e:
             print(f"⚠ handle_game_exit error for {game_name}: {e}")
             try:
-                self.page.go_back(timeout=20000)
+                self.go_back(game_name, provider_name)
                 return True
             except:
                 return False
 
     def GamesbtnClick(self, provider_name=None):
-        Total_Pages = self.page.query_selector_all(
-            "//div[@class='p-holder admin-pagination']/button[not(contains(@class,'p-next')) and not(contains(@class,'p-prev'))]"
-        )
-        last_page_num = int(Total_Pages[-1].text_content()) if Total_Pages else 1
-        print(f"Last page num is: {last_page_num}")
+        """
+        Every game of the open provider, page by page.
+        With a GameCatalog the names come from the lobby API (utils/game_catalog.py)
+        as long as its page count matches the live pagination; the grid is
+        only read to confirm it still matches.
+        """
+        lobby = read_lobby(self.page)
+        last_page_num = lobby.pages[-1] if lobby.pages else 1
+        catalog_games = []
+        if self.catalog and self.catalog.check_pages(provider_name, last_page_num):
+            catalog_games = self.catalog.games(provider_name)
+            print(f"Last page num is: {last_page_num} ({len(catalog_games)} games in catalog)")
+        else:
+            print(f"Last page num is: {last_page_num}")
 
-        failure_count = 0
+        self.failure_count = 0
 
         for current_page in range(1, last_page_num + 1):
             print(f"=== Now in Page {current_page} ===")
-            time.sleep(2)
 
-            Game_buttons = self.page.query_selector_all(
-                "//div[@class='game_btn_content']//button[text()='Play Now']"
-            )
-            TotalGames = len(Game_buttons)
+            # names and button count for the whole page in one round trip
+            lobby = read_lobby(self.page)
+            names = [g.name for g in catalog_games if g.page == current_page] or lobby.games
+            if catalog_games and names != lobby.games:
+                print(f"⚠ Page {current_page} differs from the catalog, using the lobby's game names")
+                names = lobby.games
+            TotalGames = lobby.play_buttons
             print(f"Total Game: {TotalGames}")
 
             for indexg in range(TotalGames):
-                try:
-                    game_button_locator = self.page.locator(
-                        "(//div[@class='game_btn_content']//button[text()='Play Now'])"
-                    ).nth(indexg)
-                    game_name_locator = self.page.locator(
-                        "(//div[@class='game_btn_content_text'])"
-                    ).nth(indexg)
-                    Gamename = game_name_locator.text_content().strip()
-
-                    game_key = f"{provider_name}_{current_page}_{indexg}"
-                    if game_key in self.retried_games:
-                        continue
+                game_name = names[indexg] if indexg < len(names) else None
+                self.play_game(provider_name, current_page, indexg, game_name)
 
-                    # Try to click Play Now
-                    for attempt in range(3):
-                        try:
-                            game_button_locator.wait_for(state="visible", timeout=15000)
-                            game_button_locator.scroll_into_view_if_needed()
-                            time.sleep(1)
-                            game_button_locator.click()
-                            break
-                        except:
-                            time.sleep(1)
-                            if attempt == 2:
-                                raise
-
-                    # wait until either close_btn or toast_msg appears
-                    close_btn = "//button/*[@class='w-5 h-5 game_header_close_btn']"
-                    toast_msg = "//div[@class='toast-message text-sm' and text()='Something went wrong. Try again later.']"
-
-                    for _ in range(30):
-                        if self.page.is_visible(close_btn) or self.page.is_visible(toast_msg):
-                            break
-                        time.sleep(2)
-                    else:
-                        screenshot_path = self.get_screenshot_path("timeout", provider_name, current_page, Gamename)
-                        self.page.screenshot(path=screenshot_path)
-                        print(f"⚠ Timeout for {Gamename}")
-                        self.retried_games.add(game_key)
-                        self.recovery.reset_and_recover(provider_name, current_page, indexg, Gamename, hard_reset=False)
-                        continue
-
-                    # ✅ use the new safe exit handler
-                    result = self.handle_game_exit(Gamename)
-                    if result is False:
-                        failure_count += 1
-                        self.retried_games.add(game_key)
-                        hard_reset = failure_count % 5 == 0
-                        self.recovery.reset_and_recover(provider_name, current_page, indexg, Gamename, hard_reset)
-
-                    time.sleep(2.5)
-                    if current_page > 1:
-                        self.click_page_number(current_page)
-
-                    if failure_count >= 15:
-                        print("❌ Too many failures → skipping provider")
-                        return
-
-                except Exception as e:
-                    screenshot_path = self.get_screenshot_path("error", provider_name, current_page, Gamename)
-                    self.page.screenshot(path=screenshot_path)
-                    print(f"❌ Error on {Gamename}: {e}")
-                    time.sleep(5)
-                    self.retried_games.add(game_key)
-                    self.recovery.reset_and_recover(provider_name, current_page, indexg, Gamename, hard_reset=False)
+                if self.failure_count >= 15:
+                    print("❌ Too many failures → skipping provider")
+                    return
 
             if current_page < last_page_num:
                 self.click_page_number(current_page + 1)
-                time.sleep(3)
+
+    def wait_for_launch(self, timeout_ms):
+        """
+        First launch signal after a "Play Now" click. An attached iframe or a
+        navigation only means the game is on its way, so the rest of the budget
+        is spent waiting for its close button or an error toast.
+        """
+        launch = wait_for_launch_outcome(self.page, timeout_ms)
+        if launch.outcome in (LaunchOutcome.IFRAME, LaunchOutcome.NAVIGATION):
+            rest = wait_for_launch_outcome(self.page, max(0, timeout_ms - launch.latency_ms), signals=FINAL_SIGNALS)
+            launch = LaunchResult(rest.outcome, launch.latency_ms + rest.latency_ms)
+        self.last_launch = launch
+        return launch
+
+    def play_game(self, provider_name, current_page, indexg, game_name=None):
+        """
+        Launch, verify and close one game on the current lobby page.
+        game_name comes from the page snapshot when the caller has one;
+        otherwise it is read from the card.
+        Returns the recorded status, or None if the game was already retried
+        or is filtered out (e.g. belongs to another shard).
+        Leaves the lobby back on current_page afterwards.
+        """
+        Gamename = f"game {indexg+1}"
+        game_key = f"{provider_name}_{current_page}_{indexg}"
+        if game_key in self.retried_games:
+            return None
+
+        try:
+            game_button_locator = self.page.locator(PLAY_BTN).nth(indexg)
+            Gamename = game_name or self.page.locator(GAME_NAME).nth(indexg).text_content().strip()
+            if self.game_filter and not self.game_filter(provider_name, Gamename):
+                return None
+
+            # Try to click Play Now (paced by the brand's launch limit, if any)
+            throttle_launch(self.baseUrl)
+            self.lobby_url = self.page.url
+            started = time.time()
+            for attempt in range(3):
+                try:
+                    game_button_locator.wait_for(state="visible", timeout=15000)
+                    game_button_locator.scroll_into_view_if_needed()
+                    time.sleep(1)
+                    game_button_locator.click()
+                    break
+                except:
+                    time.sleep(1)
+                    if attempt == 2:
+                        raise
+
+            # race close button / toast / iframe / navigation within the provider's learned budget
+            budget = budget_ms(self.baseUrl, "launch", provider_name, Gamename)
+            launch = self.wait_for_launch(budget)
+            print(f"⏱ {Gamename}: {launch.outcome.value} after {launch.latency_ms} ms (budget {budget} ms)")
+            # only launches that opened teach the budget: fast error toasts would shrink it
+            if launch.outcome in (LaunchOutcome.CLOSE_BUTTON, LaunchOutcome.IFRAME):
+                record_latency(self.baseUrl, "launch", provider_name, Gamename, launch.latency_ms)
+            elif launch.outcome is LaunchOutcome.TIMEOUT:
+                record_latency(self.baseUrl, "launch", provider_name, Gamename, budget)
+            if launch.outcome is LaunchOutcome.TIMEOUT:
+                screenshot_path = self.get_screenshot_path("timeout", provider_name, current_page, Gamename)
+                self.page.screenshot(path=screenshot_path)
+                print(f"⚠ Timeout for {Gamename}")
+                self.record_result(provider_name, current_page, Gamename, "timeout", round(time.time() - started, 1))
+                self.retried_games.add(game_key)
+                self.recover(provider_name, current_page, indexg, Gamename, hard_reset=False)
+                return "timeout"
+
+            if launch.outcome is LaunchOutcome.CLOSE_BUTTON:
+                capture_launch_url(self.page, self.baseUrl, provider_name, Gamename, self.lobby_url)
+
+            # ✅ use the new safe exit handler
+            result = self.handle_game_exit(Gamename, provider_name=provider_name)
+            status = "failed" if result is False else "passed"
+            self.record_result(provider_name, current_page, Gamename, status, round(time.time() - started, 1))
+            if result is False:
+                self.failure_count += 1
+                self.retried_games.add(game_key)
+                hard_reset = self.failure_count % 5 == 0
+                self.recover(provider_name, current_page, indexg, Gamename, hard_reset)
+
+            time.sleep(2.5)
+            if current_page > 1:
+                self.click_page_number(current_page)
+            return status
+
+        except Exception as e:
+            screenshot_path = self.get_screenshot_path("error", provider_name, current_page, Gamename)
+            self.page.screenshot(path=screenshot_path)
+            print(f"❌ Error on {Gamename}: {e}")
+            self.record_result(provider_name, current_page, Gamename, "error")
+            time.sleep(5)
+            self.retried_games.add(game_key)
+            self.recover(provider_name, current_page, indexg, Gamename, hard_reset=False)
+            return "error"
 
     def click_page_number(self, target_page: int):
+        """
+        Bring the lobby to target_page in a bounded number of actions
+        (utils/page_jump.py): a visible button, a page input, URL or component
+        state when the lobby has one, otherwise hops through the nearest visible number.
+        """
         print(f"🔹 Attempting to go to page {target_page}")
+        navigator = PageNavigator(self.page)
         for attempt in range(3):
             try:
-                pagination_container = self.page.locator("//div[@class='p-holder admin-pagination']")
+                pagination_container = self.page.locator(PAGINATION)
                 if pagination_container.is_visible():
                     pagination_container.scroll_into_view_if_needed()
-                time.sleep(1)
-
-                page_buttons = self.page.query_selector_all(
-                    "//div[@class='p-holder admin-pagination']/button[not(contains(@class,'p-next')) and not(contains(@class,'p-prev'))]"
-                )
-
-                if not page_buttons:
-                    print(f"⚠ Attempt {attempt+1}: no pagination buttons")
-                    time.sleep(2)
-                    continue
-
-                max_visible = len(page_buttons)
-                if target_page <= max_visible:
-                    btn = page_buttons[target_page - 1]
-                    btn.scroll_into_view_if_needed()
-                    btn.click()
-                    time.sleep(1)
-                    return True
+                else:
+                    try:
+                        pagination_container.wait_for(state="visible", timeout=2000)
+                    except Exception:
+                        print(f"⚠ Attempt {attempt+1}: no pagination buttons")
+                        continue
 
-                while True:
-                    anchor_btn = page_buttons[-1]
-                    anchor_btn.scroll_into_view_if_needed()
-                    anchor_btn.click()
-                    time.sleep(1.5)
-                    page_buttons = self.page.query_selector_all(
-                        "//div[@class='p-holder admin-pagination']/button[not(contains(@class,'p-next')) and not(contains(@class,'p-prev'))]"
-                    )
-                    if target_page <= len(page_buttons):
-                        btn = page_buttons[target_page - 1]
-                        btn.scroll_into_view_if_needed()
-                        btn.click()
-                        time.sleep(1)
-                        print(f"✅ Clicked hidden page {target_page}")
-                        return True
+                if navigator.jump(target_page):
+                    print(f"✅ On page {target_page} after {navigator.actions} action(s)")
+                    return True
+                print(f"⚠ Attempt {attempt+1}: page {target_page} not reached after {navigator.actions} action(s)")
 
             except Exception as e:
                 print(f"⚠ Attempt {attempt+1} failed: {e}")
@@ -1,20 +1,29 @@
 import time
 from tests.base_page import BaseClass
+from utils.locators import selector
 
 # pages/home_page.py
 class HomePage(BaseClass):
     def click_Slot(self):
-        self.page.wait_for_selector("//a[text()=' Slot']",timeout=12000).click()
+        self.page.wait_for_selector(selector("menu_slot"),timeout=12000).click()
         time.sleep(1)
     def home_slot(self):
-        self.page.wait_for_selector("//a[text()=' Home']",timeout=12000).hover()
+        self.page.wait_for_selector(selector("menu_home"),timeout=12000).hover()
         time.sleep(1)
     def click_Fish(self):
-        self.page.wait_for_selector("//a[text()=' Fishing']",timeout=12000).click()
+        self.page.wait_for_selector(selector("menu_fishing"),timeout=12000).click()
         time.sleep(1)
     def click_Card(self):
-        self.page.wait_for_selector("//a[text()=' Card Game']",timeout=12000).click()
+        self.page.wait_for_selector(selector("menu_card_game"),timeout=12000).click()
         time.sleep(1)
     def click_Instawin(self): 
-        self.page.wait_for_selector("//a[text()=' Instant Win']",timeout=12000).click()
-        time.sleep(1)
\ No newline at end of file
+        self.page.wait_for_selector(selector("menu_instant_win"),timeout=12000).click()
+        time.sleep(1)
+    def click_category(self, category):
+        """Open a lobby category by its menu name: Slot, Fishing, Card Game or Instant Win."""
+        {
+            "Slot": self.click_Slot,
+            "Fishing": self.click_Fish,
+            "Card Game": self.click_Card,
+            "Instant Win": self.click_Instawin,
+        }[category]()
\ No newline at end of file
@@ -1,36 +1,82 @@
 import time
 from playwright.sync_api import TimeoutError
 from tests.base_page import BaseClass
+from utils.waits import wait_for_any_visible
+from utils.popups import install_popup_handlers, popup_handlers, MISSION_CLOSE, LOGIN_MODAL_CLOSE
+from utils.locators import selector
+
+LOGIN_BTN = selector("login_open")
+LOGIN_MODAL = selector("login_modal")
+USERNAME_INPUT = selector("login_username")
+PASSWORD_INPUT = selector("login_password")
+LOGIN_SUBMIT = selector("login_submit")
+
+# Primary success signal: the header Login button and the auth modal are both gone
+LOGIN_GONE = {
+    "login_closed": [LOGIN_BTN, LOGIN_MODAL],
+}
+# Also means the session is authenticated, when the brand shows it. No balance
+# marker: jackpot and promo widgets carry balance-like classes before login too.
+AUTH_MARKERS = {
+    "logout": selector("logout"),
+}
+# The message line of a still-open login modal; checked after the success markers
+LOGIN_ERRORS = {
+    "error": selector("login_error"),
+}
+SESSION_COOKIE_HINTS = ("token", "session", "auth", "sid")
+
 
 class Login(BaseClass):
-    def login(self, username, password, max_attempts=2):
+    def login(self, username, password, max_attempts=2, timeout_ms=15000):
         """
         Login with retry if initial login modal fails.
         Steps:
         1. Click 'Login' button to open modal.
         2. Enter username & password.
         3. Click 'Login' inside modal.
-        4. If any step fails, close modal and retry once.
+        4. Wait for the Login button and modal to disappear (or a Logout button or
+           new session cookie) and return True the moment they do.
+        5. An error message in the still-open modal returns False straight away;
+           a missing modal or no marker in time closes the modal and retries once.
         """
+        handlers = popup_handlers(self.page)
+        if handlers:
+            handlers.login_in_progress = True   # keep the auto-dismiss handler off our own modal
+        try:
+            return self._login(username, password, max_attempts, timeout_ms)
+        finally:
+            if handlers:
+                handlers.login_in_progress = False
+
+    def _login(self, username, password, max_attempts, timeout_ms):
         attempt = 1
         while attempt <= max_attempts:
             try:
                 # Open login modal
-                login_btn = self.page.locator("//div[@class='flex items-center gap-2 mr-2 flex-row-reverse']//button[text()='Login']")
+                login_btn = self.page.locator(LOGIN_BTN)
                 login_btn.wait_for(state="visible", timeout=12000)
                 login_btn.click()
-                time.sleep(1)
 
                 # Fill username & password
-                self.page.wait_for_selector("//input[@placeholder='Enter Your Username']", timeout=12000).fill(username)
-                time.sleep(0.5)
-                self.page.wait_for_selector("//input[@placeholder='Password']", timeout=12000).fill(password)
-
-                # Click Login
-                self.page.wait_for_selector("//div[@class='relative flex justify-center']/button[text()='Login']", timeout=12000).click()
-                time.sleep(2)
-                
-                # print(f"✅ Login successful on attempt {attempt}")  # for now when necessary i will again uncomment it.
+                self.page.wait_for_selector(USERNAME_INPUT, timeout=12000).fill(username)
+                self.page.wait_for_selector(PASSWORD_INPUT, timeout=12000).fill(password)
+
+                # Click Login and wait for the outcome instead of a fixed pause
+                cookies_before = {c["name"] for c in self.page.context.cookies()}
+                started = time.time()
+                self.page.wait_for_selector(LOGIN_SUBMIT, timeout=12000).click()
+                outcome = self.wait_for_login_outcome(cookies_before, timeout_ms)
+                elapsed_ms = round((time.time() - started) * 1000)
+
+                if outcome in LOGIN_ERRORS:
+                    message = self.page.locator(LOGIN_ERRORS[outcome]).first.text_content() or ""
+                    print(f"❌ Login rejected: {message.strip()}")
+                    return False
+                if outcome is None:
+                    raise TimeoutError(f"no authenticated marker within {timeout_ms} ms")
+
+                print(f"🔑 Logged in ({outcome} after {elapsed_ms} ms)")
                 return True
 
             except TimeoutError as e:
@@ -39,10 +85,10 @@ class Login(BaseClass):
 
                 # Try to close login modal if open
                 try:
-                    close_modal_btn = self.page.locator("//div[@class='relative auth-skin']/button[@class='absolute top-[22px] right-[20px]']/img']")
+                    close_modal_btn = self.page.locator(LOGIN_MODAL_CLOSE)
                     if close_modal_btn.is_visible():
                         close_modal_btn.click()
-                        time.sleep(1)
+                        self.page.locator(LOGIN_MODAL).wait_for(state="hidden", timeout=3000)
                         print("ℹ Login modal closed, retrying...")
                 except Exception:
                     print("ℹ No login modal to close, retrying...")
@@ -50,13 +96,37 @@ class Login(BaseClass):
         print("❌ Login failed after retries")
         return False
 
+    def wait_for_login_outcome(self, cookies_before, timeout_ms):
+        """
+        Race the login signals after submitting the modal.
+        Returns "login_closed", "logout", "error", "cookie", or None on timeout.
+        Success markers win over the error one when both show. DOM markers resolve
+        from a MutationObserver; cookies (HttpOnly ones included) are checked
+        from the context between short observer slices.
+        """
+        markers = {**AUTH_MARKERS, **LOGIN_ERRORS}
+        deadline = time.time() + timeout_ms / 1000
+        while time.time() < deadline:
+            slice_ms = min(500, max(1, (deadline - time.time()) * 1000))
+            outcome = wait_for_any_visible(self.page, markers, slice_ms, gone=LOGIN_GONE)
+            if outcome:
+                return outcome
+            new_cookies = {c["name"] for c in self.page.context.cookies()} - cookies_before
+            if any(hint in name.lower() for name in new_cookies for hint in SESSION_COOKIE_HINTS):
+                return "cookie"
+        return None
+
     def Close_Popupbtnscal(self):
-        """Close any daily mission popups if present."""
+        """
+        Register auto-dismiss handlers for the mission dialog, promo modals and
+        a stray login modal (utils/popups.py). They fire right before any action
+        the popup would block, so this no longer waits for a popup that may not come.
+        Falls back to the old one-off probe on Playwright versions without add_locator_handler.
+        """
+        if install_popup_handlers(self.page):
+            return
         try:
-            self.page.wait_for_selector(
-                "//div[@style='max-width:600px;']/div/button[@class='mission_daily_close_btn']/img",
-                timeout=3000
-            ).click()
+            self.page.wait_for_selector(MISSION_CLOSE, timeout=3000).click()
             time.sleep(1)
         except:
-            pass
\ No newline at end of file
+            pass
@@ -0,0 +1,199 @@
+import queue
+import threading
+from pages.login_page import Login
+from pages.home_page import HomePage
+from pages.game_page import Game_Click
+from pages.recovery_helper import RecoveryHelper
+from utils.logger import Logger
+from utils.work_queue import WorkStealingQueue
+from utils.lobby import click_provider
+
+
+def open_session(baseUrl, username, password, cdp_endpoint=None, category="Slot", storage_state=None,
+                 catalog=None):
+    """
+    Logged-in lobby on the given category tab, ready for Game_Click.
+    Attaches a new context to a shared browser when cdp_endpoint is given,
+    otherwise starts a browser of its own. With storage_state the context
+    reuses an existing login instead of logging in again. catalog is a
+    GameCatalog shared with the recovery helper and Game_Click (read-only).
+    """
+    session = Login(baseUrl)
+    if cdp_endpoint:
+        session.Attach_Browser(cdp_endpoint, storage_state=storage_state)
+    else:
+        session.Start_Browser()
+    session.launch_url()
+    if storage_state is None:
+        session.login(username, password)
+    session.Close_Popupbtnscal()
+
+    home_page = HomePage()
+    home_page.page = session.page
+    home_page.click_category(category)
+    home_page.home_slot()
+
+    recovery = RecoveryHelper(session.page, session.context, baseUrl, username, password, category)
+    recovery.catalog = catalog
+    game_page = Game_Click(session.page, session.context, baseUrl, username, password, recovery=recovery)
+    return session, game_page
+
+
+def move_to_item(game_page, position, item):
+    """
+    Bring the lobby to item's provider and page, starting from position
+    (the (provider, page) currently shown, or None if unknown).
+    Returns the new position, or None if the provider was not found.
+    """
+    if position == (item.provider, item.page):
+        return position
+    if position is None or position[0] != item.provider:
+        if not ParallelSweep.open_provider(game_page.page, item.provider):
+            return None
+        if item.page > 1:
+            game_page.click_page_number(item.page)
+    else:
+        game_page.click_page_number(item.page)
+    return (item.provider, item.page)
+
+
+class ParallelSweep:
+    """
+    Sweep the catalog with N logged-in contexts hosted by one browser.
+    Steps:
+    1. Each worker thread attaches its own context over CDP and logs in.
+    2. run_items: workers take (provider, page, index, name) items from a
+       work-stealing queue, so one huge provider is shared by every worker.
+       run: workers pull whole providers from a queue (used by tab mode).
+    3. Each worker drives its own Game_Click + RecoveryHelper.
+    """
+    def __init__(self, cdp_endpoint, baseUrl, username, password, workers=2, tabs=1, game_filter=None,
+                 controller=None, category="Slot", catalog=None):
+        self.cdp_endpoint = cdp_endpoint
+        self.baseUrl = baseUrl
+        self.username = username
+        self.password = password
+        self.workers = workers
+        self.tabs = tabs
+        self.game_filter = game_filter
+        self.controller = controller   # AIMDController: caps how many workers launch at once
+        self.category = category
+        self.catalog = catalog         # GameCatalog every worker's recovery and Game_Click read
+        self.results = []
+        self._lock = threading.Lock()
+
+    def run(self, provider_names):
+        work = queue.Queue()
+        for name in provider_names:
+            work.put(name)
+        self._run_threads(self._provider_worker, work, min(self.workers, len(provider_names)))
+        return self.results
+
+    def run_items(self, items):
+        work = WorkStealingQueue(min(self.workers, len(items)) or 1)
+        work.distribute(items)
+        print(f"📦 {len(items)} games queued for {len(work.backlogs)} workers")
+        self._run_threads(self._item_worker, work, len(work.backlogs))
+        print(f"🔀 Work stolen {work.steals} times")
+        if self.controller:
+            print(f"📊 Concurrency metrics: {self.controller.snapshot()}")
+        return self.results
+
+    def _run_threads(self, target, work, count):
+        threads = [
+            threading.Thread(target=target, args=(worker_id, work), name=f"sweep-{worker_id}")
+            for worker_id in range(count)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        Logger.log_summary(self.results, "Parallel sweep summary")
+
+    def _provider_worker(self, worker_id, work):
+        session = None
+        try:
+            session, game_page = open_session(self.baseUrl, self.username, self.password, self.cdp_endpoint,
+                                              self.category, catalog=self.catalog)
+            game_page.game_filter = self.game_filter
+
+            while True:
+                try:
+                    provider_name = work.get_nowait()
+                except queue.Empty:
+                    break
+
+                print(f"🎰 [worker {worker_id}] Provider: {provider_name}")
+                if not self.open_provider(session.page, provider_name):
+                    print(f"⚠ [worker {worker_id}] Provider {provider_name} not found, skipping")
+                    continue
+
+                done = len(game_page.results)
+                try:
+                    if self.tabs > 1:
+                        from pages.tab_launcher import TabLauncher
+                        TabLauncher(game_page, tabs=self.tabs).run_provider(provider_name)
+                    else:
+                        game_page.GamesbtnClick(provider_name)
+                except Exception as e:
+                    print(f"❌ [worker {worker_id}] {provider_name} aborted: {e}")
+                finally:
+                    with self._lock:
+                        self.results.extend(game_page.results[done:])
+
+        except Exception as e:
+            print(f"❌ [worker {worker_id}] stopped: {e}")
+        finally:
+            self._close_session(session)
+
+    def _item_worker(self, worker_id, work):
+        session = None
+        position = None   # (provider, page) the lobby is currently showing
+        try:
+            session, game_page = open_session(self.baseUrl, self.username, self.password, self.cdp_endpoint,
+                                              self.category, catalog=self.catalog)
+
+            while True:
+                item = work.get(worker_id)
+                if item is None:
+                    break
+
+                position = move_to_item(game_page, position, item)
+                if position is None:
+                    print(f"⚠ [worker {worker_id}] Provider {item.provider} not found, skipping {item.name}")
+                    continue
+
+                print(f"🎮 [worker {worker_id}] {item.provider} → Page {item.page} → {item.name}")
+                done = len(game_page.results)
+                try:
+                    if self.controller:
+                        with self.controller.slot():
+                            status = game_page.play_game(item.provider, item.page, item.index)
+                        self.controller.record(status)
+                    else:
+                        game_page.play_game(item.provider, item.page, item.index)
+                except Exception as e:
+                    print(f"❌ [worker {worker_id}] {item.name} aborted: {e}")
+                    position = None
+                finally:
+                    with self._lock:
+                        self.results.extend(game_page.results[done:])
+
+        except Exception as e:
+            print(f"❌ [worker {worker_id}] stopped: {e}")
+        finally:
+            self._close_session(session)
+
+    @staticmethod
+    def _close_session(session):
+        if session is None:
+            return
+        try:
+            session.close_Browser()
+        except Exception:
+            pass
+
+    @staticmethod
+    def open_provider(page, provider_name):
+        return click_provider(page, provider_name)
@@ -3,14 +3,23 @@ import time
 import datetime
 from tests.base_page import BaseClass
 from playwright.sync_api import Page, BrowserContext
+from utils.rate_limit import throttle_launch
+from utils.launch_timeouts import budget_ms
+from utils.lobby import PLAY_BTN, read_lobby, click_provider
+from utils.waits import LaunchOutcome
+from utils.launch_urls import launch_direct, capture_launch_url, EXPIRED
 
 class RecoveryHelper(BaseClass):
-    def __init__(self, page: Page, context: BrowserContext, baseUrl: str, username: str, password: str):
+    def __init__(self, page: Page, context: BrowserContext, baseUrl: str, username: str, password: str,
+                 category: str = "Slot"):
         self.page = page
+        self.category = category
         self.context = context
         self.baseUrl = baseUrl
         self.username = username
         self.password = password
+        self.catalog = None   # GameCatalog: where else to look when a game is not on its page any more
+        self.last_retry = None   # "passed"/"failed"/"timeout" of the last retried game, None if not retried
 
     def get_screenshot_path(self, prefix, provider_name, page_num, game_name):
         dt = datetime.datetime.now().strftime("%d-%m-%y_%H-%M-%S")
@@ -19,6 +28,7 @@ class RecoveryHelper(BaseClass):
         return f"screenshots/{prefix}_{provider_name}_page{page_num}_{game_safe}_{dt}.png"
 
     def reset_and_recover(self, provider_name, page_num, game_index, game_name, hard_reset=True):
+        self.last_retry = None
         print(f"🔄 Resetting session ({'HARD' if hard_reset else 'LIGHT'}) → {provider_name} → Page {page_num} → {game_name}")
 
         screenshot_path = self.get_screenshot_path("reset", provider_name, page_num, game_name)
@@ -51,14 +61,14 @@ class RecoveryHelper(BaseClass):
                 return None, None
 
             from pages.login_page import Login
-            from pages.home_page import HomePage
 
             login_page = Login(self.baseUrl)
             login_page.page = self.page
             success_login = False
             for attempt in range(3):
                 try:
-                    login_page.login(self.username, self.password)
+                    if not login_page.login(self.username, self.password):
+                        raise RuntimeError("login not confirmed")
                     login_page.Close_Popupbtnscal()
                     success_login = True
                     break
@@ -69,42 +79,112 @@ class RecoveryHelper(BaseClass):
                 print(f"❌ Login failed after 3 attempts.")
                 return None, None
 
-            home_page = HomePage()
-            home_page.page = self.page
-            home_page.click_Slot()
-            home_page.home_slot()
-
-            # Select provider button
-            provider_buttons = self.page.query_selector_all(
-                "//div[@class='mt-5 flex items-center slot_btn_container w-full overflow-auto light-scrollbar-h pb-[10px]']//button"
-            )
-            for btn in provider_buttons:
-                if btn.text_content().strip() == provider_name:
-                    btn.scroll_into_view_if_needed()
-                    btn.click()
-                    break
+        # Retry game: straight from its captured launch URL when there is one.
+        # After a hard reset that comes before the category → provider → page walk,
+        # which is only needed to hand the lobby back to the caller.
+        if self.retry_direct(provider_name, game_name):
+            if hard_reset:
+                self.open_game_page(provider_name, page_num)
+            return self.page, self.context
+        if hard_reset:
+            self.open_game_page(provider_name, page_num)
+        self.retry_in_lobby(provider_name, page_num, game_index, game_name)
+        return self.page, self.context
+
+    def open_game_page(self, provider_name, page_num):
+        """Category → provider → page, from wherever the logged-in lobby is."""
+        from pages.home_page import HomePage
 
-            # ✅ Pagination with Game_Click
-            if page_num > 1:
-                from pages.game_page import Game_Click
-                game_click = Game_Click(self.page, self.context, self.baseUrl, self.username, self.password, recovery=self)
-                game_click.click_page_number(page_num)
+        home_page = HomePage()
+        home_page.page = self.page
+        home_page.click_category(self.category)
+        home_page.home_slot()
+
+        # Select provider button
+        click_provider(self.page, provider_name)
+
+        # ✅ Pagination with Game_Click
+        if page_num > 1:
+            from pages.game_page import Game_Click
+            game_click = Game_Click(self.page, self.context, self.baseUrl, self.username, self.password, recovery=self)
+            game_click.click_page_number(page_num)
 
-        # Retry game
-        game_buttons = self.page.query_selector_all("//div[@class='game_btn_content']//button[text()='Play Now']")
-        if game_index < len(game_buttons):
-            retry_btn = game_buttons[game_index]
+    def retry_direct(self, provider_name, game_name):
+        """
+        Open the game from its captured launch URL in a fresh tab (utils/launch_urls.py).
+        The lobby tab is not touched. False when there is no URL or it has expired.
+        """
+        status, seconds = launch_direct(self.context, self.baseUrl, provider_name, game_name)
+        if status in (None, EXPIRED):
+            return False
+        self.last_retry = status
+        print(f"🔁 Retried {game_name} on {provider_name} directly in {seconds}s: {status}")
+        return True
+
+    def find_in_lobby(self, provider_name, page_num, game_name):
+        """
+        Card index of game_name on the current lobby page. When the grid has
+        shifted it off that page, the catalog's page is tried next.
+        Returns (page the lobby is on now, index), index None when the game is not found.
+        """
+        lobby = read_lobby(self.page)
+        if game_name in lobby.games:
+            return page_num, lobby.games.index(game_name)
+        spot = self.catalog.locate(provider_name, game_name) if self.catalog else None
+        if spot and spot.page != page_num:
+            print(f"🔎 {game_name} not on page {page_num}, trying catalog page {spot.page}")
+            from pages.game_page import Game_Click
+            game_click = Game_Click(self.page, self.context, self.baseUrl, self.username, self.password, recovery=self)
+            game_click.click_page_number(spot.page)
+            lobby = read_lobby(self.page)
+            return spot.page, lobby.games.index(game_name) if game_name in lobby.games else None
+        return page_num, None
+
+    def retry_in_lobby(self, provider_name, page_num, game_index, game_name):
+        """
+        Click the game's "Play Now" on the current lobby page, found by name (skipped if it is gone).
+        Leaves the lobby on page_num, even when the game was found on its catalog page.
+        """
+        found_page, game_index = self.find_in_lobby(provider_name, page_num, game_name)
+        if game_index is None:
+            print(f"⚠ {game_name} not found in the {provider_name} lobby, retry skipped")
+        elif game_index < read_lobby(self.page).play_buttons:
+            retry_btn = self.page.locator(PLAY_BTN).nth(game_index)
             retry_btn.scroll_into_view_if_needed()
             retry_btn.hover()
             time.sleep(1.5)
+            throttle_launch(self.baseUrl)
+            lobby_url = self.page.url
             retry_btn.click()
-            print(f"🔁 Retried {game_name} on {provider_name} page {page_num}")
+            print(f"🔁 Retried {game_name} on {provider_name} page {found_page}")
 
             # ✅ Use shared safe exit logic from Game_Click
             from pages.game_page import Game_Click
             temp_game_click = Game_Click(self.page, self.context, self.baseUrl, self.username, self.password, recovery=self)
-            temp_game_click.handle_game_exit(game_name)
+            temp_game_click.lobby_url = lobby_url
+            launch = temp_game_click.wait_for_launch(budget_ms(self.baseUrl, "launch", provider_name, game_name))
+            if launch.outcome is LaunchOutcome.CLOSE_BUTTON:
+                capture_launch_url(self.page, self.baseUrl, provider_name, game_name, lobby_url)
+            rendered = temp_game_click.handle_game_exit(game_name, provider_name=provider_name)
+            if launch.outcome is LaunchOutcome.TIMEOUT:
+                self.last_retry = "timeout"
+            else:
+                self.last_retry = "failed" if rendered is False else "passed"
 
             time.sleep(3)
 
-        return self.page, self.context
+        if found_page != page_num:
+            from pages.game_page import Game_Click
+            Game_Click(self.page, self.context, self.baseUrl, self.username, self.password,
+                       recovery=self).click_page_number(page_num)
+
+    def recheck(self, provider_name, game_name, page_num=1, game_index=0):
+        """
+        Re-test one game: its launch URL first, the lobby path if that has expired.
+        Returns "passed", "failed", "timeout" or None when the game could not be reached.
+        """
+        self.last_retry = None
+        if not self.retry_direct(provider_name, game_name):
+            self.open_game_page(provider_name, page_num)
+            self.retry_in_lobby(provider_name, page_num, game_index, game_name)
+        return self.last_retry
@@ -0,0 +1,114 @@
+import time
+from pages.login_page import Login
+from pages.home_page import HomePage
+from pages.game_page import Game_Click
+from pages.parallel_sweep import ParallelSweep
+from utils.rate_limit import throttle_launch
+from utils.waits import LaunchOutcome
+from utils.launch_timeouts import budget_ms
+from utils.lobby import PLAY_BTN, read_lobby
+
+
+class TabLauncher:
+    """
+    Launch several games at once, each in its own tab of the logged-in context.
+    The lobby tab only reads names and pages; it never clicks "Play Now", so it
+    never has to be restored with go_back. Games in a batch load side by side,
+    then each tab is verified with the shared handle_game_exit logic.
+    """
+    def __init__(self, lobby: Game_Click, tabs=3, hold_seconds=10, launch_timeout=None):
+        self.lobby = lobby
+        self.tabs = tabs
+        self.hold_seconds = hold_seconds
+        self.launch_timeout = launch_timeout   # seconds; None = the provider's learned budget
+
+    def run_provider(self, provider_name):
+        snapshot = read_lobby(self.lobby.page)
+        last_page_num = snapshot.pages[-1] if snapshot.pages else 1
+        print(f"Last page num is: {last_page_num}")
+
+        for page_num in range(1, last_page_num + 1):
+            print(f"=== Now in Page {page_num} (tabs={self.tabs}) ===")
+            if page_num > 1:
+                self.lobby.click_page_number(page_num)
+                snapshot = read_lobby(self.lobby.page)
+            names = snapshot.games
+            print(f"Total Game: {len(names)}")
+
+            games = [(index, name) for index, name in enumerate(names)
+                     if not self.lobby.game_filter or self.lobby.game_filter(provider_name, name)]
+            for start in range(0, len(games), self.tabs):
+                batch = games[start:start + self.tabs]
+                launched = [self.launch_in_tab(provider_name, page_num, index, name) for index, name in batch]
+                for launch in launched:
+                    self.verify_tab(provider_name, page_num, launch)
+
+    def launch_in_tab(self, provider_name, page_num, index, game_name):
+        """Open a tab, walk it to the game's page and click its "Play Now" without waiting."""
+        tab = self.lobby.context.new_page()
+        launch = {"tab": tab, "index": index, "game": game_name, "launched_at": None, "lobby_url": None, "error": None}
+        try:
+            tab.goto(self.lobby.baseUrl, wait_until="domcontentloaded", timeout=60000)
+            popups = Login(self.lobby.baseUrl)
+            popups.page = tab
+            popups.Close_Popupbtnscal()
+
+            home_page = HomePage()
+            home_page.page = tab
+            home_page.click_category(self.lobby.recovery.category)
+            if not ParallelSweep.open_provider(tab, provider_name):
+                raise RuntimeError(f"provider {provider_name} not found")
+            if page_num > 1:
+                self.tab_game_click(tab).click_page_number(page_num)
+
+            play_btn = tab.locator(PLAY_BTN).nth(index)
+            play_btn.wait_for(state="visible", timeout=15000)
+            play_btn.scroll_into_view_if_needed()
+            throttle_launch(self.lobby.baseUrl)
+            launch["lobby_url"] = tab.url
+            play_btn.click()
+            launch["launched_at"] = time.time()
+            print(f"🗂 Launched {game_name} in its own tab")
+        except Exception as e:
+            launch["error"] = e
+        return launch
+
+    def verify_tab(self, provider_name, page_num, launch):
+        tab = launch["tab"]
+        game_name = launch["game"]
+        try:
+            if launch["error"] is not None:
+                print(f"❌ Error on {game_name}: {launch['error']}")
+                self.lobby.record_result(provider_name, page_num, game_name, "error")
+                return
+
+            # the budget runs from the click, not from when this tab's turn came up;
+            # latencies are not recorded here because a signal may have fired long before we looked
+            elapsed_ms = (time.time() - launch["launched_at"]) * 1000
+            if self.launch_timeout is not None:
+                budget = self.launch_timeout * 1000
+            else:
+                budget = budget_ms(self.lobby.baseUrl, "launch", provider_name, game_name)
+            game_click = self.tab_game_click(tab, launch["lobby_url"])
+            outcome = game_click.wait_for_launch(max(1000, budget - elapsed_ms))
+            if outcome.outcome is LaunchOutcome.TIMEOUT:
+                print(f"⚠ Timeout for {game_name}")
+                self.lobby.record_result(provider_name, page_num, game_name, "timeout")
+                return
+
+            # the game kept loading while earlier tabs were verified, so only hold the remainder
+            # (at least a second, so the render probe still gets a look)
+            remaining = max(1, self.hold_seconds - (time.time() - launch["launched_at"]))
+            result = game_click.handle_game_exit(game_name, hold_seconds=remaining, provider_name=provider_name)
+            self.lobby.record_result(provider_name, page_num, game_name, "failed" if result is False else "passed")
+        finally:
+            try:
+                tab.close()
+            except Exception:
+                pass
+
+    def tab_game_click(self, tab, lobby_url=None):
+        game_click = Game_Click(tab, self.lobby.context, self.lobby.baseUrl,
+                                self.lobby.username, self.lobby.password, recovery=self.lobby.recovery)
+        game_click.lobby_url = lobby_url
+        return game_click
@@ -1,4 +1,6 @@
 from playwright.sync_api import sync_playwright
+from utils.game_ready import install_readiness_hooks
+from utils.locators import selector
 import time
 
 # tests/base_page.py
@@ -10,14 +12,52 @@ class BaseClass:
         self.context = None
         self.page = None
         
-    def Start_Browser(self):
+    def Start_Browser(self, cdp_port=None):
         # Get screen resolution
         self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless = False, args=["--start-maximized"])
+        args = ["--start-maximized"]
+        if cdp_port:
+            # expose the browser so worker threads can attach their own contexts
+            args.append(f"--remote-debugging-port={cdp_port}")
+        self.browser = self.playwright.chromium.launch(headless = False, args=args)
         self.context = self.browser.new_context(no_viewport=True)
+        install_readiness_hooks(self.context)
         self.page = self.context.new_page()
         print("browser started (maximized)")
+
+    def Attach_Browser(self, cdp_endpoint, storage_state=None):
+        """
+        Open a fresh context on an already running browser.
+        The sync API is bound to the thread that started it, so each worker
+        thread gets its own Playwright driver connected over CDP.
+        storage_state (from context.storage_state()) clones an existing login.
+        """
+        self.playwright = sync_playwright().start()
+        self.browser = self.playwright.chromium.connect_over_cdp(cdp_endpoint)
+        self.context = self.browser.new_context(no_viewport=True, storage_state=storage_state)
+        install_readiness_hooks(self.context)
+        self.page = self.context.new_page()
+        print(f"context attached to {cdp_endpoint}")
         
+    def Calibrate_Workers(self, launch_game, exit_game, max_workers=8, sample_seconds=5):
+        """
+        Size the worker pool from one real game.
+        launch_game/exit_game open and close a single game on this browser;
+        the browser tree is measured while it runs and compared to the host's
+        free cores and memory. Returns None if psutil is not installed.
+        """
+        from utils.calibration import psutil, measure_footprint, host_capacity, recommend_workers
+        if psutil is None:
+            print("⚠ psutil not installed, skipping worker calibration")
+            return None
+
+        launch_game()
+        try:
+            footprint = measure_footprint(sample_seconds)
+        finally:
+            exit_game()
+        return recommend_workers(footprint, host_capacity(), max_workers)
+
     def launch_url(self):
         self.page.goto(self.baseUrl, wait_until = "networkidle")
         print(f"Url excecuted {self.baseUrl}")
@@ -64,9 +104,7 @@ def reset_and_recover(self, provider_name, page_num, retry_index):
 
     slot_provider = SlotProvider()
     slot_provider.page = self.page
-    Provider_btns = self.page.query_selector_all(
-        "//div[@class='mt-5 flex items-center slot_btn_container w-full overflow-auto light-scrollbar-h pb-[10px]']//button"
-    )
+    Provider_btns = self.page.query_selector_all(selector("provider_button"))
     for btn in Provider_btns:
         if btn.text_content().strip() == provider_name:
             btn.click()
@@ -77,7 +115,7 @@ def reset_and_recover(self, provider_name, page_num, retry_index):
         self.click_page_number(page_num)
 
     # Step 5: Retry the same game index
-    Game_buttons = self.page.query_selector_all("//div[@class='game_btn_content']//button[text()='Play Now']")
+    Game_buttons = self.page.query_selector_all(selector("play_button"))
     if retry_index < len(Game_buttons):
         retry_btn = Game_buttons[retry_index]
         retry_btn.scroll_into_view_if_needed()
@@ -85,8 +123,8 @@ def reset_and_recover(self, provider_name, page_num, retry_index):
         print(f"🔁 Retried game {retry_index+1} on {provider_name} page {page_num}")
         time.sleep(5)
         # try to close immediately if success
-        if self.page.is_visible("//button/*[@class='w-5 h-5 game_header_close_btn']"):
-            self.page.click("//button/*[@class='w-5 h-5 game_header_close_btn']")
+        if self.page.is_visible(selector("close_button")):
+            self.page.click(selector("close_button"))
 
         
         
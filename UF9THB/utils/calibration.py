@@ -0,0 +1,70 @@
+# /utils/calibration.py
+import os
+import math
+import time
+
+try:
+    import psutil
+except ImportError:   # optional: without it calibration is skipped and --workers is used as given
+    psutil = None
+
+
+def browser_processes(root_pid=None):
+    """This process's children: the Playwright driver and every Chromium process it spawned."""
+    root = psutil.Process(root_pid or os.getpid())
+    return root.children(recursive=True)
+
+
+def measure_footprint(sample_seconds=5, root_pid=None):
+    """
+    Total RSS (bytes) and CPU (% of one core) of the browser process tree,
+    sampled over sample_seconds while a game is running.
+    """
+    if psutil is None:
+        return None
+    procs = browser_processes(root_pid)
+    for p in procs:
+        try:
+            p.cpu_percent(None)   # first call only primes the counter
+        except psutil.Error:
+            pass
+    time.sleep(sample_seconds)
+
+    rss = 0
+    cpu = 0.0
+    for p in procs:   # same objects, so cpu_percent covers the sample window
+        try:
+            rss += p.memory_info().rss
+            cpu += p.cpu_percent(None)
+        except psutil.Error:
+            pass   # renderer went away during the sample
+    return {"rss": rss, "cpu": cpu, "processes": len(procs)}
+
+
+def host_capacity():
+    return {
+        "cores": psutil.cpu_count(logical=True) or 1,
+        "available": psutil.virtual_memory().available,
+    }
+
+
+def recommend_workers(footprint, capacity, max_workers=8, reserve_cores=1, memory_headroom=0.25):
+    """
+    Workers that fit in what the host has left, counting every worker as a
+    whole browser tree with one game open (shared Chromium processes are
+    counted again each time, which keeps the estimate on the safe side).
+    """
+    usable_cpu = max(1, capacity["cores"] - reserve_cores) * 100
+    usable_mem = capacity["available"] * (1 - memory_headroom)
+
+    by_cpu = math.floor(usable_cpu / footprint["cpu"]) if footprint["cpu"] > 0 else max_workers
+    by_mem = math.floor(usable_mem / footprint["rss"]) if footprint["rss"] > 0 else max_workers
+    workers = max(1, min(max_workers, by_cpu, by_mem))
+
+    print(
+        f"🧮 One game context: {footprint['rss'] / 2**20:.0f} MB RSS, {footprint['cpu']:.0f}% CPU "
+        f"over {footprint['processes']} processes. Host: {capacity['cores']} cores, "
+        f"{capacity['available'] / 2**30:.1f} GB free → cpu allows {by_cpu}, memory allows {by_mem}, "
+        f"using {workers} workers"
+    )
+    return workers
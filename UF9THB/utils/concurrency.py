@@ -0,0 +1,125 @@
+# /utils/concurrency.py
+import json
+import time
+import asyncio
+import threading
+from collections import deque
+from contextlib import contextmanager, asynccontextmanager
+
+# Statuses from Game_Click.play_game that mean "the site pushed back"
+BACKOFF_STATUSES = {"failed", "timeout"}
+
+
+class AIMDController:
+    """
+    Additive-increase / multiplicative-decrease limit on concurrent launches.
+    - Every `limit` launches in a row without a toast/timeout raise the limit by `increase`.
+    - When the error rate over the last `window` launches passes
+      `error_threshold`, the limit is multiplied by `decrease` (at most once
+      per `cooldown` seconds, so one burst of toasts is one cut).
+    Throughput settles just under the level where the site starts refusing
+    games. snapshot() exposes the current limit and error rate.
+    """
+    def __init__(self, initial=2, minimum=1, maximum=16, increase=1, decrease=0.5,
+                 window=20, error_threshold=0.15, cooldown=30, metrics_path=None):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.error_threshold = error_threshold
+        self.cooldown = cooldown
+        self.metrics_path = metrics_path
+        self.outcomes = deque(maxlen=window)
+        self.in_flight = 0
+        self.launches = 0
+        self.errors = 0
+        self.clean_streak = 0
+        self.last_cut = 0.0
+        self.history = []   # (timestamp, limit) every time the limit moves
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        """Blocking gate for worker threads."""
+        with self._cond:
+            while self.in_flight >= self.limit:
+                self._cond.wait()
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self.in_flight -= 1
+                self._cond.notify_all()
+
+    @asynccontextmanager
+    async def async_slot(self, poll=0.2):
+        """Same gate for asyncio tasks; polls instead of blocking the loop."""
+        while True:
+            with self._cond:
+                if self.in_flight < self.limit:
+                    self.in_flight += 1
+                    break
+            await asyncio.sleep(poll)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self.in_flight -= 1
+                self._cond.notify_all()
+
+    def record(self, status):
+        """Feed back the outcome of one launch (a play_game status string)."""
+        if status is None:
+            return
+        error = status in BACKOFF_STATUSES
+        with self._cond:
+            self.launches += 1
+            self.errors += error
+            self.outcomes.append(error)
+            old = self.limit
+
+            if error:
+                self.clean_streak = 0
+                now = time.time()
+                if self._error_rate() > self.error_threshold and now - self.last_cut >= self.cooldown:
+                    self.limit = max(self.minimum, int(self.limit * self.decrease))
+                    self.last_cut = now
+            else:
+                self.clean_streak += 1
+                if self.clean_streak >= self.limit and self._error_rate() <= self.error_threshold:
+                    self.limit = min(self.maximum, self.limit + self.increase)
+                    self.clean_streak = 0
+
+            if self.limit != old:
+                self.history.append((time.time(), self.limit))
+                self._cond.notify_all()
+                arrow = "📈" if self.limit > old else "📉"
+                print(f"{arrow} Concurrency {old} → {self.limit} (error rate {self._error_rate():.0%})")
+                self._write_metrics()
+
+    def _error_rate(self):
+        return sum(self.outcomes) / len(self.outcomes) if self.outcomes else 0.0
+
+    def _metrics(self):
+        return {
+            "concurrency_limit": self.limit,
+            "in_flight": self.in_flight,
+            "error_rate": round(self._error_rate(), 3),
+            "launches_total": self.launches,
+            "errors_total": self.errors,
+        }
+
+    def snapshot(self):
+        with self._cond:
+            return self._metrics()
+
+    def _write_metrics(self):
+        if not self.metrics_path:
+            return
+        try:
+            with open(self.metrics_path, "w", encoding="utf-8") as f:
+                json.dump(dict(self._metrics(), updated=time.time()), f)
+        except OSError as e:
+            print(f"⚠ Could not write metrics: {e}")
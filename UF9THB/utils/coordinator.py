@@ -0,0 +1,215 @@
+# /utils/coordinator.py
+import json
+import time
+import uuid
+import threading
+from collections import deque
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib import request
+
+
+class LeaseTable:
+    """
+    Owns the game catalog and hands it out as expiring leases.
+    - lease(): next pending item, valid for lease_seconds.
+    - renew(): heartbeat from a worker that is still busy with the item.
+    - complete(): result for the item; late results for a reissued item are
+      accepted only if nobody finished it yet.
+    Leases that are not renewed in time go back to the front of the queue, so
+    a worker that dies mid-game loses its item to the next worker that asks.
+    """
+    def __init__(self, items, lease_seconds=180, max_attempts=3):
+        self.items = [dict(item) for item in items]
+        self.pending = deque(range(len(self.items)))
+        self.leases = {}          # lease_id → {"item": idx, "worker": str, "expires": ts}
+        self.expired = {}         # lease_id → idx of leases that ran out, for late results
+        self.attempts = [0] * len(self.items)
+        self.results = {}         # idx → result dict
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.reissued = 0
+        self.lock = threading.Lock()
+
+    def _expire(self):
+        now = time.time()
+        for lease_id, lease in list(self.leases.items()):
+            if lease["expires"] > now:
+                continue
+            del self.leases[lease_id]
+            idx = lease["item"]
+            self.expired[lease_id] = idx
+            if idx in self.results:
+                continue
+            if self.attempts[idx] >= self.max_attempts:
+                self.results[idx] = dict(self.items[idx], status="lost", worker=lease["worker"])
+                print(f"❌ Lease for {self.items[idx]['name']} expired {self.attempts[idx]} times, giving up")
+            else:
+                self.pending.appendleft(idx)
+                self.reissued += 1
+                print(f"⚠ Lease for {self.items[idx]['name']} expired on {lease['worker']}, reissuing")
+
+    def lease(self, worker):
+        with self.lock:
+            self._expire()
+            while self.pending:
+                idx = self.pending.popleft()
+                if idx in self.results:
+                    continue
+                lease_id = uuid.uuid4().hex
+                self.attempts[idx] += 1
+                self.leases[lease_id] = {"item": idx, "worker": worker, "expires": time.time() + self.lease_seconds}
+                return {"lease_id": lease_id, "item": self.items[idx], "lease_seconds": self.lease_seconds}
+            if self.leases:
+                return {"wait": True}   # everything is leased, ask again shortly
+            return {"done": True}
+
+    def renew(self, lease_id):
+        with self.lock:
+            lease = self.leases.get(lease_id)
+            if lease is None:
+                return {"ok": False}
+            lease["expires"] = time.time() + self.lease_seconds
+            return {"ok": True}
+
+    def complete(self, lease_id, result):
+        with self.lock:
+            lease = self.leases.pop(lease_id, None)
+            if lease:
+                idx = lease["item"]
+            else:
+                idx = self.expired.pop(lease_id, None)
+                idx = self._index_of(result) if idx is None else idx
+            if idx is None or idx in self.results:
+                return {"ok": False}
+            self.results[idx] = dict(self.items[idx], **result)
+            return {"ok": True}
+
+    def _index_of(self, result):
+        key = (result.get("provider"), result.get("page"), result.get("index"))
+        for idx, item in enumerate(self.items):
+            if (item["provider"], item["page"], item["index"]) == key:
+                return idx
+        return None
+
+    def status(self):
+        with self.lock:
+            self._expire()
+            return {
+                "total": len(self.items),
+                "done": len(self.results),
+                "leased": len(self.leases),
+                "pending": len(self.pending),
+                "reissued": self.reissued,
+                "workers": sorted({lease["worker"] for lease in self.leases.values()}),
+            }
+
+    def finished(self):
+        with self.lock:
+            return len(self.results) == len(self.items)
+
+    def all_results(self):
+        with self.lock:
+            return [self.results[idx] for idx in sorted(self.results)]
+
+
+def make_server(table, host="0.0.0.0", port=8765, launch_bucket=None):
+    """
+    HTTP/JSON front end for a LeaseTable: POST /lease /renew /result /launch, GET /status.
+    /launch takes a token from launch_bucket (the brand-wide LAUNCH_RATE) and
+    replies with the seconds to wait before asking again, 0 when granted.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, payload, code=200):
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/status":
+                self._reply(table.status())
+            else:
+                self._reply({"error": "not found"}, 404)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                data = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                return self._reply({"error": "invalid json"}, 400)
+
+            if self.path == "/lease":
+                self._reply(table.lease(data.get("worker", self.client_address[0])))
+            elif self.path == "/renew":
+                self._reply(table.renew(data.get("lease_id")))
+            elif self.path == "/result":
+                self._reply(table.complete(data.get("lease_id"), data.get("result", {})))
+            elif self.path == "/launch":
+                if launch_bucket is None:
+                    self._reply({"wait": 0, "limited": False})
+                else:
+                    self._reply({"wait": launch_bucket.take(), "limited": True})
+            else:
+                self._reply({"error": "not found"}, 404)
+
+        def log_message(self, format, *args):
+            pass   # keep the console for sweep output
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+class CoordinatorClient:
+    """Worker-side helper for talking to a coordinator over HTTP."""
+    def __init__(self, url, worker, timeout=30):
+        self.url = url.rstrip("/")
+        self.worker = worker
+        self.timeout = timeout
+
+    def _post(self, path, payload):
+        req = request.Request(
+            self.url + path,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+        with request.urlopen(req, timeout=self.timeout) as resp:
+            return json.loads(resp.read())
+
+    def lease(self):
+        return self._post("/lease", {"worker": self.worker})
+
+    def renew(self, lease_id):
+        return self._post("/renew", {"lease_id": lease_id})
+
+    def report(self, lease_id, result):
+        return self._post("/result", {"lease_id": lease_id, "result": result})
+
+    def launch(self):
+        return self._post("/launch", {"worker": self.worker})
+
+
+class LeaseHeartbeat:
+    """Renews a lease in the background while a worker is busy with its game."""
+    def __init__(self, client, lease_id, interval):
+        self.client = client
+        self.lease_id = lease_id
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.client.renew(self.lease_id)
+            except Exception as e:
+                print(f"⚠ Lease renew failed: {e}")
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join(timeout=self.interval)
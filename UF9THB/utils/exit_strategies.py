@@ -0,0 +1,145 @@
+# /utils/exit_strategies.py
+import os
+import time
+from collections import namedtuple
+from utils.waits import CLOSE_BTN, GAME_IFRAME, GAME_NAME
+from utils.locators import QUERY_JS
+
+STRATEGIES = ("ui_close", "spa_back", "remove_iframe", "go_back")
+# The close button first: it is what the lobby's own code expects, and an overlay
+# game has no route for spa_back to pop. remove_iframe detaches a node the SPA
+# framework owns, so it only runs when EXIT_STRATEGY asks for it.
+DEFAULT_ORDER = ("ui_close", "spa_back", "go_back")
+
+ExitResult = namedtuple("ExitResult", ["strategy", "latency_ms", "intact", "reloaded", "tried"])
+
+# What the lobby looks like right now; a token set before the exit tells a
+# full document reload apart from an SPA route change.
+_LOBBY_STATE_JS = """
+({closeSelector, iframeSelector, gameSelector, lobbyUrl}) => {
+    const qa = """ + QUERY_JS + """;
+    const close = qa(closeSelector)[0];
+    const overlay = !!close && close.getBoundingClientRect().width > 0;
+    return {
+        overlay,
+        iframe: qa(iframeSelector).length > 0,
+        games: qa(gameSelector).length,
+        urlOk: !lobbyUrl || location.href === lobbyUrl,
+        reloaded: !window.__qaExitToken,
+    };
+}
+"""
+
+_REMOVE_IFRAME_JS = """
+iframeSelector => {
+    const frames = (""" + QUERY_JS + """)(iframeSelector);
+    for (const frame of frames) {
+        frame.src = 'about:blank';   // stop the game's timers, audio and sockets first
+        frame.remove();
+    }
+    return frames.length;
+}
+"""
+
+
+def exit_order():
+    """EXIT_STRATEGY=spa_back,remove_iframe,ui_close overrides the order (unknown names are ignored)."""
+    names = os.getenv("EXIT_STRATEGY")
+    if not names:
+        return DEFAULT_ORDER
+    return tuple(n.strip() for n in names.split(",") if n.strip() in STRATEGIES) or DEFAULT_ORDER
+
+
+class GameExit:
+    """
+    Ways to get from an open game back to a usable lobby, tried in order
+    until one leaves it intact (exit_order()):
+    - ui_close:      click the game header close button
+    - spa_back:      history.back() so the SPA router restores the lobby route, no reload
+    - remove_iframe: blank and detach the game iframe in place (opt-in via EXIT_STRATEGY)
+    - go_back:       page.go_back(), which reloads the lobby
+    Each is followed by a lobby integrity check: no game overlay, no game
+    iframe, game grid present and (when known) the lobby URL restored.
+    """
+    def __init__(self, page, lobby_url=None, close_selector=CLOSE_BTN, iframe_selector=GAME_IFRAME,
+                 go_back=None, settle_ms=1500):
+        self.page = page
+        self.lobby_url = lobby_url
+        self.close_selector = close_selector
+        self.iframe_selector = iframe_selector
+        self.go_back_fn = go_back or (lambda: page.go_back(timeout=20000))
+        self.settle_ms = settle_ms
+
+    def lobby_state(self):
+        return self.page.evaluate(_LOBBY_STATE_JS, {
+            "closeSelector": self.close_selector,
+            "iframeSelector": self.iframe_selector,
+            "gameSelector": GAME_NAME,
+            "lobbyUrl": self.lobby_url,
+        })
+
+    @staticmethod
+    def is_intact(state):
+        return not state["overlay"] and not state["iframe"] and state["games"] > 0 and state["urlOk"]
+
+    def wait_for_lobby(self, timeout_ms):
+        """Wait (no polling) until the lobby passes the integrity check; False on timeout."""
+        try:
+            self.page.wait_for_function(
+                "args => { const s = (" + _LOBBY_STATE_JS + ")(args);"
+                " return !s.overlay && !s.iframe && s.games > 0 && s.urlOk; }",
+                arg={"closeSelector": self.close_selector, "iframeSelector": self.iframe_selector,
+                     "gameSelector": GAME_NAME, "lobbyUrl": self.lobby_url},
+                polling="mutation", timeout=timeout_ms,
+            )
+            return True
+        except Exception:
+            return False
+
+    def spa_back(self):
+        if self.lobby_url is None or self.page.url == self.lobby_url:
+            return False   # the game did not push a route, so there is nothing to pop
+        self.page.evaluate("history.back()")
+        return self.wait_for_lobby(self.settle_ms)
+
+    def remove_iframe(self):
+        if not self.page.evaluate(_REMOVE_IFRAME_JS, self.iframe_selector):
+            return False
+        return self.wait_for_lobby(self.settle_ms)
+
+    def ui_close(self):
+        self.page.click(self.close_selector, timeout=5000)
+        return self.wait_for_lobby(5000)
+
+    def go_back(self):
+        self.go_back_fn()
+        return self.wait_for_lobby(10000)
+
+    def run(self, strategy):
+        """One strategy on its own; returns an ExitResult (used by the benchmark)."""
+        self.page.evaluate("window.__qaExitToken = Date.now()")
+        started = time.perf_counter()
+        try:
+            getattr(self, strategy)()
+        except Exception as e:
+            print(f"⚠ Exit strategy {strategy} failed: {e}")
+        latency_ms = round((time.perf_counter() - started) * 1000)
+        try:
+            state = self.lobby_state()
+        except Exception:
+            state = {"overlay": True, "iframe": True, "games": 0, "urlOk": False, "reloaded": True}
+        return ExitResult(strategy, latency_ms, self.is_intact(state), state["reloaded"], (strategy,))
+
+    def exit(self, order=None):
+        """Try each strategy in order until the lobby is intact."""
+        order = order or exit_order()
+        tried = []
+        started = time.perf_counter()
+        result = None
+        for strategy in order:
+            tried.append(strategy)
+            result = self.run(strategy)
+            if result.intact:
+                break
+        return ExitResult(result.strategy, round((time.perf_counter() - started) * 1000),
+                          result.intact, result.reloaded, tuple(tried))
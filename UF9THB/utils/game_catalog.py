@@ -0,0 +1,232 @@
+# /utils/game_catalog.py
+import json
+import math
+from collections import namedtuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from utils.lobby import read_lobby, click_provider
+from utils.page_jump import PAGE_PARAM_NAMES
+from utils.work_queue import WorkItem
+
+NAME_KEYS = ("name", "game_name", "gameName", "title", "game_title", "gameTitle")
+ID_KEYS = ("id", "game_id", "gameId", "game_code", "gameCode", "code", "uuid")
+TOTAL_KEYS = ("total", "total_count", "totalCount", "total_items", "totalItems", "count")
+LAST_PAGE_KEYS = ("last_page", "lastPage", "total_page", "totalPage", "total_pages", "totalPages", "pages")
+
+# page/index: where the game sits in the lobby grid (1-based page, 0-based card)
+CatalogGame = namedtuple("CatalogGame", ["provider", "game_id", "name", "page", "index"])
+
+
+def _first(d, keys):
+    for key in keys:
+        if d.get(key) not in (None, ""):
+            return d[key]
+    return None
+
+
+def find_game_list(payload):
+    """
+    Longest list of game-like objects (dicts with a name key) anywhere in a
+    JSON payload, with the dict that holds it (where totals usually live).
+    Returns (games, holder) or (None, None).
+    """
+    best, holder = None, None
+    stack = [(payload, None)]
+    while stack:
+        node, parent = stack.pop()
+        if isinstance(node, dict):
+            stack.extend((value, node) for value in node.values())
+        elif isinstance(node, list):
+            named = [item for item in node if isinstance(item, dict) and isinstance(_first(item, NAME_KEYS), str)]
+            if named and len(named) * 2 >= len(node) and (best is None or len(named) > len(best)):
+                best, holder = named, parent if isinstance(parent, dict) else {}
+            stack.extend((item, node) for item in node if isinstance(item, (dict, list)))
+    return best, holder
+
+
+def expected_size(holder):
+    """
+    (total games, API page count) as far as the payload says, each None when it
+    does not. A last_page alone is a page count, not a total: the last page is
+    usually partial.
+    """
+    total = last_page = None
+    for source in (holder, holder.get("meta"), holder.get("pagination"), holder.get("page_info")):
+        if not isinstance(source, dict):
+            continue
+        if total is None and isinstance(_first(source, TOTAL_KEYS), int):
+            total = _first(source, TOTAL_KEYS)
+        if last_page is None and isinstance(_first(source, LAST_PAGE_KEYS), int):
+            last_page = _first(source, LAST_PAGE_KEYS)
+    return total, last_page
+
+
+def _with_page(url, param, number):
+    parts = urlsplit(url)
+    query = [(k, str(number) if k == param else v) for k, v in parse_qsl(parts.query, keep_blank_values=True)]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class GameCatalog:
+    """
+    Provider → games catalog built from the lobby's own JSON instead of the DOM.
+    While each provider is opened once, every JSON xhr/fetch response is kept;
+    the payload whose game list matches the first grid page is that provider's
+    list. If the backend pages it, the remaining API pages are fetched with the
+    authenticated context's request client (same cookies and headers), so the
+    lobby pagination is never walked. Providers whose payload cannot be found
+    are kept with no games and callers fall back to the DOM for them.
+    """
+    def __init__(self, page, path=None):
+        self.page = page
+        self.path = path
+        self.providers = {}   # provider name → [CatalogGame]
+        self.ids = {}         # provider name → {game name: game id}
+        self._responses = []
+
+    def _on_response(self, response):
+        if response.request.resource_type in ("xhr", "fetch") and "json" in response.headers.get("content-type", ""):
+            self._responses.append(response)
+
+    def _payloads(self):
+        for response in self._responses:
+            try:
+                yield response, response.json()
+            except Exception:
+                continue
+
+    def _remaining_pages(self, response, pages):
+        """Game lists of the API pages after the captured one (GET ?page=N or a JSON body with a page key)."""
+        request = response.request
+        headers = {k: v for k, v in request.headers.items() if not k.startswith(":")}
+        param = next((k for k, _ in parse_qsl(urlsplit(request.url).query) if k.lower() in PAGE_PARAM_NAMES), None)
+        body = None
+        if param is None and request.post_data:
+            try:
+                body = json.loads(request.post_data)
+                param = next((k for k in body if k.lower() in PAGE_PARAM_NAMES), None)
+            except (ValueError, TypeError):
+                body = None
+        if param is None:
+            return []
+
+        start = int((body or dict(parse_qsl(urlsplit(request.url).query))).get(param, 1))
+        rest = []
+        for number in range(start + 1, start + pages):
+            if body is not None:
+                reply = self.page.context.request.post(request.url, data={**body, param: number}, headers=headers)
+            else:
+                reply = self.page.context.request.get(_with_page(request.url, param, number), headers=headers)
+            more, _ = find_game_list(reply.json()) if reply.ok else (None, None)
+            if not more:
+                break
+            rest.extend(more)
+        return rest
+
+    def _match(self, provider_name, dom_games, page_size):
+        """The captured list that starts like the grid does; completed from the API if it is paged."""
+        best, best_score = None, 0
+        for response, payload in self._payloads():
+            games, holder = find_game_list(payload)
+            if not games:
+                continue
+            names = [_first(g, NAME_KEYS).strip() for g in games]
+            score = len(set(names[:len(dom_games)]) & set(dom_games))
+            if score > best_score:
+                best, best_score = (response, games, holder), score
+        if best is None or best_score * 2 < len(dom_games):
+            return None
+
+        response, games, holder = best
+        total, last_page = expected_size(holder)
+        size = len(games)
+        pages = math.ceil(total / size) if total else last_page or 1
+        if pages > 1:
+            try:
+                games = games + self._remaining_pages(response, pages)
+            except Exception as e:
+                print(f"⚠ {provider_name}: could not fetch the rest of the game list ({e})")
+            # with a page count only, the list is whole once the last page added something
+            complete = len(games) >= total if total else len(games) > (pages - 1) * size
+            if not complete:
+                print(f"⚠ {provider_name}: API listed {len(games)} games over {pages} pages"
+                      f"{f' of {total}' if total else ''}, using the DOM instead")
+                return None
+        return [CatalogGame(provider_name, _first(g, ID_KEYS), _first(g, NAME_KEYS).strip(), i // page_size + 1, i % page_size)
+                for i, g in enumerate(games)]
+
+    def capture(self, provider_names):
+        """Open each provider once, with the response listener on, and keep its game list ([] when unrecognised)."""
+        self.page.on("response", self._on_response)
+        try:
+            for provider_name in provider_names:
+                self._responses = []
+                if not click_provider(self.page, provider_name):
+                    continue
+                lobby = read_lobby(self.page)
+                games = self._match(provider_name, lobby.games, max(1, lobby.play_buttons))
+                self.providers[provider_name] = games or []
+                self.ids[provider_name] = {g.name: g.game_id for g in games or []}
+                if games:
+                    print(f"📚 {provider_name}: {len(games)} games from the lobby API")
+                else:
+                    print(f"⚠ {provider_name}: no game list payload recognised, DOM fallback")
+        finally:
+            self.page.remove_listener("response", self._on_response)
+            self._responses = []
+        if self.path:
+            self.save()
+        return self
+
+    def games(self, provider_name):
+        return self.providers.get(provider_name, [])
+
+    def missing(self, provider_names):
+        """Providers never captured (new ones, or dropped as stale)."""
+        return [p for p in provider_names if p not in self.providers]
+
+    def last_page(self, provider_name):
+        games = self.games(provider_name)
+        return games[-1].page if games else None
+
+    def check_pages(self, provider_name, live_last_page):
+        """
+        True when the catalog has the provider with the page count the lobby shows now.
+        A mismatch (the provider gained or lost a page since the catalog was
+        saved) drops the provider, so it is read from the DOM and captured again next run.
+        """
+        catalog_last_page = self.last_page(provider_name)
+        if catalog_last_page is None:
+            return False
+        if catalog_last_page == live_last_page:
+            return True
+        print(f"⚠ {provider_name}: catalog has {catalog_last_page} pages, lobby shows {live_last_page}; "
+              f"catalog entry dropped")
+        self.providers.pop(provider_name, None)
+        self.ids.pop(provider_name, None)
+        if self.path:
+            self.save()
+        return False
+
+    def locate(self, provider_name, game_name):
+        """Page and card of a game by name, or None if the catalog does not have it."""
+        return next((g for g in self.games(provider_name) if g.name == game_name), None)
+
+    def work_items(self, game_filter=None):
+        return [WorkItem(g.provider, g.page, g.index, g.name)
+                for games in self.providers.values() for g in games
+                if not game_filter or game_filter(g.provider, g.name)]
+
+    def save(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({p: [g._asdict() for g in games] for p, games in self.providers.items()},
+                      f, ensure_ascii=False, indent=2)
+        print(f"💾 Game catalog saved: {self.path}")
+
+    @classmethod
+    def load(cls, page, path):
+        catalog = cls(page, path)
+        with open(path, encoding="utf-8") as f:
+            for provider_name, games in json.load(f).items():
+                catalog.providers[provider_name] = [CatalogGame(**g) for g in games]
+                catalog.ids[provider_name] = {g["name"]: g["game_id"] for g in games}
+        return catalog
@@ -0,0 +1,161 @@
+# /utils/game_ready.py
+import time
+import asyncio
+from utils.render_probe import probe_render, RENDERED, STATIC
+from utils.idle_profiler import idle_wait
+
+# Runs in every frame (game iframes included) before the game's own scripts,
+# so canvas contexts and animation frames are counted from the start.
+READINESS_HOOKS_JS = """
+(() => {
+    if (window.__qaHooks) return;
+    window.__qaHooks = true;
+    window.__qaCanvas = 0;
+    window.__qaFrames = 0;
+    // the resource timing buffer stops at 250 entries by default; asset-heavy
+    // games pass that, so keep a wider buffer and track the latest responseEnd
+    window.__qaLastEnd = 0;
+    try { performance.setResourceTimingBufferSize(100000); } catch (e) {}
+    try {
+        new PerformanceObserver(list => {
+            for (const r of list.getEntries()) window.__qaLastEnd = Math.max(window.__qaLastEnd, r.responseEnd);
+        }).observe({type: 'resource', buffered: true});
+    } catch (e) {}
+    const getContext = HTMLCanvasElement.prototype.getContext;
+    window.__qaGetContext = getContext;   // unhooked, for probes that need a scratch canvas
+    HTMLCanvasElement.prototype.getContext = function (type, ...rest) {
+        const ctx = getContext.call(this, type, ...rest);
+        if (ctx) window.__qaCanvas += 1;
+        return ctx;
+    };
+    const raf = window.requestAnimationFrame;
+    window.requestAnimationFrame = function (cb) {
+        return raf.call(window, ts => { window.__qaFrames += 1; cb(ts); });
+    };
+})();
+"""
+
+# Read in one frame: what has happened there so far
+_FRAME_STATE_JS = """
+quietMs => {
+    const resources = performance.getEntriesByType('resource');
+    const lastEnd = resources.reduce((m, r) => Math.max(m, r.responseEnd), window.__qaLastEnd || 0);
+    return {
+        loaded: document.readyState === 'complete',
+        quiet: performance.now() - lastEnd >= quietMs,
+        canvases: document.getElementsByTagName('canvas').length,
+        contexts: window.__qaCanvas || 0,
+        frames: window.__qaFrames || 0,
+        painted: performance.getEntriesByType('paint').length > 0,
+    };
+}
+"""
+
+
+def install_readiness_hooks(context):
+    context.add_init_script(READINESS_HOOKS_JS)
+
+
+def _frame_tree(frame):
+    frames = [frame]
+    for child in frame.child_frames:
+        frames.extend(_frame_tree(child))
+    return frames
+
+
+def read_game_signals(game_frame, quiet_ms=500):
+    """Merge the state of the game frame and every frame nested inside it."""
+    signals = {"loaded": True, "quiet": True, "canvas": False, "painted": False, "has_canvas": False}
+    for frame in _frame_tree(game_frame):
+        try:
+            state = frame.evaluate(_FRAME_STATE_JS, quiet_ms)
+        except Exception:
+            continue   # frame detached or still navigating
+        signals["loaded"] &= state["loaded"]
+        signals["quiet"] &= state["quiet"]
+        signals["has_canvas"] |= state["canvases"] > 0
+        signals["canvas"] |= state["contexts"] > 0
+        signals["painted"] |= state["painted"] or state["frames"] >= 2
+    return signals
+
+
+async def read_game_signals_async(game_frame, quiet_ms=500):
+    signals = {"loaded": True, "quiet": True, "canvas": False, "painted": False, "has_canvas": False}
+    for frame in _frame_tree(game_frame):
+        try:
+            state = await frame.evaluate(_FRAME_STATE_JS, quiet_ms)
+        except Exception:
+            continue
+        signals["loaded"] &= state["loaded"]
+        signals["quiet"] &= state["quiet"]
+        signals["has_canvas"] |= state["canvases"] > 0
+        signals["canvas"] |= state["contexts"] > 0
+        signals["painted"] |= state["painted"] or state["frames"] >= 2
+    return signals
+
+
+def game_is_ready(signals):
+    """Document loaded, network quiet, something painted, and a canvas context if the game draws on a canvas."""
+    canvas_ok = signals["canvas"] or not signals["has_canvas"]
+    return signals["loaded"] and signals["quiet"] and signals["painted"] and canvas_ok
+
+
+@idle_wait
+def wait_for_game_ready(page, iframe_selector, max_wait_s=10, quiet_ms=500, poll_s=0.25, probe_every_s=0.5):
+    """
+    Wait until the game inside iframe_selector has really rendered, or max_wait_s.
+    The pixel probe (utils/render_probe.py) and the load signals must agree:
+    "rendered" ends the wait once the document has loaded and the network is
+    quiet (a colourful splash with a progress bar also samples as "rendered"),
+    "blank"/"loading" keeps it going even when the load signals look done.
+    When the probe cannot read anything, or sees a still, nearly flat screen
+    (a splash or start screen), the load signals decide.
+    iframe_selector=None means the game is the page itself (a directly opened launch URL).
+    Returns (ready, elapsed_seconds, signals); signals["render"] is the last verdict.
+    """
+    started = time.time()
+    signals = {}
+    verdict = None
+    samples = None
+    game_frame = None
+    last_probe = 0.0
+    while time.time() - started < max_wait_s:
+        if iframe_selector is None:
+            game_frame = page.main_frame
+        elif game_frame is None or game_frame.is_detached():
+            handle = page.query_selector(iframe_selector)
+            game_frame = handle.content_frame() if handle else None
+        if game_frame is not None:
+            signals = read_game_signals(game_frame, quiet_ms)
+            if time.time() - last_probe >= probe_every_s:
+                verdict, source, probe_ms, samples = probe_render(page, iframe_selector or "html", game_frame, samples)
+                last_probe = time.time()
+                signals.update(render=verdict, render_source=source, render_ms=probe_ms)
+            rendered = verdict == RENDERED and signals["loaded"] and signals["quiet"]
+            if rendered or (verdict in (None, STATIC) and game_is_ready(signals)):
+                return True, time.time() - started, signals
+        time.sleep(poll_s)
+    return False, time.time() - started, signals
+
+
+@idle_wait
+async def wait_for_game_ready_async(page, iframe_selector, max_wait_s=10, quiet_ms=500, poll_s=0.25):
+    """
+    Async counterpart of wait_for_game_ready, on the load signals only
+    (the pixel probe is sync-only). Returns (ready, elapsed_seconds, signals).
+    """
+    started = time.time()
+    signals = {}
+    game_frame = None
+    while time.time() - started < max_wait_s:
+        if iframe_selector is None:
+            game_frame = page.main_frame
+        elif game_frame is None or game_frame.is_detached():
+            handle = await page.query_selector(iframe_selector)
+            game_frame = await handle.content_frame() if handle else None
+        if game_frame is not None:
+            signals = await read_game_signals_async(game_frame, quiet_ms)
+            if game_is_ready(signals):
+                return True, time.time() - started, signals
+        await asyncio.sleep(poll_s)
+    return False, time.time() - started, signals
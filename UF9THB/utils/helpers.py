@@ -5,3 +5,10 @@ async def clear_browser_storage(context):
     for page in context.pages:
         await page.goto("about:blank")
         await page.evaluate("window.localStorage.clear(); window.sessionStorage.clear();")
+
+
+def find_free_port():
+    import socket
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
@@ -0,0 +1,187 @@
+# /utils/idle_profiler.py
+import os
+import sys
+import json
+import time
+import atexit
+import asyncio
+import functools
+import importlib
+import threading
+import contextvars
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# Playwright calls that block until something happens, wrapped on their classes
+# so callers that imported the classes earlier are covered too
+PLAYWRIGHT_WAITS = {
+    "Page": ("wait_for_timeout", "wait_for_selector", "wait_for_load_state", "wait_for_function",
+             "wait_for_url", "go_back"),
+    "Frame": ("wait_for_timeout", "wait_for_selector", "wait_for_load_state", "wait_for_function", "wait_for_url"),
+    "Locator": ("wait_for",),
+}
+
+
+class IdleProfiler:
+    """
+    Charges every wait to the page-object call site that asked for it:
+    time.sleep, asyncio.sleep, Playwright's wait_for_*/go_back calls (sync and
+    async), and the evaluate-promise helpers in utils/waits.py and
+    utils/game_ready.py (through @idle_wait).
+    Waits made inside utils/ helpers (readiness polling, rate limiting) are
+    charged to the caller in pages/, e.g. "handle_game_exit → wait_for_game_ready".
+    Only the outermost wait is counted, so the sleeps inside a helper are not
+    counted twice.
+    With parallel workers the per-site totals are summed across threads, so
+    they can add up to more than 100% of wall time.
+    """
+    def __init__(self):
+        self.started = None
+        self.sites = {}
+        self.lock = threading.Lock()
+        self.originals = {}
+        self.busy = contextvars.ContextVar("idle_busy", default=False)   # per thread and per asyncio task
+
+    def install(self):
+        if self.started is not None:
+            return self
+        self.started = time.perf_counter()
+
+        self.originals["time.sleep"] = time.sleep
+        self.originals["asyncio.sleep"] = asyncio.sleep
+        time.sleep = self._wrap(time.sleep, "sleep")
+        asyncio.sleep = self._wrap_async(asyncio.sleep, "sleep")
+
+        for api, wrap in (("sync_api", self._wrap), ("async_api", self._wrap_async)):
+            try:
+                module = importlib.import_module(f"playwright.{api}")
+            except ImportError:
+                continue
+            for cls_name, methods in PLAYWRIGHT_WAITS.items():
+                cls = getattr(module, cls_name)
+                for name in methods:
+                    original = getattr(cls, name, None)
+                    if original is None:
+                        continue
+                    self.originals[f"{api}.{cls_name}.{name}"] = original
+                    setattr(cls, name, wrap(original, name))
+        return self
+
+    @staticmethod
+    def call_site(frame, waited=None):
+        """Name the waiting function and the first page-object frame above it."""
+        inner = waited or frame.f_code.co_name
+        while frame is not None and os.path.dirname(os.path.abspath(frame.f_code.co_filename)) == UTILS_DIR:
+            frame = frame.f_back
+        if frame is None:
+            return inner
+        outer = frame.f_code.co_name
+        where = f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno}"
+        return f"{outer} ({where})" if outer == inner else f"{outer} → {inner} ({where})"
+
+    def record(self, site, seconds):
+        with self.lock:
+            entry = self.sites.setdefault(site, {"count": 0, "seconds": 0.0})
+            entry["count"] += 1
+            entry["seconds"] += seconds
+
+    def timed(self, frame, waited, call):
+        """Run call() and charge its duration to frame's call site, unless a wait is already being timed."""
+        if self.busy.get():
+            return call()
+        site = self.call_site(frame, waited)
+        token = self.busy.set(True)
+        started = time.perf_counter()
+        try:
+            return call()
+        finally:
+            self.busy.reset(token)
+            self.record(site, time.perf_counter() - started)
+
+    async def timed_async(self, frame, waited, call):
+        if self.busy.get():
+            return await call()
+        site = self.call_site(frame, waited)
+        token = self.busy.set(True)
+        started = time.perf_counter()
+        try:
+            return await call()
+        finally:
+            self.busy.reset(token)
+            self.record(site, time.perf_counter() - started)
+
+    def _wrap(self, fn, waited):
+        # time.sleep is charged to the function that slept, like before
+        name = None if waited == "sleep" else waited
+
+        @functools.wraps(fn)
+        def profiled(*args, **kwargs):
+            return self.timed(sys._getframe(1), name, lambda: fn(*args, **kwargs))
+        return profiled
+
+    def _wrap_async(self, fn, waited):
+        name = None if waited == "sleep" else waited
+
+        @functools.wraps(fn)
+        async def profiled(*args, **kwargs):
+            return await self.timed_async(sys._getframe(1), name, lambda: fn(*args, **kwargs))
+        return profiled
+
+    def summary(self):
+        wall = time.perf_counter() - self.started if self.started is not None else 0.0
+        with self.lock:
+            rows = [
+                {"site": site, "count": e["count"], "seconds": round(e["seconds"], 2),
+                 "percent": round(100 * e["seconds"] / wall, 1) if wall else 0.0}
+                for site, e in self.sites.items()
+            ]
+        rows.sort(key=lambda r: r["seconds"], reverse=True)
+        return {"wall_seconds": round(wall, 2), "idle_seconds": round(sum(r["seconds"] for r in rows), 2), "sites": rows}
+
+    def report(self, path=None):
+        summary = self.summary()
+        print(f"===== Idle time by call site ({summary['wall_seconds']}s wall, "
+              f"{summary['idle_seconds']}s waiting) =====")
+        for r in summary["sites"]:
+            print(f"{r['site']}: {r['seconds']}s over {r['count']} waits → {r['percent']}% of wall time")
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2)
+            print(f"💾 Idle profile saved: {path}")
+        return summary
+
+
+IDLE = IdleProfiler()
+
+
+def idle_wait(fn):
+    """Charge a blocking helper (or an async one) to its caller as one wait while the profiler is on."""
+    if asyncio.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            if IDLE.started is None:
+                return await fn(*args, **kwargs)
+            return await IDLE.timed_async(sys._getframe(1), fn.__name__, lambda: fn(*args, **kwargs))
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if IDLE.started is None:
+            return fn(*args, **kwargs)
+        return IDLE.timed(sys._getframe(1), fn.__name__, lambda: fn(*args, **kwargs))
+    return wrapper
+
+
+def start_idle_profile():
+    """
+    Turn the profiler on when IDLE_PROFILE is set and print the report at exit.
+    IDLE_PROFILE=1 only prints; IDLE_PROFILE=<file>.json also saves the table.
+    """
+    setting = os.getenv("IDLE_PROFILE")
+    if not setting or setting == "0":
+        return None
+    IDLE.install()
+    atexit.register(IDLE.report, setting if setting.endswith(".json") else None)
+    print("⏳ Idle-time profiler on")
+    return IDLE
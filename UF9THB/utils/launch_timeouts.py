@@ -0,0 +1,139 @@
+# /utils/launch_timeouts.py
+import os
+import json
+import math
+import atexit
+import threading
+from utils.rate_limit import brand_key
+
+# Fixed budgets used until a provider has enough history
+DEFAULT_BUDGETS_MS = {
+    "launch": 60000,   # "Play Now" click → close button or toast
+    "iframe": 15000,   # close button → game iframe attached
+    "exit": 20000,     # go_back() to the lobby
+}
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class LaunchTimeouts:
+    """
+    Per-brand store of observed latencies (ms) by provider and by game,
+    kept in a small JSON file between runs. A budget is the high percentile
+    of what was seen plus a margin, so fast providers fail fast and slow
+    ones stop timing out. A timeout is stored as a sample at the budget that
+    ran out, which widens the next budget instead of repeating the miss.
+    """
+    def __init__(self, path, pct=95, margin=0.5, margin_ms=2000, floor_ms=3000,
+                 min_game_samples=3, min_provider_samples=5, keep_game=20, keep_provider=200):
+        self.path = path
+        self.pct = pct
+        self.margin = margin
+        self.margin_ms = margin_ms
+        self.floor_ms = floor_ms
+        self.min_game_samples = min_game_samples
+        self.min_provider_samples = min_provider_samples
+        self.keep_game = keep_game
+        self.keep_provider = keep_provider
+        self.lock = threading.Lock()
+        self.data = self._load()
+        self.fresh = []   # samples added by this process, merged into the file on save()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _game_key(provider_name, game_name):
+        return f"{provider_name}\x1f{game_name}"
+
+    def _add(self, data, brand, kind, provider_name, game_name, ms):
+        table = data.setdefault(brand, {}).setdefault(kind, {"providers": {}, "games": {}})
+        by_provider = table["providers"].setdefault(provider_name, [])
+        by_provider.append(ms)
+        del by_provider[:-self.keep_provider]
+        if game_name:
+            by_game = table["games"].setdefault(self._game_key(provider_name, game_name), [])
+            by_game.append(ms)
+            del by_game[:-self.keep_game]
+
+    def record(self, baseUrl, kind, provider_name, game_name, ms):
+        if provider_name is None or ms is None:
+            return
+        sample = (brand_key(baseUrl), kind, provider_name, game_name, int(ms))
+        with self.lock:
+            self._add(self.data, *sample)
+            self.fresh.append(sample)
+
+    def budget_ms(self, baseUrl, kind, provider_name=None, game_name=None):
+        """Learned budget for this game (or provider), else the fixed default."""
+        default = DEFAULT_BUDGETS_MS[kind]
+        if provider_name is None:
+            return default
+        with self.lock:
+            table = self.data.get(brand_key(baseUrl), {}).get(kind, {})
+            samples = table.get("games", {}).get(self._game_key(provider_name, game_name), []) if game_name else []
+            if len(samples) < self.min_game_samples:
+                samples = table.get("providers", {}).get(provider_name, [])
+                if len(samples) < self.min_provider_samples:
+                    return default
+            high = percentile(samples, self.pct)
+        return int(max(self.floor_ms, high * (1 + self.margin) + self.margin_ms))
+
+    def save(self):
+        """Merge this run's samples into whatever is on disk now (other shards may have written too)."""
+        with self.lock:
+            if not self.fresh:
+                return
+            data = self._load()
+            for sample in self.fresh:
+                self._add(data, *sample)
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+            print(f"💾 Launch timings saved: {len(self.fresh)} samples → {self.path}")
+            self.fresh = []
+            self.data = data
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def launch_timeouts():
+    """
+    The process-wide store, saved at exit.
+    LAUNCH_TIMEOUTS = path of the JSON file (default launch_timeouts.json),
+    LAUNCH_TIMEOUTS=off keeps the fixed budgets and records nothing.
+    """
+    global _store
+    path = os.getenv("LAUNCH_TIMEOUTS", "launch_timeouts.json")
+    if path.lower() in ("off", "0", "none"):
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = LaunchTimeouts(path)
+            atexit.register(_store.save)
+        return _store
+
+
+def budget_ms(baseUrl, kind, provider_name=None, game_name=None):
+    store = launch_timeouts()
+    if store is None:
+        return DEFAULT_BUDGETS_MS[kind]
+    return store.budget_ms(baseUrl, kind, provider_name, game_name)
+
+
+def record_latency(baseUrl, kind, provider_name, game_name, ms):
+    store = launch_timeouts()
+    if store is not None:
+        store.record(baseUrl, kind, provider_name, game_name, ms)
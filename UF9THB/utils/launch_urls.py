@@ -0,0 +1,171 @@
+# /utils/launch_urls.py
+import os
+import json
+import time
+import atexit
+import threading
+from urllib.parse import urlparse
+from utils.rate_limit import brand_key, throttle_launch
+from utils.waits import GAME_IFRAME
+from utils.game_ready import wait_for_game_ready
+from utils.render_probe import BLANK, LOADING
+
+PASSED = "passed"
+FAILED = "failed"
+EXPIRED = "expired"   # the stored URL no longer opens the game: go through the lobby
+
+# What a game provider shows for a stale launch token instead of the game
+_EXPIRED_JS = """
+() => /expired|invalid (token|session|request)|session (timeout|timed out)|unauthori[sz]ed|forbidden|please (re)?login/i
+    .test((document.body && document.body.innerText || '').slice(0, 2000))
+"""
+
+
+class LaunchUrls:
+    """
+    Per-brand store of game launch URLs, kept in a small JSON file between runs.
+    A URL is captured the first time a game is opened from the lobby (the game
+    iframe's src, or the page URL when the launch navigated away) and used to
+    open that game straight away in a fresh tab of the logged-in context.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.data = self._load()
+        self.changed = False
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _game_key(provider_name, game_name):
+        return f"{provider_name}\x1f{game_name}"
+
+    def get(self, baseUrl, provider_name, game_name):
+        """The stored entry: {"url", "lobby_url", "captured"}, or None."""
+        with self.lock:
+            return self.data.get(brand_key(baseUrl), {}).get(self._game_key(provider_name, game_name))
+
+    def put(self, baseUrl, provider_name, game_name, url, lobby_url=None):
+        with self.lock:
+            games = self.data.setdefault(brand_key(baseUrl), {})
+            games[self._game_key(provider_name, game_name)] = {"url": url, "lobby_url": lobby_url,
+                                                               "captured": int(time.time())}
+            self.changed = True
+
+    def forget(self, baseUrl, provider_name, game_name):
+        with self.lock:
+            if self.data.get(brand_key(baseUrl), {}).pop(self._game_key(provider_name, game_name), None):
+                self.changed = True
+
+    def save(self):
+        with self.lock:
+            if not self.changed:
+                return
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, self.path)
+            print(f"💾 Launch URLs saved → {self.path}")
+            self.changed = False
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def launch_urls():
+    """
+    The process-wide store, saved at exit, or None when LAUNCH_URLS is not set.
+    LAUNCH_URLS = path of the JSON file (e.g. launch_urls.json).
+    """
+    global _store
+    path = os.getenv("LAUNCH_URLS")
+    if not path or path.lower() in ("off", "0", "none"):
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = LaunchUrls(path)
+            atexit.register(_store.save)
+        return _store
+
+
+def capture_launch_url(page, baseUrl, provider_name, game_name, lobby_url=None):
+    """Remember how this game was launched; call once the game is open."""
+    store = launch_urls()
+    if store is None or provider_name is None:
+        return None
+    url = None
+    try:
+        url = page.get_attribute(GAME_IFRAME, "src", timeout=2000)
+    except Exception:
+        pass
+    if not url and lobby_url and page.url != lobby_url:
+        url = page.url   # the launch navigated the tab itself
+    if not url or urlparse(url).scheme not in ("http", "https"):
+        return None
+    store.put(baseUrl, provider_name, game_name, url, lobby_url)
+    return url
+
+
+def _route(url):
+    parts = urlparse(url or "")
+    return parts.netloc, parts.path.rstrip("/")
+
+
+def back_in_lobby(url, baseUrl, lobby_url=None):
+    """
+    True when a direct launch ended on the home page or the lobby page it was
+    captured from. Other routes on the lobby's own host are game routes
+    (launches that navigate the tab, same-host iframe launchers).
+    """
+    lobby_routes = {_route(baseUrl)}
+    if lobby_url:
+        lobby_routes.add(_route(lobby_url))
+    return _route(url) in lobby_routes
+
+
+def launch_direct(context, baseUrl, provider_name, game_name, hold_seconds=10):
+    """
+    Open the stored launch URL of a game in a new tab of the logged-in context.
+    Returns (status, seconds): PASSED / FAILED like a lobby launch, EXPIRED when
+    the URL was refused, sent back to the lobby or shows a stale-session page,
+    or (None, 0) when no URL is stored. An expired URL is dropped from the store.
+    """
+    store = launch_urls()
+    entry = store.get(baseUrl, provider_name, game_name) if store else None
+    if not entry:
+        return None, 0
+    url = entry["url"]
+    throttle_launch(baseUrl)   # a direct launch is still a launch for the brand's rate limit
+    started = time.time()
+    tab = context.new_page()
+    try:
+        try:
+            response = tab.goto(url, wait_until="domcontentloaded", timeout=30000)
+        except Exception as e:
+            print(f"⚠ Direct launch of {game_name} did not load: {e}")
+            response = None
+        if (response is None or response.status >= 400 or back_in_lobby(tab.url, baseUrl, entry.get("lobby_url"))
+                or tab.evaluate(_EXPIRED_JS)):
+            store.forget(baseUrl, provider_name, game_name)
+            print(f"⌛ Launch URL of {game_name} has expired, falling back to the lobby")
+            return EXPIRED, round(time.time() - started, 1)
+
+        ready, elapsed, signals = wait_for_game_ready(tab, None, max_wait_s=hold_seconds)
+        if not ready and tab.evaluate(_EXPIRED_JS):
+            store.forget(baseUrl, provider_name, game_name)
+            print(f"⌛ {game_name} shows a stale session page, falling back to the lobby")
+            return EXPIRED, round(time.time() - started, 1)
+        status = FAILED if signals.get("render") in (BLANK, LOADING) else PASSED
+        print(f"🚀 {game_name} opened directly: {status} after {elapsed:.1f}s ({signals.get('render') or 'load signals'})")
+        return status, round(time.time() - started, 1)
+    finally:
+        try:
+            tab.close()
+        except Exception:
+            pass
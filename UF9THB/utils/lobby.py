@@ -0,0 +1,72 @@
+# /utils/lobby.py
+from collections import namedtuple
+from utils.waits import grid_state, wait_for_grid_settled
+from utils.locators import selector, QUERY_JS
+
+PROVIDER_BTN = selector("provider_button")
+PAGE_BTN = selector("page_button")
+PLAY_BTN = selector("play_button")
+GAME_NAME = selector("game_name")
+
+# providers: button texts in order (index 0 is 'All')
+# games:     game names in order; games[i] belongs to play button i
+# pages:     visible pagination numbers in order
+# page_nth:  {page number: nth pagination button} (skips '...' style buttons)
+# active:    page number currently selected, None if the lobby does not mark it
+Lobby = namedtuple("Lobby", ["providers", "games", "play_buttons", "pages", "page_nth", "active"])
+
+# Everything the sweep reads from the lobby, in one round trip
+_LOBBY_JS = """
+({provider, page, play, name}) => {
+    const all = """ + QUERY_JS + """;
+    const text = n => (n.textContent || '').trim();
+    const pageButtons = all(page);
+    const active = pageButtons.find(b => /active|current|selected/.test(b.className) || b.getAttribute('aria-current'));
+    return {
+        providers: all(provider).map(text),
+        games: all(name).map(text),
+        playButtons: all(play).length,
+        pages: pageButtons.map((b, i) => [text(b), i]).filter(([t]) => /^\\d+$/.test(t)).map(([t, i]) => [Number(t), i]),
+        active: active && /^\\d+$/.test(text(active)) ? Number(text(active)) : null,
+    };
+}
+"""
+
+_LOBBY_ARGS = {
+    "provider": PROVIDER_BTN,
+    "page": PAGE_BTN,
+    "play": PLAY_BTN,
+    "name": GAME_NAME,
+}
+
+
+def _to_lobby(raw):
+    return Lobby(raw["providers"], raw["games"], raw["playButtons"],
+                 [number for number, _ in raw["pages"]], dict(raw["pages"]), raw["active"])
+
+
+def read_lobby(page):
+    """Providers, games, play buttons and visible pages with a single page.evaluate."""
+    return _to_lobby(page.evaluate(_LOBBY_JS, _LOBBY_ARGS))
+
+
+async def read_lobby_async(page):
+    return _to_lobby(await page.evaluate(_LOBBY_JS, _LOBBY_ARGS))
+
+
+def page_button(page, lobby, number):
+    """Locator of the visible pagination button for a page number."""
+    return page.locator(PAGE_BTN).nth(lobby.page_nth[number])
+
+
+def click_provider(page, provider_name, lobby=None):
+    """Click a provider by name (index from the snapshot, no per-button text reads) and wait for its grid."""
+    lobby = lobby or read_lobby(page)
+    if provider_name not in lobby.providers:
+        return False
+    button = page.locator(PROVIDER_BTN).nth(lobby.providers.index(provider_name))
+    button.scroll_into_view_if_needed()
+    before = grid_state(page)
+    button.click()
+    wait_for_grid_settled(page, before, 1, expect_change=True)
+    return True
@@ -0,0 +1,156 @@
+# /utils/locators.py
+import os
+from collections import namedtuple
+
+# Every locator the sweep uses, once, as an XPath and a CSS equivalent.
+# The CSS side matches on single classes instead of the whole @class string,
+# so a new utility class on a container does not break it. Text checks use
+# Playwright's :text-is()/:has-text() at the end of the selector, which the
+# in-page QUERY_JS below understands as well.
+Selector = namedtuple("Selector", ["xpath", "css"])
+
+SELECTORS = {
+    # lobby
+    "provider_button": Selector(
+        "//div[@class='mt-5 flex items-center slot_btn_container w-full overflow-auto light-scrollbar-h pb-[10px]']//button",
+        "div.slot_btn_container button"),
+    "pagination": Selector(
+        "//div[@class='p-holder admin-pagination']",
+        "div.p-holder.admin-pagination"),
+    "page_button": Selector(
+        "//div[@class='p-holder admin-pagination']/button[not(contains(@class,'p-next')) and not(contains(@class,'p-prev'))]",
+        "div.p-holder.admin-pagination > button:not(.p-next):not(.p-prev)"),
+    "page_next": Selector(
+        "//div[@class='p-holder admin-pagination']/button[contains(@class,'p-next')]",
+        "div.p-holder.admin-pagination > button.p-next"),
+    "page_prev": Selector(
+        "//div[@class='p-holder admin-pagination']/button[contains(@class,'p-prev')]",
+        "div.p-holder.admin-pagination > button.p-prev"),
+    "page_input": Selector(
+        "//div[@class='p-holder admin-pagination']//input",
+        "div.p-holder.admin-pagination input"),
+    "play_button": Selector(
+        "//div[@class='game_btn_content']//button[text()='Play Now']",
+        'div.game_btn_content button:text-is("Play Now")'),
+    "game_name": Selector(
+        "//div[@class='game_btn_content_text']",
+        "div.game_btn_content_text"),
+
+    # game
+    "close_button": Selector(
+        "//button/*[@class='w-5 h-5 game_header_close_btn']",
+        "button > .game_header_close_btn"),
+    "toast": Selector(
+        "//div[@class='toast-message text-sm' and contains(text(),'Something went wrong')]",
+        'div.toast-message:has-text("Something went wrong")'),
+    "back_button": Selector(
+        "//button[text()='Back To Home']",
+        'button:text-is("Back To Home")'),
+    "game_iframe": Selector(
+        "//iframe[contains(@class,'game_iframe')]",
+        "iframe.game_iframe"),
+
+    # menu
+    "menu_home": Selector("//a[text()=' Home']", 'a:text-is("Home")'),
+    "menu_slot": Selector("//a[text()=' Slot']", 'a:text-is("Slot")'),
+    "menu_fishing": Selector("//a[text()=' Fishing']", 'a:text-is("Fishing")'),
+    "menu_card_game": Selector("//a[text()=' Card Game']", 'a:text-is("Card Game")'),
+    "menu_instant_win": Selector("//a[text()=' Instant Win']", 'a:text-is("Instant Win")'),
+
+    # login
+    "login_open": Selector(
+        "//div[@class='flex items-center gap-2 mr-2 flex-row-reverse']//button[text()='Login']",
+        'div.flex.items-center.gap-2.mr-2 button:text-is("Login")'),
+    "login_modal": Selector("//div[@class='relative auth-skin']", "div.relative.auth-skin"),
+    "login_username": Selector(
+        "//input[@placeholder='Enter Your Username']",
+        "input[placeholder='Enter Your Username']"),
+    "login_password": Selector("//input[@placeholder='Password']", "input[placeholder='Password']"),
+    "login_submit": Selector(
+        "//div[@class='relative flex justify-center']/button[text()='Login']",
+        'div.relative.flex.justify-center > button:text-is("Login")'),
+    # the modal's own message line, with text in it (not any red or *error* styled node)
+    "login_error": Selector(
+        "//div[@class='relative auth-skin']//*[@role='alert' or contains(@class,'error-message') or contains(@class,'error_msg')][normalize-space()]",
+        "div.relative.auth-skin :is([role='alert'], [class*='error-message'], [class*='error_msg']):text-matches(\".\")"),
+    "logout": Selector("//button[text()='Logout']", 'button:text-is("Logout")'),
+
+    # popups
+    "mission_close": Selector(
+        "//div[@style='max-width:600px;']/div/button[@class='mission_daily_close_btn']/img",
+        "button.mission_daily_close_btn > img"),
+    "promo_close": Selector(
+        "//div[contains(@class,'promo') or contains(@class,'announcement')]//button[contains(@class,'close')]",
+        "[class*='promo'] button[class*='close'], [class*='announcement'] button[class*='close']"),
+    "login_modal_close": Selector(
+        "//div[@class='relative auth-skin']/button[@class='absolute top-[22px] right-[20px]']/img",
+        "div.relative.auth-skin > button.absolute > img"),
+}
+
+# What differs per brand tree (only the entries that differ). The registry is
+# read by the UF9THB tree alone; the other brand trees do not import it and
+# keep their own XPaths in their page objects, which are the same lobby, game
+# and close-button XPaths as above, so no override is known yet. A tree that
+# moves onto the registry gets an entry here with whatever turns out to differ.
+BRAND_OVERRIDES = {
+    "UF9THB": {},
+}
+_unknown_brands = set()
+
+MODES = ("css", "xpath")
+
+# In-page twin of Playwright's matching for the strings selector() returns:
+# XPath, or CSS optionally ending in :text-is("..."), :has-text("...") or :text-matches("...").
+QUERY_JS = """
+(sel, root = document) => {
+    if (/^(\\/|\\(|xpath=)/.test(sel)) {
+        const found = document.evaluate(sel.replace(/^xpath=/, ''), root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const nodes = [];
+        for (let i = 0; i < found.snapshotLength; i++) nodes.push(found.snapshotItem(i));
+        return nodes;
+    }
+    const m = sel.match(/^(.*?):(text-is|has-text|text-matches)\\("((?:[^"\\\\]|\\\\.)*)"\\)$/);
+    const nodes = [...root.querySelectorAll(m ? m[1] : sel)];
+    if (!m) return nodes;
+    const clean = t => t.replace(/\\s+/g, ' ').trim();
+    const norm = n => clean(n.textContent || '');
+    // like Playwright's :text-is, only the element's own text nodes count, not its children's
+    const own = n => clean([...n.childNodes].filter(c => c.nodeType === Node.TEXT_NODE).map(c => c.nodeValue).join(''));
+    if (m[2] === 'text-is') return nodes.filter(n => own(n) === m[3]);
+    if (m[2] === 'has-text') return nodes.filter(n => norm(n).toLowerCase().includes(m[3].toLowerCase()));
+    const re = new RegExp(m[3]);
+    return nodes.filter(n => re.test(norm(n)));
+}
+"""
+
+
+def brand():
+    """BRAND from the environment, else the name of the brand tree this code runs in."""
+    return os.getenv("BRAND") or os.path.basename(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def selector_mode():
+    """SELECTOR_MODE=xpath switches every locator back to the XPath strings (default css)."""
+    mode = (os.getenv("SELECTOR_MODE") or "css").lower()
+    return mode if mode in MODES else "css"
+
+
+def lookup(name, brand_name=None):
+    brand_name = brand_name or brand()
+    if brand_name not in BRAND_OVERRIDES and brand_name not in _unknown_brands:
+        _unknown_brands.add(brand_name)
+        print(f"⚠ No selector entry for brand {brand_name}, using the {', '.join(BRAND_OVERRIDES)} selectors")
+    return BRAND_OVERRIDES.get(brand_name, {}).get(name) or SELECTORS[name]
+
+
+def selector(name, brand_name=None, mode=None):
+    """The locator string for name, usable with page.locator() and with QUERY_JS."""
+    return getattr(lookup(name, brand_name), mode or selector_mode())
+
+
+def xpath(name, brand_name=None):
+    return lookup(name, brand_name).xpath
+
+
+def css(name, brand_name=None):
+    return lookup(name, brand_name).css
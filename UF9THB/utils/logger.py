@@ -1,4 +1,5 @@
 # /utils/logger.py
+from collections import Counter
 from datetime import datetime
 
 class Logger:
@@ -13,3 +14,15 @@ class Logger:
     @staticmethod
     def log_info(message: str):
         print(f"ℹ️ {datetime.now().strftime('%H:%M:%S')} - {message}")
+
+    @staticmethod
+    def log_summary(results, title="Sweep summary"):
+        """Per-provider status counts for a list of Game_Click-style result dicts."""
+        by_provider = {}
+        for r in results:
+            by_provider.setdefault(r["provider"], Counter())[r["status"]] += 1
+        print(f"===== {title} =====")
+        for provider_name, counts in by_provider.items():
+            print(f"{provider_name}: " + ", ".join(f"{k}={v}" for k, v in sorted(counts.items())))
+        totals = Counter(r["status"] for r in results)
+        print("TOTAL: " + ", ".join(f"{k}={v}" for k, v in sorted(totals.items())))
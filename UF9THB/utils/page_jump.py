@@ -0,0 +1,269 @@
+# /utils/page_jump.py
+import math
+from collections import namedtuple
+from utils.lobby import PAGE_BTN
+from utils.waits import grid_state, wait_for_grid_settled, grid_state_async, wait_for_grid_settled_async
+from utils.locators import selector, QUERY_JS
+
+PAGINATION = selector("pagination")
+PAGE_NEXT = selector("page_next")
+PAGE_PREV = selector("page_prev")
+PAGE_INPUT = selector("page_input")
+PAGE_PARAM_NAMES = ("page", "p", "pg", "pageno", "page_no", "pagenum")
+
+# pages/page_nth/active: as in utils.lobby.Lobby
+# total:      highest page number shown (the last-page button)
+# window:     how many number buttons are shown at once
+# url_param:  query parameter that holds the active page, if the lobby keeps one
+# component:  "vue3"/"vue2" when the paginator's component instance is reachable
+PaginationModel = namedtuple("PaginationModel", [
+    "pages", "page_nth", "active", "total", "window",
+    "has_prev", "has_next", "jump_input", "url_param", "component",
+])
+
+_MODEL_JS = """
+({container: containerSelector, page, next, prev, input, paramNames}) => {
+    const qa = """ + QUERY_JS + """;
+    const container = qa(containerSelector)[0];
+    if (!container) return null;
+    const buttons = qa(page);
+    const text = n => (n.textContent || '').trim();
+    const pages = buttons.map((b, i) => [text(b), i]).filter(([t]) => /^\\d+$/.test(t)).map(([t, i]) => [Number(t), i]);
+    const activeBtn = buttons.find(b => /active|current|selected/.test(b.className) || b.getAttribute('aria-current'));
+    const active = activeBtn && /^\\d+$/.test(text(activeBtn)) ? Number(text(activeBtn)) : null;
+    const usable = b => !!b && !b.disabled && !/disabled/.test(b.className);
+
+    let urlParam = null;
+    if (active !== null) {
+        for (const [key, value] of new URLSearchParams(location.search)) {
+            if (paramNames.includes(key.toLowerCase()) && Number(value) === active) urlParam = key;
+        }
+    }
+
+    let component = null;
+    for (let el = container; el && !component; el = el.parentElement) {
+        const v3 = el.__vueParentComponent;
+        const v2 = el.__vue__;
+        if (v3 && v3.props && ('modelValue' in v3.props || 'currentPage' in v3.props)) component = 'vue3';
+        else if (v2 && v2.$props && ('value' in v2.$props || 'currentPage' in v2.$props)) component = 'vue2';
+    }
+
+    return {
+        pages,
+        active,
+        hasPrev: usable(qa(prev)[0]),
+        hasNext: usable(qa(next)[0]),
+        jumpInput: qa(input).length > 0,
+        urlParam,
+        component,
+    };
+}
+"""
+
+# Set the page through the paginator's own component, as its buttons would
+_COMPONENT_JS = """
+({container: containerSelector, target}) => {
+    const container = (""" + QUERY_JS + """)(containerSelector)[0];
+    for (let el = container; el; el = el.parentElement) {
+        const v3 = el.__vueParentComponent;
+        if (v3 && v3.props && ('modelValue' in v3.props || 'currentPage' in v3.props)) {
+            v3.emit('modelValue' in v3.props ? 'update:modelValue' : 'update:currentPage', target);
+            if (typeof v3.props.onClick === 'function') v3.props.onClick(target);
+            return true;
+        }
+        const v2 = el.__vue__;
+        if (v2 && v2.$props && ('value' in v2.$props || 'currentPage' in v2.$props)) {
+            v2.$emit('value' in v2.$props ? 'input' : 'update:currentPage', target);
+            v2.$emit('change', target);
+            return true;
+        }
+    }
+    return false;
+}
+"""
+
+_URL_JS = """
+({param, target}) => {
+    const url = new URL(location.href);
+    url.searchParams.set(param, String(target));
+    history.pushState(history.state, '', url);
+    dispatchEvent(new PopStateEvent('popstate', {state: history.state}));
+    return url.href;
+}
+"""
+
+
+def to_model(raw):
+    pages = [number for number, _ in raw["pages"]]
+    return PaginationModel(pages, dict(raw["pages"]), raw["active"], max(pages) if pages else 0, len(pages),
+                           raw["hasPrev"], raw["hasNext"], raw["jumpInput"], raw["urlParam"], raw["component"])
+
+
+_MODEL_ARGS = {"container": PAGINATION, "page": PAGE_BTN, "next": PAGE_NEXT,
+               "prev": PAGE_PREV, "input": PAGE_INPUT, "paramNames": list(PAGE_PARAM_NAMES)}
+
+
+def read_pagination(page):
+    raw = page.evaluate(_MODEL_JS, _MODEL_ARGS)
+    return to_model(raw) if raw else None
+
+
+async def read_pagination_async(page):
+    raw = await page.evaluate(_MODEL_JS, _MODEL_ARGS)
+    return to_model(raw) if raw else None
+
+
+def next_action(model, target, skip=()):
+    """
+    The single action that gets closest to target, given what the paginator offers:
+    a visible button for it, a page input, URL state or the component (one action
+    each), otherwise the visible number nearest to it, or prev/next as a last step.
+    skip holds direct methods that already failed on this lobby.
+    """
+    if target in model.page_nth:
+        return ("click", target)
+    for method, available in (("input", model.jump_input), ("url", model.url_param), ("component", model.component)):
+        if available and method not in skip:
+            return (method, target)
+    if not model.pages:
+        return None
+    nearest = min(model.pages, key=lambda n: (abs(n - target), n))
+    if model.active is None or abs(nearest - target) < abs(model.active - target):
+        return ("click", nearest)
+    if target > model.active and model.has_next:
+        return ("next", model.active + 1)
+    if target < model.active and model.has_prev:
+        return ("prev", model.active - 1)
+    return None
+
+
+def max_actions(model):
+    """Each click re-centres the window, so even without a direct method the walk is bounded."""
+    return 3 + math.ceil(model.total / max(1, model.window // 2))
+
+
+class PageNavigator:
+    """
+    Jump the lobby to any page in a bounded number of actions.
+    Reads the pagination model once per action (one evaluate), then either goes
+    straight there (visible button, page input, URL state, component state)
+    or hops through the visible number nearest to the target. Every action is
+    confirmed with the grid-settled wait; a direct method that does not land on
+    the target is skipped for the rest of the jump.
+    """
+    def __init__(self, page):
+        self.page = page
+        self.actions = 0
+
+    def _settle(self, before, expect):
+        return wait_for_grid_settled(self.page, before, expect)["settled"]
+
+    def _do(self, action):
+        kind, number = action
+        before = grid_state(self.page)
+        self.actions += 1
+        if kind == "click":
+            button = self.page.locator(PAGE_BTN).nth(self.model.page_nth[number])
+            button.scroll_into_view_if_needed()
+            button.click()
+        elif kind in ("next", "prev"):
+            self.page.locator(PAGE_NEXT if kind == "next" else PAGE_PREV).click()
+        elif kind == "input":
+            field = self.page.locator(PAGE_INPUT).first
+            field.fill(str(number))
+            field.press("Enter")
+        elif kind == "url":
+            href = self.page.evaluate(_URL_JS, {"param": self.model.url_param, "target": number})
+            if not self._settle(before, number):
+                self.actions += 1
+                self.page.goto(href, wait_until="domcontentloaded")   # router ignored popstate: load it
+        elif kind == "component":
+            if not self.page.evaluate(_COMPONENT_JS, {"container": PAGINATION, "target": number}):
+                return False
+        return self._settle(before, number)
+
+    def jump(self, target):
+        """Returns True once the lobby shows target; self.actions counts what it took."""
+        self.actions = 0
+        skip = set()
+        self.model = read_pagination(self.page)
+        if self.model is None:
+            return False
+        for _ in range(max_actions(self.model)):
+            if self.model.active == target:
+                return True
+            action = next_action(self.model, target, skip)
+            if action is None:
+                return False
+            landed = self._do(action)
+            if action[0] == "click" and action[1] == target and landed:
+                return True
+            if action[0] in ("input", "url", "component") and not landed:
+                skip.add(action[0])
+            previous = self.model
+            self.model = read_pagination(self.page)
+            if self.model is None:
+                return False
+            if action[0] in ("click", "next", "prev") and self.model[:3] == previous[:3]:
+                return False   # nothing moved: the target is out of range
+        return self.model.active == target
+
+
+class AsyncPageNavigator:
+    """Async counterpart of PageNavigator, for pages/async_game_page.py."""
+    def __init__(self, page):
+        self.page = page
+        self.actions = 0
+
+    async def _settle(self, before, expect):
+        return (await wait_for_grid_settled_async(self.page, before, expect))["settled"]
+
+    async def _do(self, action):
+        kind, number = action
+        before = await grid_state_async(self.page)
+        self.actions += 1
+        if kind == "click":
+            button = self.page.locator(PAGE_BTN).nth(self.model.page_nth[number])
+            await button.scroll_into_view_if_needed()
+            await button.click()
+        elif kind in ("next", "prev"):
+            await self.page.locator(PAGE_NEXT if kind == "next" else PAGE_PREV).click()
+        elif kind == "input":
+            field = self.page.locator(PAGE_INPUT).first
+            await field.fill(str(number))
+            await field.press("Enter")
+        elif kind == "url":
+            href = await self.page.evaluate(_URL_JS, {"param": self.model.url_param, "target": number})
+            if not await self._settle(before, number):
+                self.actions += 1
+                await self.page.goto(href, wait_until="domcontentloaded")
+        elif kind == "component":
+            if not await self.page.evaluate(_COMPONENT_JS, {"container": PAGINATION, "target": number}):
+                return False
+        return await self._settle(before, number)
+
+    async def jump(self, target):
+        """Returns True once the lobby shows target; self.actions counts what it took."""
+        self.actions = 0
+        skip = set()
+        self.model = await read_pagination_async(self.page)
+        if self.model is None:
+            return False
+        for _ in range(max_actions(self.model)):
+            if self.model.active == target:
+                return True
+            action = next_action(self.model, target, skip)
+            if action is None:
+                return False
+            landed = await self._do(action)
+            if action[0] == "click" and action[1] == target and landed:
+                return True
+            if action[0] in ("input", "url", "component") and not landed:
+                skip.add(action[0])
+            previous = self.model
+            self.model = await read_pagination_async(self.page)
+            if self.model is None:
+                return False
+            if action[0] in ("click", "next", "prev") and self.model[:3] == previous[:3]:
+                return False   # nothing moved: the target is out of range
+        return self.model.active == target
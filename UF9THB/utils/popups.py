@@ -0,0 +1,95 @@
+# /utils/popups.py
+import weakref
+from utils.locators import selector
+
+MISSION_CLOSE = selector("mission_close")
+PROMO_CLOSE = selector("promo_close")
+LOGIN_MODAL_CLOSE = selector("login_modal_close")
+
+# (name, close button that is only visible while the popup is up)
+POPUPS = [
+    ("mission dialog", MISSION_CLOSE),
+    ("promo modal", PROMO_CLOSE),
+    ("login modal", LOGIN_MODAL_CLOSE),
+]
+
+
+class PopupHandlers:
+    """
+    Registers page.add_locator_handler for every known popup. Playwright only
+    looks at them right before an action, so nothing is waited for when no
+    popup is up, and a popup that shows up late in the sweep is closed before
+    it can swallow the next click.
+    The login modal handler stands down while Login.login has the modal open.
+    """
+    def __init__(self, page):
+        self.page = page
+        self.login_in_progress = False
+        self.dismissed = {}
+
+    def install(self):
+        for name, xpath in POPUPS:
+            # the login modal is sometimes open on purpose, so never wait for it to go away
+            self.page.add_locator_handler(self.page.locator(xpath), self._dismiss(name),
+                                          no_wait_after=name == "login modal")
+        return self
+
+    def _dismiss(self, name):
+        def handler(locator):
+            if name == "login modal" and self.login_in_progress:
+                return
+            try:
+                locator.first.click(timeout=3000)
+                self.dismissed[name] = self.dismissed.get(name, 0) + 1
+                print(f"🧹 Dismissed {name}")
+            except Exception as e:
+                print(f"⚠ Could not dismiss {name}: {e}")
+        return handler
+
+
+class AsyncPopupHandlers(PopupHandlers):
+    """Same handlers for the async API (AsyncGameClick)."""
+    async def install(self):
+        for name, xpath in POPUPS:
+            await self.page.add_locator_handler(self.page.locator(xpath), self._dismiss(name),
+                                                no_wait_after=name == "login modal")
+        return self
+
+    def _dismiss(self, name):
+        async def handler(locator):
+            if name == "login modal" and self.login_in_progress:
+                return
+            try:
+                await locator.first.click(timeout=3000)
+                self.dismissed[name] = self.dismissed.get(name, 0) + 1
+                print(f"🧹 Dismissed {name}")
+            except Exception as e:
+                print(f"⚠ Could not dismiss {name}: {e}")
+        return handler
+
+
+_installed = weakref.WeakKeyDictionary()
+
+
+def popup_handlers(page):
+    """The handlers installed on this page, or None (not installed, or Playwright older than 1.42)."""
+    return _installed.get(page)
+
+
+def install_popup_handlers(page):
+    """Install the handlers once per page; returns them, or None when add_locator_handler is missing."""
+    if page in _installed:
+        return _installed[page]
+    if not hasattr(page, "add_locator_handler"):
+        return None
+    _installed[page] = PopupHandlers(page).install()
+    return _installed[page]
+
+
+async def install_popup_handlers_async(page):
+    if page in _installed:
+        return _installed[page]
+    if not hasattr(page, "add_locator_handler"):
+        return None
+    _installed[page] = await AsyncPopupHandlers(page).install()
+    return _installed[page]
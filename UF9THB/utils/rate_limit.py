@@ -0,0 +1,173 @@
+# /utils/rate_limit.py
+import os
+import time
+import asyncio
+import threading
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    Classic token bucket: holds up to `burst` tokens and refills at
+    `rate_per_min` tokens per minute. Every launch takes one token, so short
+    bursts go straight through and the long-run rate never exceeds the refill.
+    Thread-safe, so all sweep workers in a process can share one bucket.
+    """
+    def __init__(self, rate_per_min, burst=1):
+        self.rate = rate_per_min / 60.0
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        """Take a token if one is there; otherwise return seconds until the next one."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        waited = 0.0
+        while True:
+            wait = self.take()
+            if wait == 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self):
+        waited = 0.0
+        while True:
+            wait = self.take()
+            if wait == 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+
+class RemoteBucket:
+    """
+    Takes launch tokens from the coordinator's bucket (POST /launch), so every
+    worker of a brand, on any machine, shares one LAUNCH_RATE.
+    When the coordinator has no limit, the first reply turns this into a no-op.
+    """
+    def __init__(self, client):
+        self.client = client
+        self.limited = True
+
+    def acquire(self):
+        waited = 0.0
+        while self.limited:
+            reply = self.client.launch()
+            self.limited = reply.get("limited", False)
+            wait = reply.get("wait", 0)
+            if wait == 0:
+                break
+            time.sleep(wait)
+            waited += wait
+        return waited
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+_bad_rates = set()   # LAUNCH_RATE values already warned about
+_bad_bursts = set()   # LAUNCH_BURST values already warned about
+_rate_share = 1   # processes splitting LAUNCH_RATE between them (e.g. --shard i/n)
+
+
+def brand_key(baseUrl):
+    """uf-9.com/en-th and uf-9.com/en-vn are different brands on the same host."""
+    parsed = urlparse(baseUrl or "")
+    return f"{parsed.netloc}{parsed.path.rstrip('/')}"
+
+
+def launch_rate():
+    """LAUNCH_RATE as launches per minute, or None when it is unset or not a positive number."""
+    rate = os.getenv("LAUNCH_RATE")
+    if not rate:
+        return None
+    try:
+        value = float(rate)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        if rate not in _bad_rates:
+            _bad_rates.add(rate)
+            print(f"⚠ LAUNCH_RATE={rate!r} is not a positive number, launches are not limited")
+        return None
+    return value
+
+
+def launch_burst():
+    """LAUNCH_BURST as a positive whole number of back-to-back launches; 1 when unset or invalid."""
+    burst = os.getenv("LAUNCH_BURST")
+    if not burst:
+        return 1
+    try:
+        value = int(burst)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        if burst not in _bad_bursts:
+            _bad_bursts.add(burst)
+            print(f"⚠ LAUNCH_BURST={burst!r} is not a positive whole number, using 1")
+        return 1
+    return value
+
+
+def share_launch_rate(processes):
+    """
+    This process is one of `processes` sweeping the same brand without a
+    coordinator (e.g. --shard i/n): each gets LAUNCH_RATE / processes, so the
+    brand as a whole stays at LAUNCH_RATE.
+    """
+    global _rate_share
+    _rate_share = max(1, int(processes))
+
+
+def use_bucket(baseUrl, bucket):
+    """Install a bucket for a brand in place of the local one (e.g. a RemoteBucket)."""
+    with _buckets_lock:
+        _buckets[brand_key(baseUrl)] = bucket
+
+
+def launch_bucket(baseUrl):
+    """
+    The shared bucket for a brand, or None when LAUNCH_RATE is not set.
+    LAUNCH_RATE = launches per minute for the whole brand, LAUNCH_BURST = launches allowed back to back.
+    """
+    key = brand_key(baseUrl)
+    with _buckets_lock:
+        if key in _buckets:
+            return _buckets[key]
+        rate = launch_rate()
+        if rate is None:
+            return None
+        _buckets[key] = TokenBucket(rate / _rate_share, launch_burst())
+        share = f" (1/{_rate_share} of {rate:g}/min)" if _rate_share > 1 else ""
+        print(f"🪣 Launch limit for {key}: {rate / _rate_share:g}/min{share}, burst {_buckets[key].burst}")
+        return _buckets[key]
+
+
+def throttle_launch(baseUrl):
+    """Block until this brand may launch another game (no-op without LAUNCH_RATE)."""
+    bucket = launch_bucket(baseUrl)
+    if bucket is None:
+        return
+    waited = bucket.acquire()
+    if waited >= 1:
+        print(f"🪣 Held launch {waited:.1f}s for rate limit")
+
+
+async def throttle_launch_async(baseUrl):
+    bucket = launch_bucket(baseUrl)
+    if bucket is None:
+        return
+    waited = await bucket.acquire_async()
+    if waited >= 1:
+        print(f"🪣 Held launch {waited:.1f}s for rate limit")
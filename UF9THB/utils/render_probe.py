@@ -0,0 +1,138 @@
+# /utils/render_probe.py
+import time
+import base64
+
+BLANK = "blank"         # one flat colour (black screen, white page, empty canvas)
+LOADING = "loading"     # almost flat with a part that moved between two probes (spinner, progress bar)
+STATIC = "static"       # almost flat and still (dark splash, one-colour start screen): inconclusive
+RENDERED = "rendered"   # real artwork on screen
+NEARLY_FLAT = "nearly_flat"   # one sample only: LOADING or STATIC once the next probe shows motion or not
+
+GRID = 12   # GRID x GRID sample points
+
+# Runs inside the game frame: nearest-neighbour samples of every canvas.
+# Uses the unhooked getContext so the readiness counters are not bumped.
+# Cross-origin images taint a canvas; those are skipped (the screenshot path covers them).
+_CANVAS_SAMPLES_JS = """
+grid => {
+    const getContext = window.__qaGetContext || HTMLCanvasElement.prototype.getContext;
+    const out = [];
+    for (const c of document.getElementsByTagName('canvas')) {
+        if (c.width < 2 || c.height < 2) continue;
+        try {
+            const t = document.createElement('canvas');
+            t.width = grid; t.height = grid;
+            const ctx = getContext.call(t, '2d');
+            ctx.imageSmoothingEnabled = false;
+            ctx.drawImage(c, 0, 0, grid, grid);
+            out.push(Array.from(ctx.getImageData(0, 0, grid, grid).data));
+        } catch (e) {}
+    }
+    return out;
+}
+"""
+
+# Runs in the lobby page: decode a PNG screenshot of the iframe and sample it
+_IMAGE_SAMPLES_JS = """
+async ({data, grid}) => {
+    const img = new Image();
+    img.src = 'data:image/png;base64,' + data;
+    await img.decode();
+    const t = document.createElement('canvas');
+    t.width = grid; t.height = grid;
+    const ctx = (window.__qaGetContext || HTMLCanvasElement.prototype.getContext).call(t, '2d');
+    ctx.imageSmoothingEnabled = false;
+    ctx.drawImage(img, 0, 0, grid, grid);
+    return Array.from(ctx.getImageData(0, 0, grid, grid).data);
+}
+"""
+
+
+def classify(rgba):
+    """BLANK / NEARLY_FLAT / RENDERED from a flat [r, g, b, a, r, g, b, a, ...] sample list."""
+    pixels = []
+    for i in range(0, len(rgba) - 3, 4):
+        r, g, b, a = rgba[i:i + 4]
+        if a == 0:
+            r = g = b = 0   # transparent reads as an empty screen
+        pixels.append((r, g, b))
+    if not pixels:
+        return BLANK
+
+    luma = [0.299 * r + 0.587 * g + 0.114 * b for r, g, b in pixels]
+    buckets = {}
+    for r, g, b in pixels:
+        key = (r >> 4, g >> 4, b >> 4)
+        buckets[key] = buckets.get(key, 0) + 1
+    dominant = max(buckets.values()) / len(pixels)
+
+    if len(buckets) == 1 or max(luma) - min(luma) < 12:
+        return BLANK
+    if dominant >= 0.85 or len(buckets) <= 3:
+        return NEARLY_FLAT
+    return RENDERED
+
+
+def moved(before, after, threshold=16):
+    """True when any sample point changed by more than threshold on some channel."""
+    if not before or len(before) != len(after):
+        return False
+    return any(abs(a - b) > threshold for a, b in zip(before, after))
+
+
+def _frame_tree(frame):
+    frames = [frame]
+    for child in frame.child_frames:
+        frames.extend(_frame_tree(child))
+    return frames
+
+
+def probe_canvas(game_frame, grid=GRID):
+    """Best verdict over every readable canvas in the game frame tree, or None if none was readable."""
+    verdicts = []
+    for frame in _frame_tree(game_frame):
+        try:
+            samples = frame.evaluate(_CANVAS_SAMPLES_JS, grid)
+        except Exception:
+            continue
+        verdicts.extend(classify(s) for s in samples)
+    for verdict in (RENDERED, NEARLY_FLAT, BLANK):
+        if verdict in verdicts:
+            return verdict
+    return None
+
+
+def screenshot_samples(page, iframe_selector, grid=GRID):
+    """Samples of what the iframe actually shows on screen (covers WebGL and DOM-only games)."""
+    png = page.locator(iframe_selector).first.screenshot(type="png", timeout=3000, animations="allow")
+    return page.evaluate(_IMAGE_SAMPLES_JS, {"data": base64.b64encode(png).decode("ascii"), "grid": grid})
+
+
+def probe_screenshot(page, iframe_selector, grid=GRID):
+    return classify(screenshot_samples(page, iframe_selector, grid))
+
+
+def probe_render(page, iframe_selector, game_frame=None, previous=None):
+    """
+    Decide whether the game has rendered. Canvas samples are read in the frame
+    first (a few ms); if they do not show artwork (WebGL without a preserved
+    buffer reads back empty) a screenshot of the iframe settles it.
+    A nearly flat screen is only LOADING when it moved since the previous
+    probe's samples (pass them as `previous`), STATIC when it did not, and
+    NEARLY_FLAT while there is nothing to compare with yet.
+    Returns (verdict, source, ms, samples).
+    """
+    started = time.perf_counter()
+    if game_frame is not None:
+        verdict = probe_canvas(game_frame)
+        if verdict == RENDERED:
+            return verdict, "canvas", round((time.perf_counter() - started) * 1000), None
+    samples = None
+    try:
+        samples = screenshot_samples(page, iframe_selector)
+        verdict, source = classify(samples), "screenshot"
+    except Exception:
+        verdict, source = None, "none"
+    if verdict == NEARLY_FLAT and previous:
+        verdict = LOADING if moved(previous, samples) else STATIC
+    return verdict, source, round((time.perf_counter() - started) * 1000), samples
@@ -0,0 +1,88 @@
+# /utils/sharding.py
+import os
+import json
+import hashlib
+from utils.rate_limit import share_launch_rate
+
+
+def parse_shard(text):
+    """'2/4' → (2, 4). Shards are numbered from 1."""
+    try:
+        index, count = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise ValueError(f"shard must look like i/n, got {text!r}")
+    if not 1 <= index <= count:
+        raise ValueError(f"shard index must be between 1 and {count}, got {index}")
+    return index, count
+
+
+def stable_hash(provider_name, game_name):
+    """Same value on every host and every run (unlike the built-in hash())."""
+    key = f"{provider_name}\x1f{game_name}".encode("utf-8")
+    return int.from_bytes(hashlib.sha1(key).digest()[:8], "big")
+
+
+def load_durations(path):
+    """Average duration_s per (provider, game) from an earlier results JSON file."""
+    totals = {}
+    with open(path, encoding="utf-8") as f:
+        for r in json.load(f):
+            if r.get("duration_s") is None:
+                continue
+            key = (r["provider"], r["game"])
+            total, count = totals.get(key, (0.0, 0))
+            totals[key] = (total + r["duration_s"], count + 1)
+    return {key: total / count for key, (total, count) in totals.items()}
+
+
+class ShardFilter:
+    """
+    Decides whether a game belongs to this shard.
+    Games with a known duration are packed longest-first onto the least loaded
+    shard, so shards finish at about the same time. Ties and unknown games fall
+    back to the stable hash. Every shard reads the same history, so they all
+    agree on the same split.
+    """
+    def __init__(self, index, count, durations=None):
+        self.index = index
+        self.count = count
+        self.assigned = {}
+        if durations:
+            self._balance(durations)
+
+    def _balance(self, durations):
+        loads = [0.0] * self.count
+        ordered = sorted(durations.items(), key=lambda kv: (-kv[1], stable_hash(*kv[0])))
+        for key, seconds in ordered:
+            shard = min(range(self.count), key=lambda s: (loads[s], s))
+            loads[shard] += seconds
+            self.assigned[key] = shard + 1
+        print(f"⚖ Shard loads from history: " + ", ".join(f"{load:.0f}s" for load in loads))
+
+    def shard_of(self, provider_name, game_name):
+        shard = self.assigned.get((provider_name, game_name))
+        if shard is None:
+            shard = stable_hash(provider_name, game_name) % self.count + 1
+        return shard
+
+    def __call__(self, provider_name, game_name):
+        return self.shard_of(provider_name, game_name) == self.index
+
+
+def add_shard_arguments(parser):
+    parser.add_argument("--shard", default=os.getenv("SWEEP_SHARD"),
+                        help="only test shard i of n, e.g. 2/4 (env SWEEP_SHARD)")
+    parser.add_argument("--shard-history", default=os.getenv("SHARD_HISTORY"),
+                        help="earlier results JSON used to balance shards by game duration (env SHARD_HISTORY)")
+
+
+def shard_filter_from_args(args):
+    if not args.shard:
+        return None
+    index, count = parse_shard(args.shard)
+    durations = None
+    if args.shard_history and os.path.exists(args.shard_history):
+        durations = load_durations(args.shard_history)
+    print(f"🧩 Running shard {index}/{count}")
+    share_launch_rate(count)   # the shards together stay within LAUNCH_RATE
+    return ShardFilter(index, count, durations)
@@ -0,0 +1,251 @@
+# /utils/waits.py
+import time
+from enum import Enum
+from collections import namedtuple
+from utils.locators import selector, QUERY_JS
+from utils.idle_profiler import idle_wait
+
+CLOSE_BTN = selector("close_button")
+TOAST = selector("toast")
+GAME_IFRAME = selector("game_iframe")
+BACK_BTN = selector("back_button")
+GAME_NAME = selector("game_name")
+PAGE_BTN = selector("page_button")
+
+
+class LaunchOutcome(Enum):
+    CLOSE_BUTTON = "close_button"   # game header is up
+    TOAST = "toast"                 # "Something went wrong. Try again later."
+    IFRAME = "iframe"               # game iframe attached, header not shown yet
+    NAVIGATION = "navigation"       # URL changed / document replaced
+    TIMEOUT = "timeout"
+
+
+ALL_SIGNALS = (LaunchOutcome.TOAST, LaunchOutcome.CLOSE_BUTTON, LaunchOutcome.IFRAME, LaunchOutcome.NAVIGATION)
+FINAL_SIGNALS = (LaunchOutcome.TOAST, LaunchOutcome.CLOSE_BUTTON)
+
+LaunchResult = namedtuple("LaunchResult", ["outcome", "latency_ms"])
+
+# Resolves with the first signal seen. A MutationObserver re-checks on every DOM
+# change, so there is no polling interval; the timeout is a JS timer.
+_RACE_JS = """
+({closeSelector, toastSelector, iframeSelector, signals, timeoutMs}) => new Promise(resolve => {
+    const startHref = location.href;
+    const qa = """ + QUERY_JS + """;
+    const node = sel => qa(sel)[0] || null;
+    const visible = sel => {
+        const n = node(sel);
+        if (!n) return false;
+        const r = n.getBoundingClientRect();
+        const s = getComputedStyle(n);
+        return r.width > 0 && r.height > 0 && s.visibility !== 'hidden' && s.display !== 'none';
+    };
+    const check = () => {
+        if (signals.includes('toast') && visible(toastSelector)) return 'toast';
+        if (signals.includes('close_button') && visible(closeSelector)) return 'close_button';
+        if (signals.includes('iframe') && node(iframeSelector)) return 'iframe';
+        if (signals.includes('navigation') && location.href !== startHref) return 'navigation';
+        return null;
+    };
+    let done = false, observer = null, timer = null;
+    const finish = outcome => {
+        if (done) return;
+        done = true;
+        if (observer) observer.disconnect();
+        clearTimeout(timer);
+        window.removeEventListener('popstate', onChange);
+        resolve(outcome);
+    };
+    const onChange = () => { const outcome = check(); if (outcome) finish(outcome); };
+    observer = new MutationObserver(onChange);
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    window.addEventListener('popstate', onChange);
+    timer = setTimeout(() => finish('timeout'), timeoutMs);
+    onChange();
+})
+"""
+
+
+@idle_wait
+def wait_for_launch_outcome(page, timeout_ms=60000, signals=ALL_SIGNALS,
+                            close_selector=CLOSE_BTN, toast_selector=TOAST,
+                            iframe_selector=GAME_IFRAME):
+    """
+    Race the launch signals after a "Play Now" click and return a LaunchResult
+    the moment the first one fires, with the latency in milliseconds.
+    A full page navigation destroys the JS context mid-wait; that counts as
+    NAVIGATION when it is watched, otherwise the race restarts on the new document.
+    """
+    started = time.perf_counter()
+    names = [s.value for s in signals]
+    while True:
+        remaining = timeout_ms - (time.perf_counter() - started) * 1000
+        if remaining <= 0:
+            return LaunchResult(LaunchOutcome.TIMEOUT, round((time.perf_counter() - started) * 1000))
+        try:
+            raw = page.evaluate(_RACE_JS, {
+                "closeSelector": close_selector,
+                "toastSelector": toast_selector,
+                "iframeSelector": iframe_selector,
+                "signals": names,
+                "timeoutMs": int(remaining),
+            })
+        except Exception:
+            if LaunchOutcome.NAVIGATION in signals:
+                raw = LaunchOutcome.NAVIGATION.value
+            else:
+                try:
+                    page.wait_for_load_state("domcontentloaded", timeout=max(1, int(remaining)))
+                except Exception:
+                    pass
+                continue
+        return LaunchResult(LaunchOutcome(raw), round((time.perf_counter() - started) * 1000))
+
+
+# Game grid + pagination as the lobby shows them right now
+_GRID_STATE_JS = """
+({name, page}) => {
+    const qa = """ + QUERY_JS + """;
+    const names = qa(name).map(n => n.textContent.trim());
+    const active = qa(page).find(b => /active|current|selected/.test(b.className) || b.getAttribute('aria-current'));
+    return {signature: names.join('\\n'), count: names.length, active: active ? active.textContent.trim() : null};
+}
+"""
+_GRID_ARGS = {"name": GAME_NAME, "page": PAGE_BTN}
+
+# Resolves once the grid differs from `before` (when a change is expected),
+# has had no DOM mutations for quietMs, and the active page is the target.
+_GRID_SETTLED_JS = """
+({grid, before, target, expectChange, quietMs, timeoutMs}) => new Promise(resolve => {
+    const state = () => (""" + _GRID_STATE_JS + """)(grid);
+    const started = performance.now();
+    let lastMutation = performance.now();
+    let quietTimer = null, deadline = null;
+    const done = ok => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(deadline);
+        resolve({settled: ok, ms: Math.round(performance.now() - started), ...state()});
+    };
+    const check = () => {
+        const now = state();
+        const changed = !expectChange || now.signature !== before.signature;
+        const onTarget = target === null || now.active === null || now.active === String(target);
+        if (changed && onTarget && now.count > 0 && performance.now() - lastMutation >= quietMs) done(true);
+    };
+    const observer = new MutationObserver(() => {
+        lastMutation = performance.now();
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(check, quietMs);
+    });
+    observer.observe(document.body, {subtree: true, childList: true, characterData: true, attributes: true});
+    quietTimer = setTimeout(check, quietMs);
+    deadline = setTimeout(() => done(false), timeoutMs);
+})
+"""
+
+
+def grid_state(page):
+    """Signature of the visible game grid and the active page number (None if unknown)."""
+    return page.evaluate(_GRID_STATE_JS, _GRID_ARGS)
+
+
+@idle_wait
+def wait_for_grid_settled(page, before, target_page=None, quiet_ms=300, timeout_ms=8000, expect_change=None):
+    """
+    Wait for the game grid to re-render after a pagination or provider click.
+    `before` is grid_state() taken just before the click. By default a change is
+    only required when the lobby marked an active page and it was not target_page;
+    with no active marker there is no telling, so none is required. Provider
+    clicks pass expect_change=True, since page 1 of the new provider is still page 1.
+    Returns the final state with 'settled' (False on timeout) and 'ms'.
+    """
+    try:
+        return page.evaluate(_GRID_SETTLED_JS, _settle_args(before, target_page, quiet_ms, timeout_ms, expect_change))
+    except Exception as e:
+        print(f"⚠ Grid settle wait failed: {e}")
+        return {"settled": False, "ms": None}
+
+
+async def grid_state_async(page):
+    return await page.evaluate(_GRID_STATE_JS, _GRID_ARGS)
+
+
+@idle_wait
+async def wait_for_grid_settled_async(page, before, target_page=None, quiet_ms=300, timeout_ms=8000, expect_change=None):
+    """Async counterpart of wait_for_grid_settled."""
+    try:
+        return await page.evaluate(_GRID_SETTLED_JS, _settle_args(before, target_page, quiet_ms, timeout_ms, expect_change))
+    except Exception as e:
+        print(f"⚠ Grid settle wait failed: {e}")
+        return {"settled": False, "ms": None}
+
+
+def _settle_args(before, target_page, quiet_ms, timeout_ms, expect_change):
+    if expect_change is None:
+        active = before.get("active")
+        expect_change = active is not None and (target_page is None or active != str(target_page))
+    return {
+        "grid": _GRID_ARGS,
+        "before": before,
+        "target": target_page,
+        "expectChange": expect_change,
+        "quietMs": quiet_ms,
+        "timeoutMs": timeout_ms,
+    }
+
+
+# Resolves with the name of the first marker that holds, or null on timeout.
+# A marker in `selectors` holds when its selector is visible; one in `gone`
+# holds when none of its selectors are visible any more.
+_ANY_VISIBLE_JS = """
+({selectors, gone, timeoutMs}) => new Promise(resolve => {
+    const qa = """ + QUERY_JS + """;
+    const visible = sel => {
+        const n = qa(sel)[0];
+        if (!n) return false;
+        const r = n.getBoundingClientRect();
+        const s = getComputedStyle(n);
+        return r.width > 0 && r.height > 0 && s.visibility !== 'hidden' && s.display !== 'none';
+    };
+    const check = () =>
+        Object.keys(gone).find(name => !gone[name].some(visible)) ||
+        Object.keys(selectors).find(name => visible(selectors[name])) || null;
+    let observer = null, timer = null;
+    const finish = name => {
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve(name);
+    };
+    observer = new MutationObserver(() => { const name = check(); if (name) finish(name); });
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    timer = setTimeout(() => finish(null), timeoutMs);
+    const first = check();
+    if (first) finish(first);
+})
+"""
+
+
+@idle_wait
+def wait_for_any_visible(page, selectors, timeout_ms, gone=None):
+    """
+    Wait until one of the named selectors is visible and return its name (None on timeout).
+    selectors is a dict {name: selector}; earlier entries win when several are visible.
+    gone is a dict {name: [selectors]} whose name is returned once none of them
+    is visible; gone markers are checked before the visible ones.
+    """
+    try:
+        return page.evaluate(_ANY_VISIBLE_JS, {"selectors": selectors, "gone": gone or {},
+                                               "timeoutMs": int(timeout_ms)})
+    except Exception:
+        return None   # document replaced mid-wait; the caller decides whether to look again
+
+
+@idle_wait
+async def wait_for_any_visible_async(page, selectors, timeout_ms, gone=None):
+    """Async counterpart of wait_for_any_visible."""
+    try:
+        return await page.evaluate(_ANY_VISIBLE_JS, {"selectors": selectors, "gone": gone or {},
+                                                     "timeoutMs": int(timeout_ms)})
+    except Exception:
+        return None
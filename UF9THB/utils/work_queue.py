@@ -0,0 +1,49 @@
+# /utils/work_queue.py
+import threading
+from collections import deque, namedtuple
+
+WorkItem = namedtuple("WorkItem", ["provider", "page", "index", "name"])
+
+
+class WorkStealingQueue:
+    """
+    One deque of WorkItems per worker, filled with contiguous slices of the
+    catalog so a worker mostly stays on the same provider page.
+    - A worker takes from the front of its own deque.
+    - When it runs dry it steals the back half of the longest deque, which is
+      the part of that backlog its owner would reach last.
+    """
+    def __init__(self, workers):
+        self.backlogs = [deque() for _ in range(workers)]
+        self.lock = threading.Lock()
+        self.steals = 0
+
+    def distribute(self, items):
+        items = list(items)
+        per_worker, extra = divmod(len(items), len(self.backlogs))
+        start = 0
+        with self.lock:
+            for worker_id, backlog in enumerate(self.backlogs):
+                size = per_worker + (1 if worker_id < extra else 0)
+                backlog.extend(items[start:start + size])
+                start += size
+
+    def get(self, worker_id):
+        """Next item for worker_id, or None once every backlog is empty."""
+        with self.lock:
+            own = self.backlogs[worker_id]
+            if own:
+                return own.popleft()
+
+            victim = max(self.backlogs, key=len)
+            if not victim:
+                return None
+            stolen = [victim.pop() for _ in range((len(victim) + 1) // 2)]
+            stolen.reverse()
+            own.extend(stolen)
+            self.steals += 1
+            return own.popleft()
+
+    def remaining(self):
+        with self.lock:
+            return sum(len(b) for b in self.backlogs)
@@ -0,0 +1,136 @@
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import subprocess
+from collections import Counter
+
+# run_all_brands.py
+# One worker process per brand tree. Every worker runs that brand's own entry
+# point from its own folder, so it gets its own Playwright instance and loads
+# its own .env credentials. A crash in one brand only ends that process.
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+BRANDS = ["BETA289THB", "JIT99MMK", "MAGARNPR", "UF99THB", "UF9THB", "UF9VND"]
+
+# Brands that cannot write a results file are summarised from their console log
+LOG_MARKERS = {
+    "passed": re.compile(r"✅ (Success|Closed)"),
+    "failed": re.compile(r"❌ (Failed|Toast error)"),
+    "timeout": re.compile(r"⚠ Timeout"),
+    "error": re.compile(r"Error on "),
+}
+
+
+def start_brand(brand, script, log_dir):
+    brand_dir = os.path.join(ROOT, brand)
+    log_path = os.path.join(log_dir, f"{brand}.log")
+    results_path = os.path.join(log_dir, f"{brand}_results.json")
+    if os.path.exists(results_path):
+        os.remove(results_path)
+
+    env = dict(os.environ)
+    # drop inherited credentials so each brand's own .env is the only source
+    for key in ("BASE_URL", "USERNAME", "PASSWORD"):
+        env.pop(key, None)
+    env["PYTHONUNBUFFERED"] = "1"
+    env["PYTHONIOENCODING"] = "utf-8"
+    env["SWEEP_RESULTS"] = results_path
+
+    log_file = open(log_path, "w", encoding="utf-8")
+    proc = subprocess.Popen(
+        [sys.executable, script],
+        cwd=brand_dir,
+        env=env,
+        stdout=log_file,
+        stderr=subprocess.STDOUT,
+    )
+    print(f"🚀 {brand}: started pid {proc.pid} → {log_path}")
+    return {
+        "brand": brand,
+        "proc": proc,
+        "log_file": log_file,
+        "log_path": log_path,
+        "results_path": results_path,
+        "started": time.time(),
+    }
+
+
+def collect_counts(worker):
+    """Per-status counts from the results file, or the log when there is none."""
+    if os.path.exists(worker["results_path"]):
+        try:
+            with open(worker["results_path"], encoding="utf-8") as f:
+                return Counter(r["status"] for r in json.load(f)), "results"
+        except (ValueError, KeyError) as e:
+            print(f"⚠ {worker['brand']}: unreadable results file ({e}), using log")
+
+    counts = Counter()
+    with open(worker["log_path"], encoding="utf-8", errors="replace") as f:
+        for line in f:
+            for status, marker in LOG_MARKERS.items():
+                if marker.search(line):
+                    counts[status] += 1
+                    break
+    return counts, "log"
+
+
+def run_brands(brands, script="main_slot.py", log_dir="logs"):
+    log_dir = os.path.join(ROOT, log_dir)
+    os.makedirs(log_dir, exist_ok=True)
+
+    workers = []
+    for brand in brands:
+        try:
+            workers.append(start_brand(brand, script, log_dir))
+        except Exception as e:
+            print(f"❌ {brand}: could not start worker: {e}")
+
+    summary = []
+    for worker in workers:
+        exit_code = worker["proc"].wait()
+        worker["log_file"].close()
+        duration = time.time() - worker["started"]
+        counts, source = collect_counts(worker)
+        summary.append({
+            "brand": worker["brand"],
+            "exit_code": exit_code,
+            "duration_s": round(duration, 1),
+            "counts": dict(counts),
+            "source": source,
+        })
+        status = "✅" if exit_code == 0 else "❌"
+        print(f"{status} {worker['brand']}: exit {exit_code} after {duration:.0f}s")
+    return summary
+
+
+def print_summary(summary, wall_time):
+    print("===== All brands summary =====")
+    totals = Counter()
+    for row in summary:
+        totals.update(row["counts"])
+        counts = ", ".join(f"{k}={v}" for k, v in sorted(row["counts"].items())) or "no games"
+        print(f"{row['brand']:<11} exit={row['exit_code']:<3} {row['duration_s']:>8}s  {counts}  ({row['source']})")
+    print("TOTAL: " + (", ".join(f"{k}={v}" for k, v in sorted(totals.items())) or "no games"))
+    print(f"Wall time: {wall_time:.0f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep every brand tree concurrently")
+    parser.add_argument("--brands", nargs="+", default=BRANDS, choices=BRANDS)
+    parser.add_argument("--script", default="main_slot.py", help="entry point to run inside each brand folder")
+    parser.add_argument("--log-dir", default="logs")
+    parser.add_argument("--summary", help="also write the merged summary as JSON")
+    args = parser.parse_args()
+
+    started = time.time()
+    summary = run_brands(args.brands, args.script, args.log_dir)
+    print_summary(summary, time.time() - started)
+
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+    sys.exit(0 if all(row["exit_code"] == 0 for row in summary) else 1)